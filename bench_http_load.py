@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+HTTP load test: starts the server with MCP_TRANSPORT=http against the offline
+ESPN stand-in (espn_fixtures.py) and drives concurrent MCP clients through a
+weighted tool mix.
+
+Each concurrency level runs for a fixed duration after every tool in the mix has
+been called once. The report covers throughput, overall and per-tool latency
+percentiles, error rates, and the server's resident memory over time (read
+from /proc, so Linux only). Pass several client counts to find where throughput
+stops scaling.
+
+Usage:
+    python bench_http_load.py                                   # 8 clients for 20 s
+    python bench_http_load.py --clients 1,4,16,32 --duration 30 # concurrency sweep
+    python bench_http_load.py --mix get_standings=5,get_enhanced_boxscores=1
+    python bench_http_load.py --latency-ms 150 --json load.json # simulated ESPN latency
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import runpy
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from espn_fixtures import FIXTURE_LEAGUE_ID, OfflineESPN, offline_espn
+
+SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rffl_mcp_server.py")
+FIRST_YEAR, LIVE_YEAR, LIVE_WEEK = 2019, 2025, 8
+DEFAULT_MIX = (
+    "get_standings=4,get_scoreboard=2,get_matchups=2,get_enhanced_boxscores=1,search_players=2,"
+    "get_player_info=1,get_player_leaderboard=1,get_head_to_head=1,get_free_agents=1,ping=1"
+)
+
+
+def _fixture_seasons():
+    seasons = {yr: {} for yr in range(FIRST_YEAR, LIVE_YEAR)}
+    seasons[LIVE_YEAR] = {"current_week": LIVE_WEEK}
+    return seasons
+
+
+def _tool_args():
+    """Arguments per tool; tools not listed are called with their defaults (the live season)."""
+    player = next(iter(OfflineESPN({LIVE_YEAR: {}}).season(LIVE_YEAR).players.values()))["fullName"]
+    return {
+        "get_matchups": {"week": LIVE_WEEK - 1},
+        "get_enhanced_boxscores": {"week": LIVE_WEEK - 1},
+        "get_scoreboard": {"week": LIVE_WEEK - 1},
+        "get_power_rankings": {"week": LIVE_WEEK - 1},
+        "search_players": {"query": player[:6]},
+        "get_player_info": {"name": player},
+        "get_head_to_head": {"team_a": 1, "team_b": 2},
+        "get_free_agents": {"position": "RB"},
+        "query_league_data": {"sql": "SELECT year, COUNT(*) FROM matchups GROUP BY year"},
+    }
+
+
+def _parse_mix(spec):
+    mix = {}
+    for item in spec.split(","):
+        name, _, weight = item.partition("=")
+        if name.strip():
+            mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def _percentile(samples, p):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(p * len(ordered)) - 1)]
+
+
+def _rss_mb(pid):
+    """Resident set size of `pid` in MiB, or None where /proc is unavailable."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def serve(latency_ms):
+    """Run the server as __main__ with ESPN requests answered by the offline stand-in."""
+    with offline_espn(_fixture_seasons(), latency_ms=latency_ms):
+        runpy.run_path(SERVER, run_name="__main__")
+
+
+def start_server(port, latency_ms, cache_dir, log):
+    env = {
+        **os.environ,
+        "MCP_TRANSPORT": "http",
+        "HOST": "127.0.0.1",
+        "PORT": str(port),
+        "ESPN_LEAGUE_ID": str(FIXTURE_LEAGUE_ID),
+        "ESPN_YEAR": str(LIVE_YEAR),
+        "ESPN_HISTORY_START_YEAR": str(FIRST_YEAR),
+        "RFFL_CACHE_DIR": cache_dir,
+    }
+    return subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--serve", "--latency-ms", str(latency_ms)],
+        env=env, stdout=log, stderr=subprocess.STDOUT,
+    )
+
+
+async def _wait_ready(url, proc, timeout=60.0):
+    from fastmcp import Client
+
+    deadline = time.perf_counter() + timeout
+    while True:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with status {proc.returncode}")
+        try:
+            async with Client(url, timeout=5) as client:
+                await client.call_tool("ping")
+            return
+        except Exception:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.25)
+
+
+async def _warm(url, mix, args):
+    from fastmcp import Client
+
+    async with Client(url) as client:
+        for name in mix:
+            await client.call_tool(name, args.get(name, {}), raise_on_error=False)
+
+
+async def _client(url, mix, args, deadline, samples, seed):
+    from fastmcp import Client
+
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    async with Client(url) as client:
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                result = await client.call_tool(name, args.get(name, {}), raise_on_error=False)
+                ok = not result.is_error
+            except Exception:
+                ok = False
+            samples.append((name, start, (time.perf_counter() - start) * 1000, ok))
+
+
+async def _sample_rss(pid, samples, memory, interval, t0):
+    while True:
+        memory.append((round(time.perf_counter() - t0, 2), _rss_mb(pid), len(samples)))
+        await asyncio.sleep(interval)
+
+
+async def run_level(url, pid, mix, args, clients, duration, interval):
+    """Drive `clients` concurrent sessions for `duration` seconds and summarize."""
+    samples, memory = [], []
+    t0 = time.perf_counter()
+    sampler = asyncio.create_task(_sample_rss(pid, samples, memory, interval, t0))
+    try:
+        await asyncio.gather(*(
+            _client(url, mix, args, t0 + duration, samples, seed)
+            for seed in range(clients)
+        ))
+    finally:
+        sampler.cancel()
+    elapsed = time.perf_counter() - t0
+    memory.append((round(elapsed, 2), _rss_mb(pid), len(samples)))
+
+    def summary(rows):
+        latencies = [ms for _, _, ms, ok in rows if ok]
+        errors = sum(1 for row in rows if not row[3])
+        return {
+            "calls": len(rows),
+            "errors": errors,
+            "error_rate": round(errors / len(rows), 4) if rows else 0.0,
+            "p50_ms": round(_percentile(latencies, 0.50), 2),
+            "p95_ms": round(_percentile(latencies, 0.95), 2),
+            "p99_ms": round(_percentile(latencies, 0.99), 2),
+            "max_ms": round(max(latencies, default=0.0), 2),
+        }
+
+    return {
+        "clients": clients,
+        "duration_s": round(elapsed, 2),
+        "throughput_per_s": round(len(samples) / elapsed, 1),
+        **summary(samples),
+        "tools": {name: summary([s for s in samples if s[0] == name]) for name in mix},
+        "rss_mb": [
+            {"t": t, "rss_mb": None if rss is None else round(rss, 1), "calls": calls}
+            for t, rss, calls in memory
+        ],
+    }
+
+
+def _print_level(level):
+    print(
+        f"\n== {level['clients']} client(s): {level['calls']} calls in {level['duration_s']} s, "
+        f"{level['throughput_per_s']} calls/s, {level['errors']} errors ({level['error_rate']:.2%})"
+    )
+    print(f"   latency ms: p50 {level['p50_ms']}  p95 {level['p95_ms']}  p99 {level['p99_ms']}  max {level['max_ms']}")
+    print(f"   {'tool':<26} {'calls':>6} {'err%':>6} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8}")
+    for name, m in level["tools"].items():
+        print(
+            f"   {name:<26} {m['calls']:>6} {m['error_rate']:>6.1%} "
+            f"{m['p50_ms']:>8.1f} {m['p95_ms']:>8.1f} {m['p99_ms']:>8.1f}"
+        )
+    rss = [point["rss_mb"] for point in level["rss_mb"] if point["rss_mb"] is not None]
+    if rss:
+        trend = " ".join(f"{value:.0f}" for value in rss)
+        print(f"   server RSS MiB over time: {trend} (peak {max(rss):.1f})")
+    else:
+        print("   server RSS unavailable (no /proc)")
+
+
+async def main_async(args):
+    mix = _parse_mix(args.mix)
+    tool_args = _tool_args()
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/mcp"
+    levels = []
+    with tempfile.TemporaryDirectory() as cache_dir, open(os.path.join(cache_dir, "server.log"), "w") as log:
+        proc = start_server(port, args.latency_ms, cache_dir, log)
+        try:
+            start = time.perf_counter()
+            await _wait_ready(url, proc)
+            print(f"server ready on {url} in {time.perf_counter() - start:.1f} s "
+                  f"(pid {proc.pid}, RSS {_rss_mb(proc.pid) or 0:.1f} MiB)")
+            await _warm(url, mix, tool_args)
+            for clients in args.clients:
+                level = await run_level(url, proc.pid, mix, tool_args, clients, args.duration, args.sample_interval)
+                levels.append(level)
+                _print_level(level)
+        finally:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+    if len(levels) > 1:
+        print(f"\n{'clients':>8} {'calls/s':>9} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8} {'err%':>6} {'peak_rss':>9}")
+        for level in levels:
+            rss = [p["rss_mb"] for p in level["rss_mb"] if p["rss_mb"] is not None]
+            print(
+                f"{level['clients']:>8} {level['throughput_per_s']:>9} {level['p50_ms']:>8.1f} "
+                f"{level['p95_ms']:>8.1f} {level['p99_ms']:>8.1f} {level['error_rate']:>6.1%} "
+                f"{max(rss, default=0.0):>9.1f}"
+            )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"mix": mix, "latency_ms": args.latency_ms, "levels": levels}, f, indent=2)
+        print(f"results written to {args.json}")
+    return 1 if any(level["errors"] for level in levels) else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", default="8", help="concurrent clients; a comma list runs a sweep")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per concurrency level")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="weighted tool mix, e.g. get_standings=4,ping=1")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated ESPN latency per request")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="seconds between RSS samples")
+    parser.add_argument("--json", help="write the full results to this file")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.serve:
+        serve(args.latency_ms)
+        return 0
+    args.clients = [int(n) for n in args.clients.split(",")]
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
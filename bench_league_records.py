@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Wall-clock benchmark for the league records index behind get_league_records().
+
+Measures a cold build across 2011-2025 (every season fetched and indexed), a
+warm rebuild from the persistent cache, and the cost of folding in one newly
+final week of an in-progress season. Runs against offline fixtures.
+
+Usage:
+    python bench_league_records.py
+"""
+
+import os
+import tempfile
+import time
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+FIRST_YEAR, LAST_YEAR = 2011, 2025
+
+
+def _timed(**kwargs):
+    start = time.perf_counter()
+    result = rffl_mcp_server.get_league_records.fn(
+        start_year=FIRST_YEAR, end_year=LAST_YEAR, league_id=FIXTURE_LEAGUE_ID, **kwargs
+    )
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        rffl_mcp_server.CACHE_DIR = cache_dir
+        rffl_mcp_server.clear_cache.fn(include_persistent=True)
+        seasons = {yr: {} for yr in range(FIRST_YEAR, LAST_YEAR)}
+
+        with offline_espn({**seasons, LAST_YEAR: {"current_week": 2}}):
+            cold_ms, cold = _timed()
+        rffl_mcp_server.clear_cache.fn()
+        with offline_espn({**seasons, LAST_YEAR: {"current_week": 2}}):
+            warm_ms, _ = _timed()
+
+        update_ms = []
+        for week in range(3, 17):
+            rffl_mcp_server._SCOREBOARD_CACHE.pop((FIXTURE_LEAGUE_ID, LAST_YEAR), None)
+            with offline_espn({LAST_YEAR: {"current_week": week}}):
+                before = rffl_mcp_server._RECORDS_STATS["update_ms"]
+                rffl_mcp_server._records_season_index(FIXTURE_LEAGUE_ID, LAST_YEAR)
+                update_ms.append(rffl_mcp_server._RECORDS_STATS["update_ms"] - before)
+
+    print(f"seasons indexed:          {len(cold['seasons'])} ({FIRST_YEAR}-{LAST_YEAR})")
+    print(f"weeks applied (cold):     {cold['weeks_applied']}")
+    print(f"cold build:               {cold_ms:8.1f} ms")
+    print(f"warm (persistent cache):  {warm_ms:8.1f} ms")
+    print(f"per-week update (index):  {sum(update_ms) / len(update_ms):8.3f} ms avg, {max(update_ms):.3f} ms max")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Memory footprint of cached seasons: loads 1..N seasons through get_league()
+against offline fixtures and reports the bytes retained after each one.
+
+Retained bytes come from tracemalloc (after a full collection). They are set
+against the per-league estimate that enforces LEAGUE_CACHE_MAX_MB, broken down
+by object type, and against the source files that allocated the memory.
+
+Usage:
+    python bench_memory.py                   # 2011-2025, unbounded cache
+    python bench_memory.py --seasons 5       # 2021-2025
+    python bench_memory.py --budget-mb 1     # show evictions under a budget
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import tracemalloc
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+LAST_YEAR = 2025
+TOP = 8
+
+
+def _retained(baseline):
+    gc.collect()
+    return sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seasons", type=int, default=15, help="seasons to load, ending at 2025")
+    parser.add_argument("--budget-mb", type=float, default=0.0, help="LEAGUE_CACHE_MAX_MB to apply (0 = unbounded)")
+    args = parser.parse_args(argv)
+    years = list(range(LAST_YEAR - args.seasons + 1, LAST_YEAR + 1))
+
+    saved = rffl_mcp_server.CACHE_DIR, rffl_mcp_server.LEAGUE_CACHE_MAX_MB
+    with tempfile.TemporaryDirectory() as cache_dir, offline_espn({yr: {} for yr in years}):
+        rffl_mcp_server.CACHE_DIR = cache_dir
+        rffl_mcp_server.LEAGUE_CACHE_MAX_MB = args.budget_mb
+        try:
+            # Load one season first so one-time imports and lazily built tables are not counted
+            rffl_mcp_server.get_league.fn(league_id=FIXTURE_LEAGUE_ID, year=years[0])
+            rffl_mcp_server.clear_cache.fn(include_persistent=True)
+            evictions_before = rffl_mcp_server._CACHE_STATS["evictions"]
+
+            tracemalloc.start(1)
+            gc.collect()
+            baseline = tracemalloc.take_snapshot()
+            print(f"{'seasons':>7} {'year':>5} {'retained_kb':>12} {'delta_kb':>9} {'estimate_kb':>12} {'cached':>7}")
+            previous = 0
+            for count, yr in enumerate(years, 1):
+                rffl_mcp_server.get_league.fn(league_id=FIXTURE_LEAGUE_ID, year=yr)
+                retained = _retained(baseline)
+                estimate = rffl_mcp_server._LEAGUE_CACHE_BYTES.get((FIXTURE_LEAGUE_ID, yr), 0)
+                print(
+                    f"{count:>7} {yr:>5} {retained / 1024:>12.1f} {(retained - previous) / 1024:>9.1f} "
+                    f"{estimate / 1024:>12.1f} {len(rffl_mcp_server._LEAGUE_CACHE):>7}"
+                )
+                previous = retained
+
+            final = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+            by_type = {}
+            for league in rffl_mcp_server._LEAGUE_CACHE.values():
+                for name, size in rffl_mcp_server._object_sizes(league).items():
+                    by_type[name] = by_type.get(name, 0) + size
+            cached = len(rffl_mcp_server._LEAGUE_CACHE)
+            estimate_total = sum(rffl_mcp_server._LEAGUE_CACHE_BYTES.values())
+
+            print(f"\nper cached season: {previous / 1024 / max(1, cached):.1f} KiB retained (tracemalloc), "
+                  f"{estimate_total / 1024 / max(1, cached):.1f} KiB estimated")
+            if args.budget_mb:
+                print(f"budget {args.budget_mb} MiB: {cached} of {len(years)} seasons cached, "
+                      f"{rffl_mcp_server._CACHE_STATS['evictions'] - evictions_before} evicted")
+
+            print("\nby object type (cached leagues, estimate):")
+            for name, size in sorted(by_type.items(), key=lambda item: -item[1])[:TOP]:
+                print(f"  {name:<24} {size / 1024:>10.1f} KiB  {size / max(1, estimate_total):>6.1%}")
+
+            print("\nby allocating file (tracemalloc):")
+            for stat in final.compare_to(baseline, "filename")[:TOP]:
+                path = stat.traceback[0].filename.split("site-packages" + os.sep)[-1]
+                print(f"  {path:<40} {stat.size_diff / 1024:>10.1f} KiB")
+        finally:
+            rffl_mcp_server.CACHE_DIR, rffl_mcp_server.LEAGUE_CACHE_MAX_MB = saved
+            rffl_mcp_server.clear_cache.fn()
+
+
+if __name__ == "__main__":
+    main()
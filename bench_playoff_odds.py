@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Wall-clock benchmark for get_playoff_odds() against an offline fixture league.
+
+Usage:
+    python bench_playoff_odds.py                 # default sizes
+    python bench_playoff_odds.py 10000 1000000   # custom simulation counts
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import offline_espn
+
+SIZES = [1000, 10000, 100000, 1000000]
+WORKERS = [1, 4]
+
+
+def main(sizes):
+    print(f"{'simulations':>12} {'workers':>8} {'sim_ms':>8} {'total_ms':>9} {'sims/sec':>12}")
+    with offline_espn({2025: {"current_week": 8}}):
+        rffl_mcp_server.get_league.fn(year=2025)  # warm the league cache
+        for n in sizes:
+            for workers in WORKERS:
+                start = time.perf_counter()
+                result = rffl_mcp_server.get_playoff_odds.fn(
+                    simulations=n, seed=2025, workers=workers, year=2025
+                )
+                total_ms = (time.perf_counter() - start) * 1000
+                print(
+                    f"{n:>12,} {workers:>8} {result['simulation_ms']:>8} "
+                    f"{total_ms:>9.0f} {result['simulations_per_second']:>12,}"
+                )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIZES)
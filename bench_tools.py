@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Per-tool benchmark suite: every registered tool in cold, warm, and live-week
+scenarios across several seasons, against offline fixtures.
+
+Scenarios:
+    cold  - completed season, all caches (memory and persistent) cleared before each call
+    warm  - completed season, caches primed by one untimed call
+    live  - in-progress season; in-memory caches cleared before each call, so finished
+            weeks come from the persistent cache and the live week is fetched again
+
+Each row reports p50/p95 wall time, peak traced allocations (tracemalloc, measured
+on one extra call so it does not skew timings), and the JSON payload size. Results
+can be saved as a baseline; comparing against one exits non-zero on regressions.
+
+The suite also imports rffl_mcp_server in fresh interpreters under -X importtime.
+The module's own import cost must stay within IMPORT_BUDGET_MS. Own cost is
+measured with fastmcp already imported, because any server needs fastmcp and
+the stdlib modules it loads. Heavy dependencies loaded on first use
+(LAZY_MODULES) must not be imported at all.
+
+Usage:
+    python bench_tools.py                                   # all tools, default seasons
+    python bench_tools.py --tools get_matchups,get_league   # a subset
+    python bench_tools.py --latency-ms 150                  # approximate ESPN round trips
+    python bench_tools.py --save bench_baseline.json        # record a baseline
+    python bench_tools.py --baseline bench_baseline.json    # fail on regressions
+    python bench_tools.py --import-only                     # just the import-time budget
+"""
+
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+SEASONS = [2019, 2022, 2024]
+LIVE_YEAR, LIVE_WEEK = 2025, 8
+ITERATIONS = {"cold": 5, "warm": 20, "live": 5}
+TIME_TOLERANCE = 0.5     # relative p50 growth allowed before it counts as a regression (p95: twice this)
+TOLERANCE = 0.1          # relative growth allowed for allocations and payload size (near-deterministic)
+FLOOR_MS = 2.0           # ...plus this much absolute time, so sub-millisecond noise never fails
+FLOOR_ALLOC_KB = 64.0    # ...and this much allocation
+
+IMPORT_RUNS = 5
+IMPORT_BUDGET_MS = 150.0  # rffl_mcp_server's import time with fastmcp already loaded
+LAZY_MODULES = ("numpy", "espn_api", "cProfile", "pstats", "concurrent.futures.process")
+
+# Tools whose arguments do not depend on a season; benchmarked once per scenario
+LEAGUE_WIDE = {
+    "query_league_data": {"sql": "SELECT year, COUNT(*) FROM matchups GROUP BY year"},
+    "refresh_league_data": {},
+    "ping": {},
+    "get_cache_stats": {},
+    "clear_cache": {},
+    "list_profiles": {},
+    "get_slow_calls": {},
+}
+
+
+def _season_cases(year, player):
+    """Arguments for every season-scoped tool (year and league_id are added automatically)."""
+    week = 3
+    return {
+        "get_league": {},
+        "get_standings": {},
+        "get_teams": {},
+        "get_matchups": {"week": week, "include_lineups": True},
+        "get_enhanced_boxscores": {"week": week},
+        "get_scoreboard": {"week": week},
+        "get_power_rankings": {"week": week},
+        "get_power_rankings_series": {},
+        "get_player_info": {"name": player},
+        "search_players": {"query": player[:6]},
+        "get_player_leaderboard": {},
+        "get_optimal_lineup_analysis": {},
+        "get_projection_accuracy": {"start_year": year, "end_year": year},
+        "get_transactions": {},
+        "get_draft": {},
+        "get_draft_history": {"start_year": year, "end_year": year},
+        "get_free_agents": {"position": "RB"},
+        "get_head_to_head": {"team_a": 1, "team_b": 2, "start_year": year, "end_year": year},
+        "get_playoff_odds": {"simulations": 10000, "seed": year},
+        "get_clinch_scenarios": {},
+        "get_all_play_standings": {},
+        "get_standings_timeline": {},
+        "get_league_records": {"start_year": year, "end_year": year},
+    }
+
+
+def _percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(p * len(ordered)) - 1)]
+
+
+def _call(fn, kwargs):
+    result = fn(**kwargs)
+    return len(json.dumps(result, default=str).encode("utf-8"))
+
+
+def _measure(fn, kwargs, setup, iterations):
+    """Time `iterations` calls (each after `setup`), then trace allocations of one more.
+
+    Like timeit, the garbage collector is paused during timed calls so collection
+    pauses triggered by earlier work do not land in the samples.
+    """
+    samples = []
+    for _ in range(iterations):
+        setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            payload = _call(fn, kwargs)
+            samples.append((time.perf_counter() - start) * 1000)
+        finally:
+            gc.enable()
+    setup()
+    tracemalloc.start()
+    try:
+        _call(fn, kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "p50_ms": round(_percentile(samples, 0.50), 3),
+        "p95_ms": round(_percentile(samples, 0.95), 3),
+        "alloc_peak_kb": round(peak / 1024, 1),
+        "payload_bytes": payload,
+        "iterations": iterations,
+    }
+
+
+def _importtime(code, module):
+    """Cumulative -X importtime of `module` in a fresh interpreter running `code`, plus its stdout."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    for line in proc.stderr.splitlines():
+        fields = line.split("|")
+        if line.startswith("import time:") and len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000, proc.stdout.strip()
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def measure_import(runs=IMPORT_RUNS):
+    """Median import cost of rffl_mcp_server in fresh interpreters: cold, and with fastmcp preloaded."""
+    check = f"import sys, rffl_mcp_server; print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    totals, own, eager = [], [], set()
+    for _ in range(runs):
+        total_ms, loaded = _importtime(check, "rffl_mcp_server")
+        totals.append(total_ms)
+        eager.update(m for m in loaded.split(",") if m)
+        own.append(_importtime("import fastmcp, rffl_mcp_server", "rffl_mcp_server")[0])
+    total, own_ms = statistics.median(totals), statistics.median(own)
+    return {
+        "total_ms": round(total, 1),
+        "fastmcp_ms": round(total - own_ms, 1),
+        "own_ms": round(own_ms, 1),
+        "eager_modules": sorted(eager),
+    }
+
+
+def _clear_all():
+    rffl_mcp_server.clear_cache.fn(include_persistent=True)
+
+
+def _clear_memory():
+    rffl_mcp_server.clear_cache.fn()
+
+
+def _finish_refresh():
+    """Wait for a refresh_league_data job so it does not overlap the next measurement."""
+    thread = rffl_mcp_server._WAREHOUSE_REFRESH.get("thread")
+    if thread is not None:
+        thread.join()
+
+
+def _with_warehouse(setup):
+    """Run `setup`, then load every benchmarked season into the warehouse (untimed)."""
+    def load():
+        setup()
+        rffl_mcp_server.refresh_league_data.fn(
+            start_year=rffl_mcp_server.HISTORY_START_YEAR, end_year=LIVE_YEAR, league_id=FIXTURE_LEAGUE_ID
+        )
+        _finish_refresh()
+    return load
+
+
+def _prime(fn, kwargs):
+    """One untimed call to fill the caches; a failure resurfaces when the row is measured."""
+    try:
+        fn(**kwargs)
+    except Exception:
+        pass
+
+
+def run(tools, seasons, iterations, latency_ms):
+    """Benchmark `tools` and return {"tool|scenario|season": metrics} plus failures."""
+    registered = asyncio.run(rffl_mcp_server.mcp.get_tools())
+    results, errors = {}, {}
+    fixture_seasons = {yr: {} for yr in range(min(seasons), LIVE_YEAR)}
+    fixture_seasons[LIVE_YEAR] = {"current_week": LIVE_WEEK}
+    saved = (
+        rffl_mcp_server.CACHE_DIR, rffl_mcp_server.HISTORY_START_YEAR, rffl_mcp_server.DEFAULT_YEAR,
+        rffl_mcp_server.SLOW_CALL_THRESHOLD_MS, rffl_mcp_server.SLOW_CALL_THRESHOLDS,
+        rffl_mcp_server.PROFILE_SAMPLE_RATE,
+    )
+    with tempfile.TemporaryDirectory() as cache_dir, offline_espn(fixture_seasons, latency_ms=latency_ms) as espn:
+        rffl_mcp_server.CACHE_DIR = cache_dir
+        rffl_mcp_server.HISTORY_START_YEAR, rffl_mcp_server.DEFAULT_YEAR = min(seasons), LIVE_YEAR
+        rffl_mcp_server.SLOW_CALL_THRESHOLD_MS, rffl_mcp_server.SLOW_CALL_THRESHOLDS = 0, {}
+        rffl_mcp_server.PROFILE_SAMPLE_RATE = 0.0
+        try:
+            plan = []
+            for scenario in ("cold", "warm", "live"):
+                for year in (seasons if scenario != "live" else [LIVE_YEAR]):
+                    player = next(iter(espn.season(year).players.values()))["fullName"]
+                    for name, kwargs in _season_cases(year, player).items():
+                        plan.append((name, scenario, str(year), year, kwargs))
+                for name, kwargs in LEAGUE_WIDE.items():
+                    plan.append((name, scenario, "all", None, kwargs))
+
+            for name, scenario, label, year, kwargs in plan:
+                if name not in tools:
+                    continue
+                fn = registered[name].fn
+                params = inspect.signature(fn).parameters
+                kwargs = dict(kwargs)
+                if year is not None and "year" in params:
+                    kwargs.setdefault("year", year)
+                if "league_id" in params:
+                    kwargs["league_id"] = FIXTURE_LEAGUE_ID
+                # Queries never fetch, so the warehouse is loaded (untimed) after every reset
+                reset = _with_warehouse if name == "query_league_data" else (lambda step: step)
+                if scenario == "cold":
+                    setup = reset(_clear_all)
+                else:
+                    reset(_clear_all)()
+                    _prime(fn, kwargs)
+                    setup = reset(_clear_memory) if scenario == "live" else (lambda: None)
+                key = f"{name}|{scenario}|{label}"
+                try:
+                    results[key] = _measure(fn, kwargs, setup, max(1, iterations or ITERATIONS[scenario]))
+                except Exception as e:
+                    errors[key] = f"{type(e).__name__}: {e}"
+                finally:
+                    _finish_refresh()
+        finally:
+            (rffl_mcp_server.CACHE_DIR, rffl_mcp_server.HISTORY_START_YEAR, rffl_mcp_server.DEFAULT_YEAR,
+             rffl_mcp_server.SLOW_CALL_THRESHOLD_MS, rffl_mcp_server.SLOW_CALL_THRESHOLDS,
+             rffl_mcp_server.PROFILE_SAMPLE_RATE) = saved
+            rffl_mcp_server.clear_cache.fn()
+    return results, errors
+
+
+def compare(results, baseline, time_tolerance=TIME_TOLERANCE, tolerance=TOLERANCE):
+    """Regressions of `results` against a saved baseline, one message per metric."""
+    limits = (
+        ("p50_ms", time_tolerance, FLOOR_MS),
+        ("p95_ms", 2 * time_tolerance, FLOOR_MS),
+        ("alloc_peak_kb", tolerance, FLOOR_ALLOC_KB),
+        ("payload_bytes", tolerance, 0),
+    )
+    regressions = []
+    for key, current in sorted(results.items()):
+        before = baseline.get(key)
+        if before is None:
+            continue
+        for metric, allowed, floor in limits:
+            limit = before[metric] * (1 + allowed) + floor
+            if current[metric] > limit:
+                regressions.append(f"{key} {metric}: {before[metric]} -> {current[metric]} (limit {limit:.1f})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tools", help="comma-separated tools (default: every registered tool)")
+    parser.add_argument("--seasons", default=",".join(map(str, SEASONS)), help="completed seasons to cover")
+    parser.add_argument("--iterations", type=int, help="timed calls per row (default: per scenario)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated ESPN latency per request")
+    parser.add_argument("--import-only", action="store_true", help="only check the import-time budget")
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS,
+                        help="allowed import time of rffl_mcp_server itself, excluding fastmcp")
+    parser.add_argument("--save", help="write results as a JSON baseline")
+    parser.add_argument("--baseline", help="compare against a saved baseline; exit 1 on regressions")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE,
+                        help="allowed relative p50 growth (p95 gets twice this)")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="allowed relative growth of allocations and payload size")
+    args = parser.parse_args(argv)
+    failed = False
+
+    imports = measure_import()
+    print(
+        f"import rffl_mcp_server: {imports['total_ms']:.1f} ms total, {imports['fastmcp_ms']:.1f} ms fastmcp, "
+        f"{imports['own_ms']:.1f} ms own (budget {args.import_budget_ms:.0f} ms, median of {IMPORT_RUNS})"
+    )
+    if imports["own_ms"] > args.import_budget_ms:
+        print(f"OVER BUDGET import: {imports['own_ms']:.1f} ms > {args.import_budget_ms:.0f} ms")
+        failed = True
+    if imports["eager_modules"]:
+        print(f"EAGER IMPORTS (should load on first use): {', '.join(imports['eager_modules'])}")
+        failed = True
+
+    results, errors, uncovered = {}, {}, []
+    if not args.import_only:
+        registered = set(asyncio.run(rffl_mcp_server.mcp.get_tools()))
+        covered = set(LEAGUE_WIDE) | set(_season_cases(0, ""))
+        uncovered = sorted(registered - covered)
+        tools = set(args.tools.split(",")) if args.tools else registered
+        seasons = sorted(int(y) for y in args.seasons.split(","))
+
+        results, errors = run(tools, seasons, args.iterations, args.latency_ms)
+
+        print(f"\n{'tool':<30} {'scenario':<6} {'season':<6} {'p50_ms':>9} {'p95_ms':>9} {'alloc_kb':>9} {'payload':>8}")
+        for key, m in results.items():
+            name, scenario, season = key.split("|")
+            print(
+                f"{name:<30} {scenario:<6} {season:<6} {m['p50_ms']:>9.2f} {m['p95_ms']:>9.2f} "
+                f"{m['alloc_peak_kb']:>9.1f} {m['payload_bytes']:>8}"
+            )
+
+    for key, message in errors.items():
+        print(f"ERROR {key}: {message}")
+        failed = True
+    if uncovered:
+        print(f"NOT BENCHMARKED (add a case): {', '.join(uncovered)}")
+        failed = True
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(
+                {"latency_ms": args.latency_ms, "import": imports, "results": results},
+                f, indent=2, sort_keys=True,
+            )
+        print(f"baseline written to {args.save}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("latency_ms", 0.0) != args.latency_ms:
+            print(f"warning: baseline was recorded with --latency-ms {baseline.get('latency_ms')}")
+        regressions = compare(results, baseline["results"], args.time_tolerance, args.tolerance)
+        before = baseline.get("import", {}).get("own_ms")
+        if before is not None:
+            limit = before * (1 + args.time_tolerance) + FLOOR_MS
+            if imports["own_ms"] > limit:
+                regressions.append(f"import own_ms: {before} -> {imports['own_ms']} (limit {limit:.1f})")
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        print(
+            f"{len(regressions)} regression(s) against {args.baseline} "
+            f"(time tolerance {args.time_tolerance:.0%}, size tolerance {args.tolerance:.0%})"
+        )
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
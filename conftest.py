@@ -0,0 +1,24 @@
+"""Shared pytest fixtures for the offline test modules."""
+
+import os
+import tempfile
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+@pytest.fixture
+def cache_dir():
+    """A temporary RFFL_CACHE_DIR with every in-memory and persistent cache cleared."""
+    import rffl_mcp_server
+
+    saved = rffl_mcp_server.CACHE_DIR
+    with tempfile.TemporaryDirectory() as path:
+        rffl_mcp_server.CACHE_DIR = path
+        rffl_mcp_server.clear_cache.fn(include_persistent=True)
+        try:
+            yield path
+        finally:
+            rffl_mcp_server.clear_cache.fn(include_persistent=True)
+            rffl_mcp_server.CACHE_DIR = saved
@@ -0,0 +1,577 @@
+#!/usr/bin/env python3
+"""
+Synthetic ESPN Fantasy API fixtures for offline testing.
+
+Builds deterministic league payloads in the same JSON shape ESPN returns, and
+patches espn_api's HTTP layer so real `League` objects can be constructed
+without network access or credentials.
+
+Usage:
+    from espn_fixtures import offline_espn
+
+    with offline_espn(seasons={2024: {}, 2025: {"current_week": 6}}):
+        league = League(league_id=323196, year=2025)
+"""
+
+import contextlib
+import datetime
+import json
+import random
+import re
+import time
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+from espn_api.requests import espn_requests
+
+FIXTURE_LEAGUE_ID = 323196
+
+# Lineup slot id -> starters per team (QB, 2 RB, 2 WR, TE, FLEX, D/ST, K, 6 BE)
+LINEUP_SLOT_COUNTS = {0: 1, 2: 2, 4: 2, 6: 1, 16: 1, 17: 1, 20: 6, 23: 1}
+
+# Roster template: (defaultPositionId, eligibleSlots, mean points)
+ROSTER_TEMPLATE = [
+    (1, [0, 7, 20, 21], 19.0),
+    (1, [0, 7, 20, 21], 15.0),
+    (2, [2, 3, 23, 7, 20, 21], 14.0),
+    (2, [2, 3, 23, 7, 20, 21], 11.0),
+    (2, [2, 3, 23, 7, 20, 21], 8.0),
+    (3, [4, 3, 5, 23, 7, 20, 21], 13.0),
+    (3, [4, 3, 5, 23, 7, 20, 21], 11.0),
+    (3, [4, 3, 5, 23, 7, 20, 21], 8.0),
+    (4, [6, 5, 23, 7, 20, 21], 8.0),
+    (4, [6, 5, 23, 7, 20, 21], 5.0),
+    (16, [16, 20, 21], 7.0),
+    (5, [17, 20, 21], 8.0),
+    (2, [2, 3, 23, 7, 20, 21], 6.0),
+    (3, [4, 3, 5, 23, 7, 20, 21], 6.0),
+    (1, [0, 7, 20, 21], 10.0),
+]
+
+FIRST_NAMES = [
+    "Patrick", "Josh", "Jalen", "Lamar", "Christian", "Derrick", "Saquon", "Bijan",
+    "Justin", "Tyreek", "Ja'Marr", "CeeDee", "Travis", "Mark", "George", "Davante",
+    "Amon-Ra", "Breece", "Kenneth", "Stefon", "Cooper", "Garrett", "Jahmyr", "DeVonta",
+]
+LAST_NAMES = [
+    "Mahomes", "Allen", "Hurts", "Jackson", "McCaffrey", "Henry", "Barkley", "Robinson",
+    "Jefferson", "Hill", "Chase", "Lamb", "Kelce", "Andrews", "Kittle", "Adams",
+    "St. Brown", "Hall", "Walker", "Diggs", "Kupp", "Wilson", "Gibbs", "Smith",
+]
+
+
+class FixtureResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload: Any, status_code: int = 200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def json(self) -> Any:
+        return self._payload
+
+
+class SyntheticSeason:
+    """Deterministic synthetic season for one (league_id, year)."""
+
+    def __init__(
+        self,
+        year: int,
+        league_id: int = FIXTURE_LEAGUE_ID,
+        team_count: int = 10,
+        reg_season_count: int = 13,
+        playoff_team_count: int = 4,
+        current_week: Optional[int] = None,
+        seed: Optional[int] = None,
+        drafted: bool = True,
+    ):
+        self.year = year
+        self.league_id = league_id
+        self.drafted = drafted
+        self.team_count = team_count
+        self.reg_season_count = reg_season_count
+        self.playoff_team_count = playoff_team_count
+        self.playoff_weeks = 2 if playoff_team_count > 2 else 1
+        self.final_week = reg_season_count + self.playoff_weeks
+        # current_week=None means the season is complete
+        self.current_week = current_week if current_week is not None else self.final_week + 1
+        self.rng = random.Random(seed if seed is not None else year * 7919 + league_id)
+        self.team_ids = list(range(1, team_count + 1))
+        self.players = self._build_players()
+        self.rosters = self._build_rosters()
+        self.schedule = self._build_schedule()
+        self.activity = self._build_activity()
+
+    # --- Builders -------------------------------------------------------------
+
+    def _build_players(self) -> Dict[int, Dict[str, Any]]:
+        players: Dict[int, Dict[str, Any]] = {}
+        pid = 3000000 + (self.year % 100) * 10000
+        for team_id in self.team_ids:
+            for default_pos, slots, mean in ROSTER_TEMPLATE:
+                pid += 1
+                first = FIRST_NAMES[self.rng.randrange(len(FIRST_NAMES))]
+                last = LAST_NAMES[self.rng.randrange(len(LAST_NAMES))]
+                name = f"{first} {last}" if default_pos != 16 else f"{LAST_NAMES[pid % len(LAST_NAMES)]} D/ST"
+                players[pid] = {
+                    "id": pid,
+                    "fullName": f"{name} {pid % 1000}",
+                    "defaultPositionId": default_pos,
+                    "eligibleSlots": slots,
+                    "proTeamId": self.rng.randint(1, 30),
+                    "mean": mean,
+                    "onTeamId": team_id,
+                }
+        # A small pool of unrostered free agents
+        for _ in range(40):
+            pid += 1
+            default_pos, slots, mean = ROSTER_TEMPLATE[self.rng.randrange(len(ROSTER_TEMPLATE))]
+            first = FIRST_NAMES[self.rng.randrange(len(FIRST_NAMES))]
+            last = LAST_NAMES[self.rng.randrange(len(LAST_NAMES))]
+            players[pid] = {
+                "id": pid,
+                "fullName": f"{first} {last} {pid % 1000}",
+                "defaultPositionId": default_pos,
+                "eligibleSlots": slots,
+                "proTeamId": self.rng.randint(1, 30),
+                "mean": mean * 0.6,
+                "onTeamId": 0,
+            }
+        for p in players.values():
+            p["weekly"] = {
+                w: (
+                    round(max(0.0, self.rng.gauss(p["mean"], p["mean"] * 0.45)), 2),
+                    round(max(0.0, p["mean"] + self.rng.gauss(0, 1.5)), 2),
+                )
+                for w in range(1, self.final_week + 1)
+            }
+        return players
+
+    def _build_rosters(self) -> Dict[int, List[int]]:
+        rosters: Dict[int, List[int]] = {t: [] for t in self.team_ids}
+        for pid, p in self.players.items():
+            if p["onTeamId"]:
+                rosters[p["onTeamId"]].append(pid)
+        return rosters
+
+    def _lineup(self, team_id: int, week: int) -> List[Dict[str, Any]]:
+        """Start the first players eligible for each slot; everyone else is benched."""
+        remaining = list(self.rosters[team_id])
+        entries = []
+        for slot, count in LINEUP_SLOT_COUNTS.items():
+            if slot == 20:
+                continue
+            for _ in range(count):
+                for pid in remaining:
+                    if slot in self.players[pid]["eligibleSlots"]:
+                        entries.append((pid, slot))
+                        remaining.remove(pid)
+                        break
+        entries.extend((pid, 20) for pid in remaining)
+        return [{"playerId": pid, "lineupSlotId": slot} for pid, slot in entries]
+
+    def team_score(self, team_id: int, week: int) -> float:
+        return round(
+            sum(
+                self.players[e["playerId"]]["weekly"][week][0]
+                for e in self._lineup(team_id, week)
+                if e["lineupSlotId"] not in (20, 21)
+            ),
+            2,
+        )
+
+    def _week_is_final(self, week: int) -> bool:
+        return week < self.current_week
+
+    def _matchup(self, mid: int, week: int, home: int, away: Optional[int], tier: str) -> Dict[str, Any]:
+        final = self._week_is_final(week)
+        started = week <= self.current_week
+        h = self.team_score(home, week) if started else 0.0
+        entry: Dict[str, Any] = {
+            "id": mid,
+            "matchupPeriodId": week,
+            "playoffTierType": tier,
+            "home": {"teamId": home, "totalPoints": h if final else round(h * 0.5, 2) if started else 0.0},
+        }
+        if away is None:
+            entry["winner"] = "HOME" if final else "UNDECIDED"
+            return entry
+        a = self.team_score(away, week) if started else 0.0
+        entry["away"] = {"teamId": away, "totalPoints": a if final else round(a * 0.5, 2) if started else 0.0}
+        if not final:
+            entry["winner"] = "UNDECIDED"
+        elif h > a:
+            entry["winner"] = "HOME"
+        elif a > h:
+            entry["winner"] = "AWAY"
+        else:
+            entry["winner"] = "TIE"
+        return entry
+
+    def _build_schedule(self) -> List[Dict[str, Any]]:
+        ids = list(self.team_ids)
+        if len(ids) % 2:
+            ids.append(None)
+        n = len(ids)
+        schedule: List[Dict[str, Any]] = []
+        mid = 0
+        rotation = ids[:]
+        for week in range(1, self.reg_season_count + 1):
+            for i in range(n // 2):
+                home, away = rotation[i], rotation[n - 1 - i]
+                if home is None:
+                    home, away = away, None
+                if week % 2 == 0 and away is not None:
+                    home, away = away, home
+                mid += 1
+                schedule.append(self._matchup(mid, week, home, away, "NONE"))
+            rotation = [rotation[0]] + [rotation[-1]] + rotation[1:-1]
+
+        # Simple playoff bracket seeded from regular season wins then points
+        record = self._record_through(schedule, self.reg_season_count)
+        seeds = sorted(self.team_ids, key=lambda t: (-record[t][0], -record[t][1]))
+        bracket = seeds[: self.playoff_team_count]
+        for week in range(self.reg_season_count + 1, self.final_week + 1):
+            if len(bracket) < 2:
+                break
+            winners = []
+            for i in range(len(bracket) // 2):
+                home, away = bracket[i], bracket[len(bracket) - 1 - i]
+                mid += 1
+                m = self._matchup(mid, week, home, away, "WINNERS_BRACKET")
+                schedule.append(m)
+                winners.append(away if m["winner"] == "AWAY" else home)
+            bracket = winners
+        return schedule
+
+    def _build_activity(self) -> List[Dict[str, Any]]:
+        """Add/drop, waiver and trade topics for every started week, oldest first."""
+        week_ms = 7 * 24 * 3600 * 1000
+        kickoff_ms = int(datetime.datetime(self.year, 9, 5, tzinfo=datetime.timezone.utc).timestamp() * 1000)
+        free_agents = [pid for pid, p in self.players.items() if p["onTeamId"] == 0]
+        topics = []
+        for week in range(1, min(self.current_week, self.final_week) + 1):
+            base = kickoff_ms + (week - 1) * week_ms
+            team = self.team_ids[week % len(self.team_ids)]
+            other = self.team_ids[(week + 3) % len(self.team_ids)]
+            topics.append({"id": f"{self.year}-{week}-fa", "date": base + 3600 * 1000, "messages": [
+                {"messageTypeId": 178, "to": team, "targetId": free_agents[week % len(free_agents)]},
+                {"messageTypeId": 179, "to": team, "targetId": self.rosters[team][-1]},
+            ]})
+            topics.append({"id": f"{self.year}-{week}-waiver", "date": base + 2 * 3600 * 1000, "messages": [
+                {"messageTypeId": 180, "to": other, "from": week * 3,
+                 "targetId": free_agents[(week * 7) % len(free_agents)]},
+            ]})
+            if week % 4 == 0:
+                topics.append({"id": f"{self.year}-{week}-trade", "date": base + 3 * 3600 * 1000, "messages": [
+                    {"messageTypeId": 244, "from": team, "to": other, "targetId": self.rosters[team][2]},
+                    {"messageTypeId": 244, "from": other, "to": team, "targetId": self.rosters[other][2]},
+                ]})
+        return topics
+
+    def _record_through(self, schedule: List[Dict[str, Any]], week: int) -> Dict[int, List[float]]:
+        record = {t: [0, 0.0] for t in self.team_ids}
+        for m in schedule:
+            if m["matchupPeriodId"] > week or "away" not in m:
+                continue
+            h, a = m["home"], m["away"]
+            if m["winner"] == "HOME":
+                record[h["teamId"]][0] += 1
+            elif m["winner"] == "AWAY":
+                record[a["teamId"]][0] += 1
+            record[h["teamId"]][1] += h["totalPoints"]
+            record[a["teamId"]][1] += a["totalPoints"]
+        return record
+
+    # --- Payloads -------------------------------------------------------------
+
+    def _player_json(self, pid: int, weeks: Optional[List[int]] = None) -> Dict[str, Any]:
+        p = self.players[pid]
+        stats = []
+        for w in weeks if weeks is not None else []:
+            actual, projected = p["weekly"][w]
+            stats.append({"seasonId": self.year, "scoringPeriodId": w, "statSourceId": 1,
+                          "statSplitTypeId": 1, "appliedTotal": projected, "stats": {}})
+            if self._week_is_final(w) or w == self.current_week:
+                stats.append({"seasonId": self.year, "scoringPeriodId": w, "statSourceId": 0,
+                              "statSplitTypeId": 1, "appliedTotal": actual, "stats": {"3": 1.0},
+                              "proTeamId": p["proTeamId"]})
+        return {
+            "id": pid,
+            "fullName": p["fullName"],
+            "defaultPositionId": p["defaultPositionId"],
+            "eligibleSlots": p["eligibleSlots"],
+            "proTeamId": p["proTeamId"],
+            "injuryStatus": "ACTIVE",
+            "stats": stats,
+        }
+
+    def _roster_entry(self, pid: int, slot: int, weeks: Optional[List[int]] = None) -> Dict[str, Any]:
+        return {
+            "lineupSlotId": slot,
+            "playerId": pid,
+            "acquisitionType": "DRAFT",
+            "playerPoolEntry": {
+                "id": pid,
+                "onTeamId": self.players[pid]["onTeamId"],
+                "player": self._player_json(pid, weeks),
+            },
+        }
+
+    def _settings_json(self) -> Dict[str, Any]:
+        slot_counts = {str(i): LINEUP_SLOT_COUNTS.get(i, 0) for i in range(25)}
+        periods = {str(w): [w] for w in range(1, self.final_week + 1)}
+        return {
+            "name": "RFFL Fixture League",
+            "size": self.team_count,
+            "scheduleSettings": {
+                "matchupPeriodCount": self.reg_season_count,
+                "matchupPeriods": periods,
+                "playoffTeamCount": self.playoff_team_count,
+                "playoffMatchupPeriodLength": 1,
+                "playoffSeedingRule": "TOTAL_POINTS_SCORED",
+                "divisions": [{"id": 0, "name": "East"}, {"id": 1, "name": "West"}],
+            },
+            "tradeSettings": {"vetoVotesRequired": 4},
+            "draftSettings": {"keeperCount": 0},
+            "scoringSettings": {
+                "matchupTieRule": "NONE",
+                "playoffMatchupTieRule": "NONE",
+                "scoringType": "H2H_POINTS",
+                "scoringItems": [],
+            },
+            "acquisitionSettings": {"isUsingAcquisitionBudget": False},
+            "rosterSettings": {"lineupSlotCounts": slot_counts},
+        }
+
+    def _teams_json(self) -> List[Dict[str, Any]]:
+        last_final = min(self.current_week - 1, self.reg_season_count)
+        record = {t: {"W": 0, "L": 0, "T": 0, "PF": 0.0, "PA": 0.0} for t in self.team_ids}
+        for m in self.schedule:
+            if m["matchupPeriodId"] > last_final or "away" not in m:
+                continue
+            h, a = m["home"]["teamId"], m["away"]["teamId"]
+            hs, as_ = m["home"]["totalPoints"], m["away"]["totalPoints"]
+            record[h]["PF"] += hs
+            record[h]["PA"] += as_
+            record[a]["PF"] += as_
+            record[a]["PA"] += hs
+            if m["winner"] == "HOME":
+                record[h]["W"] += 1
+                record[a]["L"] += 1
+            elif m["winner"] == "AWAY":
+                record[a]["W"] += 1
+                record[h]["L"] += 1
+            else:
+                record[h]["T"] += 1
+                record[a]["T"] += 1
+        seeds = sorted(self.team_ids, key=lambda t: (-record[t]["W"], -record[t]["PF"]))
+        complete = self.current_week > self.final_week
+        teams = []
+        for t in self.team_ids:
+            r = record[t]
+            teams.append({
+                "id": t,
+                "abbrev": f"T{t:02d}",
+                "name": f"Fixture Team {t}",
+                "divisionId": (t - 1) % 2,
+                "owners": [f"{{OWNER-{t}}}"],
+                "playoffSeed": seeds.index(t) + 1,
+                "rankCalculatedFinal": seeds.index(t) + 1 if complete else 0,
+                "record": {"overall": {
+                    "wins": r["W"], "losses": r["L"], "ties": r["T"],
+                    "pointsFor": round(r["PF"], 2), "pointsAgainst": round(r["PA"], 2),
+                    "streakLength": 1, "streakType": "WIN",
+                }},
+                "roster": {"entries": [
+                    self._roster_entry(e["playerId"], e["lineupSlotId"])
+                    for e in self._lineup(t, min(self.current_week, self.final_week))
+                ]},
+            })
+        return teams
+
+    def league_payload(self) -> Dict[str, Any]:
+        scoring_period = min(self.current_week, self.final_week + 1)
+        matchup_period = min(self.current_week, self.final_week)
+        return {
+            "id": self.league_id,
+            "seasonId": self.year,
+            "scoringPeriodId": scoring_period,
+            "status": {
+                "currentMatchupPeriod": matchup_period,
+                "firstScoringPeriod": 1,
+                "finalScoringPeriod": self.final_week,
+                "latestScoringPeriod": scoring_period,
+                "previousSeasons": list(range(self.year - 3, self.year)),
+            },
+            "settings": self._settings_json(),
+            "teams": self._teams_json(),
+            "schedule": self.schedule,
+            "members": [{"id": f"{{OWNER-{t}}}", "displayName": f"owner{t}"} for t in self.team_ids],
+        }
+
+    def scoreboard_payload(self) -> Dict[str, Any]:
+        teams = [{"id": t["id"], "abbrev": t["abbrev"], "name": t["name"]} for t in self._teams_json()]
+        return {"seasonId": self.year, "schedule": self.schedule, "teams": teams,
+                "status": self.league_payload()["status"]}
+
+    def box_score_payload(self, week: int, matchup_period: int) -> Dict[str, Any]:
+        """Matchups for one period with each side's lineup and stats for `week`."""
+        schedule = []
+        for m in self.schedule:
+            if m["matchupPeriodId"] != matchup_period:
+                continue
+            entry = json.loads(json.dumps(m))
+            for side in ("home", "away"):
+                if side in entry:
+                    team_id = entry[side]["teamId"]
+                    entry[side]["rosterForCurrentScoringPeriod"] = {"entries": [
+                        self._roster_entry(e["playerId"], e["lineupSlotId"], [week])
+                        for e in self._lineup(team_id, week)
+                    ]}
+            schedule.append(entry)
+        return {"seasonId": self.year, "scoringPeriodId": week, "schedule": schedule}
+
+    def communication_payload(self, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Activity topics newest first, honoring the limit/offset/type filters."""
+        topic_filter = filters.get("topics", {})
+        types = set(topic_filter.get("filterIncludeMessageTypeIds", {}).get("value", []))
+        offset, limit = topic_filter.get("offset", 0), topic_filter.get("limit", 25)
+        topics = [t for t in reversed(self.activity)
+                  if not types or any(m["messageTypeId"] in types for m in t["messages"])]
+        return {"topics": topics[offset:offset + limit]}
+
+    def draft_payload(self) -> Dict[str, Any]:
+        if not self.drafted:
+            return {"draftDetail": {"drafted": False, "picks": []}}
+        picks = []
+        overall = 0
+        for rnd in range(len(ROSTER_TEMPLATE)):
+            order = self.team_ids if rnd % 2 == 0 else list(reversed(self.team_ids))
+            for pick_no, t in enumerate(order, 1):
+                overall += 1
+                picks.append({
+                    "id": overall, "overallPickNumber": overall, "roundId": rnd + 1,
+                    "roundPickNumber": pick_no, "teamId": t, "playerId": self.rosters[t][rnd],
+                    "bidAmount": 0, "keeper": False, "nominatingTeamId": 0,
+                })
+        return {"draftDetail": {"drafted": True, "picks": picks}}
+
+    def pro_players_payload(self) -> List[Dict[str, Any]]:
+        return [{"id": pid, "fullName": p["fullName"]} for pid, p in self.players.items()]
+
+    def free_agent_payload(self, week: int, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Unrostered players by ownership, honoring the slot filter and limit."""
+        player_filter = filters.get("players", {})
+        slots = set(player_filter.get("filterSlotIds", {}).get("value", []))
+        limit = player_filter.get("limit", 50)
+        weeks = list(range(1, min(week, self.final_week) + 1))
+        pool = [pid for pid, p in self.players.items()
+                if p["onTeamId"] == 0 and (not slots or slots & set(p["eligibleSlots"]))]
+        pool.sort(key=lambda pid: -self.players[pid]["mean"])
+        players = []
+        for pid in pool[:limit]:
+            player = self._player_json(pid, weeks)
+            player["ownership"] = {"percentOwned": round(self.players[pid]["mean"] * 3.1, 2),
+                                   "percentStarted": round(self.players[pid]["mean"] * 1.7, 2)}
+            players.append({"id": pid, "onTeamId": 0, "status": "FREEAGENT", "player": player})
+        return {"players": players}
+
+    def player_card_payload(self, player_ids: List[int]) -> Dict[str, Any]:
+        weeks = [w for w in range(1, self.final_week + 1) if self._week_is_final(w)]
+        return {"players": [
+            {"id": pid, "onTeamId": self.players[pid]["onTeamId"], "player": self._player_json(pid, weeks)}
+            for pid in player_ids if pid in self.players
+        ]}
+
+    def pro_schedule_payload(self) -> Dict[str, Any]:
+        return {"settings": {"proTeams": []}}
+
+
+class OfflineESPN:
+    """Routes espn_api HTTP requests to SyntheticSeason payloads."""
+
+    _LEAGUE_RE = re.compile(r"/seasons/(\d+)/segments/0/leagues/(\d+)(/.*)?$")
+    _HISTORY_RE = re.compile(r"/leagueHistory/(\d+)\?seasonId=(\d+)(/.*)?$")
+    _SEASON_RE = re.compile(r"/seasons/(\d+)(/players)?$")
+
+    def __init__(self, seasons: Dict[int, Dict[str, Any]], league_id: int = FIXTURE_LEAGUE_ID,
+                 latency_ms: float = 0.0):
+        self.league_id = league_id
+        self.latency_ms = latency_ms
+        self.seasons = {yr: SyntheticSeason(yr, league_id=league_id, **kw) for yr, kw in seasons.items()}
+        self.calls: List[str] = []
+
+    def season(self, year: int) -> SyntheticSeason:
+        return self.seasons[year]
+
+    def route(self, url: str, params: Optional[Dict[str, Any]] = None,
+              headers: Optional[Dict[str, Any]] = None) -> FixtureResponse:
+        params = params or {}
+        views = params.get("view", [])
+        views = [views] if isinstance(views, str) else list(views)
+        filters = json.loads((headers or {}).get("x-fantasy-filter", "{}"))
+        self.calls.append(f"{url} {','.join(views)}")
+
+        m = self._LEAGUE_RE.search(url)
+        h = self._HISTORY_RE.search(url)
+        if m or h:
+            yr, lid, extend = (int(m.group(1)), int(m.group(2)), m.group(3)) if m else (
+                int(h.group(2)), int(h.group(1)), h.group(3))
+            if lid != self.league_id or yr not in self.seasons:
+                return FixtureResponse({"messages": ["not found"]}, 404)
+            payload = self.league_route(self.seasons[yr], views, params, filters, extend or "")
+            if payload is None:
+                return FixtureResponse({"messages": ["unsupported fixture view"]}, 500)
+            return FixtureResponse([payload] if h else payload)
+
+        s = self._SEASON_RE.search(url)
+        if s and int(s.group(1)) in self.seasons:
+            season = self.seasons[int(s.group(1))]
+            if s.group(2):
+                return FixtureResponse(season.pro_players_payload())
+            return FixtureResponse(season.pro_schedule_payload())
+        return FixtureResponse({"messages": ["unknown endpoint"]}, 404)
+
+    def league_route(self, season: SyntheticSeason, views: List[str], params: Dict[str, Any],
+                     filters: Dict[str, Any], extend: str) -> Optional[Dict[str, Any]]:
+        if extend.startswith("/communication") and views == ["kona_league_communication"]:
+            return season.communication_payload(filters)
+        if "mSettings" in views or "mTeam" in views and "mRoster" in views:
+            return season.league_payload()
+        if "mDraftDetail" in views:
+            payload = season.draft_payload()
+            if "mTeam" in views:
+                payload["teams"] = season.scoreboard_payload()["teams"]
+            return payload
+        if views == ["mMatchupScore"] or set(views) == {"mMatchupScore", "mTeam"}:
+            return season.scoreboard_payload()
+        if set(views) == {"mMatchupScore", "mScoreboard"}:
+            period = filters.get("schedule", {}).get("filterMatchupPeriodIds", {}).get("value", [None])[0]
+            week = int(params.get("scoringPeriodId", season.current_week))
+            return season.box_score_payload(week, int(period or week))
+        if views == ["mPositionalRatings"]:
+            return {"positionAgainstOpponent": {"positionalRatings": {}}}
+        if views == ["kona_player_info"]:
+            return season.free_agent_payload(int(params.get("scoringPeriodId", season.current_week)), filters)
+        if views == ["kona_playercard"]:
+            ids = filters.get("players", {}).get("filterIds", {}).get("value", [])
+            return season.player_card_payload(ids)
+        return None
+
+    def get(self, url, params=None, headers=None, cookies=None, **kwargs):
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        return self.route(url, params, headers)
+
+
+@contextlib.contextmanager
+def offline_espn(seasons: Dict[int, Dict[str, Any]], league_id: int = FIXTURE_LEAGUE_ID,
+                 latency_ms: float = 0.0):
+    """Patch espn_api's HTTP client to serve synthetic payloads for `seasons`.
+
+    `latency_ms` delays every request to approximate an ESPN round trip.
+    """
+    stand_in = OfflineESPN(seasons, league_id=league_id, latency_ms=latency_ms)
+    with mock.patch.object(espn_requests.requests, "get", stand_in.get):
+        yield stand_in
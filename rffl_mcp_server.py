@@ -1,14 +1,51 @@
 
 from __future__ import annotations
 
+import atexit
+import bisect
+import contextvars
+import copy
+import functools
+import gc
+import heapq
+import itertools
 import json
 import logging
+import logging.handlers
+import math
 import os
+import queue
+import random
+import re
+import secrets
+import sqlite3
+import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+import types
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from urllib.request import pathname2url
+
+_IMPORT_STARTED = time.perf_counter()
 
 from fastmcp import FastMCP
-from espn_api.football import League
+
+# espn_api, numpy, starlette, and the profiler/process-pool modules are imported on
+# first use (see _espn() and the functions that need them), so importing this
+# module and answering ping() stay fast on a cold start.
+if TYPE_CHECKING:
+    import cProfile
+
+    import numpy as np
+    from espn_api.football import League
+    from espn_api.requests.espn_requests import EspnFantasyRequests
+    from starlette.requests import Request
+    from starlette.responses import PlainTextResponse
 
 """
 rffl-mcp-server: ESPN Fantasy Football MCP server with authentication support.
@@ -33,6 +70,37 @@ DEFAULT_YEAR = int(os.getenv("ESPN_YEAR", "2025"))
 DEBUG = os.getenv("ESPN_DEBUG", "0") == "1"
 ENABLE_CACHE = os.getenv("ENABLE_CACHE", "true").lower() in ("true", "1", "yes")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+ENABLE_PERSISTENT_CACHE = os.getenv("ENABLE_PERSISTENT_CACHE", "true").lower() in ("true", "1", "yes")
+CACHE_DIR = os.getenv("RFFL_CACHE_DIR", ".rffl_cache")
+SCOREBOARD_TTL_SECONDS = int(os.getenv("SCOREBOARD_TTL_SECONDS", "300"))
+HISTORY_START_YEAR = int(os.getenv("ESPN_HISTORY_START_YEAR", "2011"))
+SIMULATION_WORKERS = int(os.getenv("SIMULATION_WORKERS", "1"))
+SIMULATION_BATCH_SIZE = int(os.getenv("SIMULATION_BATCH_SIZE", "20000"))
+MAX_SIMULATIONS = int(os.getenv("MAX_SIMULATIONS", "1000000"))
+PLAYER_DETAIL_TTL_SECONDS = int(os.getenv("PLAYER_DETAIL_TTL_SECONDS", "3600"))
+PLAYER_DETAIL_CACHE_SIZE = int(os.getenv("PLAYER_DETAIL_CACHE_SIZE", "2000"))
+FREE_AGENT_TTL_SECONDS = int(os.getenv("FREE_AGENT_TTL_SECONDS", "300"))
+FREE_AGENT_POOL_SIZE = int(os.getenv("FREE_AGENT_POOL_SIZE", "300"))
+DRAFT_FETCH_WORKERS = int(os.getenv("DRAFT_FETCH_WORKERS", "4"))
+ACTIVITY_TTL_SECONDS = int(os.getenv("ACTIVITY_TTL_SECONDS", "300"))
+ACTIVITY_PAGE_SIZE = int(os.getenv("ACTIVITY_PAGE_SIZE", "50"))
+WAREHOUSE_QUERY_TIMEOUT_MS = int(os.getenv("WAREHOUSE_QUERY_TIMEOUT_MS", "2000"))
+WAREHOUSE_MAX_ROWS = int(os.getenv("WAREHOUSE_MAX_ROWS", "1000"))
+TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH", "")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_TOOLS = {t.strip() for t in os.getenv("PROFILE_TOOLS", "*").split(",") if t.strip()}
+PROFILE_DIR = os.getenv("PROFILE_DIR", "")
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "50"))
+SLOW_CALL_THRESHOLD_MS = int(os.getenv("SLOW_CALL_THRESHOLD_MS", "1000"))
+# Per-tool overrides, e.g. "get_league_records=5000,search_players=200"
+SLOW_CALL_THRESHOLDS = {
+    tool.strip(): int(ms)
+    for tool, _, ms in (item.partition("=") for item in os.getenv("SLOW_CALL_THRESHOLDS", "").split(","))
+    if tool.strip() and ms.strip()
+}
+SLOW_CALL_BUFFER_SIZE = int(os.getenv("SLOW_CALL_BUFFER_SIZE", "100"))
+SLOW_CALL_MAX_AGE_S = float(os.getenv("SLOW_CALL_MAX_AGE_S", "3600"))  # 0 = keep until outranked
+LEAGUE_CACHE_MAX_MB = float(os.getenv("LEAGUE_CACHE_MAX_MB", "256"))  # 0 = unbounded
 
 # --- Authentication credentials -----------------------------------------------
 # Optional: Provide ESPN_S2 and SWID for accessing private leagues or historical data
@@ -40,6 +108,10 @@ ESPN_S2 = os.getenv("ESPN_S2", None)
 SWID = os.getenv("SWID", None)
 
 # --- Structured Logging Setup ------------------------------------------------
+# Attributes every LogRecord carries; anything else was passed through `extra=`.
+_LOG_RECORD_FIELDS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging compatible with FastMCP Cloud."""
     def format(self, record):
@@ -48,33 +120,689 @@ class JSONFormatter(logging.Formatter):
             "level": record.levelname,
             "message": record.getMessage(),
         }
-        # Add extra fields if present
-        if hasattr(record, "tool"):
-            log_data["tool"] = record.tool
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
-        if hasattr(record, "cache_hit"):
-            log_data["cache_hit"] = record.cache_hit
-        if hasattr(record, "league_id"):
-            log_data["league_id"] = record.league_id
-        if hasattr(record, "year"):
-            log_data["year"] = record.year
-        if hasattr(record, "week"):
-            log_data["week"] = record.week
-        if hasattr(record, "status"):
-            log_data["status"] = record.status
-        return json.dumps(log_data)
-
-logger = logging.getLogger("rffl-mcp-server")
+        # Every field passed via extra=, in the order it was given
+        for key, value in record.__dict__.items():
+            if key not in _LOG_RECORD_FIELDS and not key.startswith("_"):
+                log_data[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_data["exception"] = record.exc_text
+        return json.dumps(log_data, default=str)
+
+
+class _LogQueueHandler(logging.handlers.QueueHandler):
+    """Queue records for the listener thread, keeping extra fields and tracebacks intact."""
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# Formatting and the stream write happen on a listener thread so tool latency
+# never includes log I/O; the listener is flushed and stopped at exit.
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
 handler = logging.StreamHandler()
 handler.setFormatter(JSONFormatter())
-logger.addHandler(handler)
+_LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, handler, respect_handler_level=True)
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)
+
+logger = logging.getLogger("rffl-mcp-server")
+logger.addHandler(_LogQueueHandler(_LOG_QUEUE))
 logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
 
+# --- Metrics -----------------------------------------------------------------
+# In-process counters and histograms, rendered in the Prometheus text format at
+# /metrics when running over HTTP/SSE. An update is one dict operation under a
+# lock; cache hit ratios are read from the existing stats only at scrape time.
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+_METRIC_TYPES = {
+    "rffl_tool_calls_total": ("counter", "Tool calls by tool and status."),
+    "rffl_tool_errors_total": ("counter", "Tool calls that raised, by tool and exception type."),
+    "rffl_tool_duration_seconds": ("histogram", "Tool call latency in seconds."),
+    "rffl_tool_phase_seconds": ("histogram", "Tool call time by phase (cache, espn, transform, format) in seconds."),
+    "rffl_tool_slow_calls_total": ("counter", "Tool calls over their slow-call threshold, by tool."),
+    "rffl_tools_in_flight": ("gauge", "Tool calls currently executing."),
+    "rffl_espn_requests_total": ("counter", "ESPN HTTP requests by endpoint, view, and status."),
+    "rffl_espn_request_duration_seconds": ("histogram", "ESPN HTTP request latency in seconds."),
+}
+_METRICS: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Any] = {("rffl_tools_in_flight", ()): 0.0}
+_METRICS_LOCK = threading.Lock()
+
+
+def _metric_inc(name: str, labels: Dict[str, str], value: float = 1.0) -> None:
+    """Add to a counter or gauge series."""
+    key = (name, tuple(sorted(labels.items())))
+    with _METRICS_LOCK:
+        _METRICS[key] = _METRICS.get(key, 0.0) + value
+
+
+def _metric_observe(name: str, labels: Dict[str, str], seconds: float) -> None:
+    """Record one latency sample in a histogram series."""
+    key = (name, tuple(sorted(labels.items())))
+    with _METRICS_LOCK:
+        hist = _METRICS.get(key)
+        if hist is None:
+            # [per-bucket counts (last is +Inf), sum, count]
+            hist = _METRICS[key] = [[0] * (len(_LATENCY_BUCKETS) + 1), 0.0, 0]
+        hist[0][bisect.bisect_left(_LATENCY_BUCKETS, seconds)] += 1
+        hist[1] += seconds
+        hist[2] += 1
+
+
+def _metric_labels(labels: Any) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34)).replace(chr(10), " ")}"'
+        for k, v in labels
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _cache_ratios() -> List[Tuple[str, int, int]]:
+    """(cache, hits, misses) for every cache that tracks hits, read at scrape time."""
+    return [
+        ("league", _CACHE_STATS["hits"], _CACHE_STATS["misses"]),
+        ("player_detail", _PLAYER_SEARCH_STATS["detail_hits"], _PLAYER_SEARCH_STATS["detail_misses"]),
+        ("free_agents", _FREE_AGENT_STATS["hits"], _FREE_AGENT_STATS["misses"]),
+    ]
+
+
+def _render_metrics() -> str:
+    """Render every metric series in the Prometheus text exposition format."""
+    with _METRICS_LOCK:
+        snapshot = sorted(
+            (key, [list(value[0]), value[1], value[2]] if isinstance(value, list) else value)
+            for key, value in _METRICS.items()
+        )
+    lines: List[str] = []
+    for name, (kind, help_text) in _METRIC_TYPES.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for (series, labels), value in snapshot:
+            if series != name:
+                continue
+            if kind != "histogram":
+                lines.append(f"{name}{_metric_labels(labels)} {value:g}")
+                continue
+            counts, total, count = value
+            cumulative = 0
+            for le, n in zip(_LATENCY_BUCKETS + (float("inf"),), counts):
+                cumulative += n
+                bound = "+Inf" if le == float("inf") else f"{le:g}"
+                lines.append(f"{name}_bucket{_metric_labels(labels + (('le', bound),))} {cumulative}")
+            lines.append(f"{name}_sum{_metric_labels(labels)} {total:.6f}")
+            lines.append(f"{name}_count{_metric_labels(labels)} {count}")
+
+    ratios = _cache_ratios()
+    for name, kind, help_text, pick in (
+        ("rffl_cache_hits_total", "counter", "Cache hits by cache.", lambda h, m: h),
+        ("rffl_cache_misses_total", "counter", "Cache misses by cache.", lambda h, m: m),
+        ("rffl_cache_hit_ratio", "gauge", "Cache hit ratio by cache (0 before any lookup).",
+         lambda h, m: h / (h + m) if h + m else 0.0),
+    ):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for cache, hits, misses in ratios:
+            lines.append(f'{name}{{cache="{cache}"}} {pick(hits, misses):g}')
+    lines.append("# HELP rffl_cache_entries Entries held in memory by cache.")
+    lines.append("# TYPE rffl_cache_entries gauge")
+    for cache, entries in (
+        ("league", len(_LEAGUE_CACHE)),
+        ("scoreboard", len(_SCOREBOARD_CACHE)),
+        ("player_detail", len(_PLAYER_DETAIL_CACHE)),
+        ("free_agents", len(_FREE_AGENT_POOLS)),
+    ):
+        lines.append(f'rffl_cache_entries{{cache="{cache}"}} {entries}')
+    lines.append("# HELP rffl_league_cache_bytes Estimated memory held by cached League objects.")
+    lines.append("# TYPE rffl_league_cache_bytes gauge")
+    lines.append(f"rffl_league_cache_bytes {sum(_LEAGUE_CACHE_BYTES.values())}")
+    return "\n".join(lines) + "\n"
+
+
+def _timed_espn_call(endpoint: str, original):
+    """Wrap an espn_api request method to count and time every HTTP request it makes."""
+    @functools.wraps(original)
+    def timed(self, *args, **kwargs):
+        params = kwargs.get("params", args[0] if args else None) or {}
+        views = params.get("view") if isinstance(params, dict) else None
+        view = ",".join(views) if isinstance(views, (list, tuple)) else str(views or "none")
+        status = "success"
+        start = time.perf_counter()
+        try:
+            with _phase("espn", "espn.request", endpoint=endpoint, view=view):
+                return original(self, *args, **kwargs)
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            _metric_inc("rffl_espn_requests_total", {"endpoint": endpoint, "view": view, "status": status})
+            _metric_observe("rffl_espn_request_duration_seconds", {"endpoint": endpoint, "view": view}, elapsed)
+    timed.rffl_instrumented = True
+    return timed
+
+
+def _instrument_espn_requests(requests_class: type) -> None:
+    """Install the timing wrapper on espn_api's request client (idempotent)."""
+    for method, endpoint in (("league_get", "league"), ("get", "season"), ("news_get", "news")):
+        original = getattr(requests_class, method)
+        if not getattr(original, "rffl_instrumented", False):
+            setattr(requests_class, method, _timed_espn_call(endpoint, original))
+
+
+_ESPN_API: Optional[types.SimpleNamespace] = None
+_ESPN_API_LOCK = threading.Lock()
+
+
+def _espn() -> types.SimpleNamespace:
+    """
+    espn_api's League, EspnFantasyRequests, and ACTIVITY_MAP, imported on first use.
+
+    The request client is instrumented as part of the import, so every ESPN
+    request is timed no matter which tool triggers the first one.
+    """
+    global _ESPN_API
+    if _ESPN_API is None:
+        with _ESPN_API_LOCK:
+            if _ESPN_API is None:
+                from espn_api.football import League
+                from espn_api.football.constant import ACTIVITY_MAP
+                from espn_api.requests.espn_requests import EspnFantasyRequests
+
+                _instrument_espn_requests(EspnFantasyRequests)
+                _ESPN_API = types.SimpleNamespace(
+                    League=League, EspnFantasyRequests=EspnFantasyRequests, ACTIVITY_MAP=ACTIVITY_MAP
+                )
+    return _ESPN_API
+
+
+# --- Tool Instrumentation ----------------------------------------------------
+# Every tool runs inside a call context. Helpers mark time spent looking up
+# caches ("cache"), waiting on ESPN ("espn", recorded by the request wrapper),
+# and rendering text ("format"); whatever remains is "transform". Phases are
+# exclusive: time in a nested phase is not also charged to its parent.
+#
+# The same context carries a trace: the tool call is the root span and every
+# phase (plus a few named steps such as League construction) is a child span.
+# Each stretch of transform time between phases is recorded as a "transform"
+# span, so the trace accounts for the whole call.
+# Finished traces are handed to the registered span exporters on a background
+# thread, so exporting never adds to tool latency.
+_TOOL_PHASES = ("cache", "espn", "transform", "format")
+_CALL_CONTEXT: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    "rffl_tool_call", default=None
+)
+_SPAN_EXPORTERS: List[Any] = []
+_SPAN_QUEUE: "queue.SimpleQueue[Optional[List[Dict[str, Any]]]]" = queue.SimpleQueue()
+_SPAN_WORKER: Dict[str, Optional[threading.Thread]] = {"thread": None}
+_SPAN_LOCK = threading.Lock()
+
+
+class JSONLinesSpanExporter:
+    """Append finished spans to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(span, default=str) + "\n" for span in spans)
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+
+
+def _export_spans_worker() -> None:
+    while True:
+        spans = _SPAN_QUEUE.get()
+        if spans is None:
+            return
+        for exporter in list(_SPAN_EXPORTERS):
+            try:
+                exporter.export(spans)
+            except Exception as e:
+                logger.warning(
+                    "Span exporter failed",
+                    extra={"exporter": type(exporter).__name__, "error": str(e), "status": "error"}
+                )
+
+
+def _enqueue_spans(spans: List[Dict[str, Any]]) -> None:
+    with _SPAN_LOCK:
+        thread = _SPAN_WORKER["thread"]
+        if thread is None or not thread.is_alive():
+            thread = threading.Thread(target=_export_spans_worker, name="rffl-span-export", daemon=True)
+            thread.start()
+            _SPAN_WORKER["thread"] = thread
+    _SPAN_QUEUE.put(spans)
+
+
+def _flush_spans() -> None:
+    """Export every queued trace and stop the export thread (it restarts on demand)."""
+    with _SPAN_LOCK:
+        thread = _SPAN_WORKER["thread"]
+        if thread is not None and thread.is_alive():
+            _SPAN_QUEUE.put(None)
+            thread.join()
+        _SPAN_WORKER["thread"] = None
+
+
+def add_span_exporter(exporter: Any) -> None:
+    """Register an exporter: any object with export(spans: List[dict]) called once per finished trace."""
+    _SPAN_EXPORTERS.append(exporter)
+
+
+if TRACE_EXPORT_PATH:
+    add_span_exporter(JSONLinesSpanExporter(TRACE_EXPORT_PATH))
+atexit.register(_flush_spans)
+
+
+@contextmanager
+def _span(name: str, /, **attributes: Any):
+    """Record a child span of the current tool call; yields its attribute dict."""
+    call = _CALL_CONTEXT.get()
+    if call is None:
+        yield attributes
+        return
+    span_stack = call["span_stack"]
+    span = {
+        "trace_id": call["trace_id"],
+        "span_id": secrets.token_hex(8),
+        "parent_id": span_stack[-1] if span_stack else None,
+        "name": name,
+        "start": time.time(),
+        "duration_ms": 0.0,
+        "status": "ok",
+        "attributes": attributes,
+    }
+    span_stack.append(span["span_id"])
+    start = time.perf_counter()
+    try:
+        yield attributes
+    except Exception as e:
+        span["status"] = "error"
+        attributes["error"] = type(e).__name__
+        raise
+    finally:
+        span["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        span_stack.pop()
+        call["spans"].append(span)
+
+
+def _transform_span(call: Dict[str, Any]) -> None:
+    """Record the time since the call's last phase ended (transform time) as a span."""
+    idle = call.get("idle")
+    if idle is None:
+        return
+    span_stack = call["span_stack"]
+    call["spans"].append({
+        "trace_id": call["trace_id"],
+        "span_id": secrets.token_hex(8),
+        "parent_id": span_stack[-1] if span_stack else None,
+        "name": "transform",
+        "start": idle[1],
+        "duration_ms": round((time.perf_counter() - idle[0]) * 1000, 3),
+        "status": "ok",
+        "attributes": {},
+    })
+
+
+@contextmanager
+def _phase(name: str, span: Optional[str] = None, /, **attributes: Any):
+    """Charge the time spent in a block to a phase of the current tool call, inside a span."""
+    call = _CALL_CONTEXT.get()
+    if call is None:
+        yield attributes
+        return
+    stack, phases = call["stack"], call["phases"]
+    now = time.perf_counter()
+    if stack:
+        parent = stack[-1]
+        phases[parent[0]] = phases.get(parent[0], 0.0) + now - parent[1]
+    else:
+        _transform_span(call)
+    entry = [name, now]
+    stack.append(entry)
+    try:
+        with _span(span or name, **attributes) as span_attributes:
+            yield span_attributes
+    finally:
+        now = time.perf_counter()
+        phases[name] = phases.get(name, 0.0) + now - entry[1]
+        stack.pop()
+        if stack:
+            stack[-1][1] = now
+        elif "idle" in call:
+            call["idle"] = (now, time.time())
+
+
+def _annotate(**fields: Any) -> None:
+    """Attach fields (resolved league/year, result counts) to the current call's completion log."""
+    call = _CALL_CONTEXT.get()
+    if call is not None:
+        call["fields"].update(fields)
+
+
+def _worker_context() -> contextvars.Context:
+    """
+    A copy of the current context for one worker thread of a tool call.
+
+    The worker records spans under the caller's current span with its own span and
+    phase stacks, so concurrent workers never share a stack. Its phase times are
+    dropped; the caller charges the time it waits on the workers to a phase itself.
+    """
+    context = contextvars.copy_context()
+    call = _CALL_CONTEXT.get()
+    if call is not None:
+        worker = {k: v for k, v in call.items() if k != "idle"}
+        worker.update(phases={}, stack=[], span_stack=call["span_stack"][-1:])
+        context.run(_CALL_CONTEXT.set, worker)
+    return context
+
+
+def _span_args(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Scalar tool arguments for the root span (long strings such as SQL are truncated)."""
+    return {
+        k: (v[:200] if isinstance(v, str) else v)
+        for k, v in kwargs.items()
+        if v is None or isinstance(v, (str, int, float, bool))
+    }
+
+
+def _instrumented(fn):
+    """Count, time, trace, and log every call of a tool function, broken down by phase."""
+    tool_name = fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        call: Dict[str, Any] = {
+            "phases": {},
+            "stack": [],
+            "fields": {},
+            "trace_id": secrets.token_hex(16),
+            "span_stack": [],
+            "spans": [],
+            "idle": (time.perf_counter(), time.time()),
+        }
+        token = _CALL_CONTEXT.set(call)
+        _metric_inc("rffl_tools_in_flight", {})
+        status = "success"
+        error = None
+        profiler = _start_profile(tool_name)
+        start = time.perf_counter()
+        try:
+            with _span(tool_name, **_span_args(kwargs)):
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    _transform_span(call)
+        except Exception as e:
+            status, error = "error", type(e).__name__
+            _metric_inc("rffl_tool_errors_total", {"tool": tool_name, "error": error})
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            if profiler is not None:
+                _save_profile(profiler, tool_name, kwargs, elapsed, call["trace_id"])
+            _CALL_CONTEXT.reset(token)
+            _metric_inc("rffl_tools_in_flight", {}, -1.0)
+            _metric_observe("rffl_tool_duration_seconds", {"tool": tool_name}, elapsed)
+            _metric_inc("rffl_tool_calls_total", {"tool": tool_name, "status": status})
+            phases = call["phases"]
+            phases["transform"] = phases.get("transform", 0.0) + max(0.0, elapsed - sum(phases.values()))
+            for phase, seconds in phases.items():
+                _metric_observe("rffl_tool_phase_seconds", {"tool": tool_name, "phase": phase}, seconds)
+            if _SPAN_EXPORTERS:
+                _enqueue_spans(call["spans"])
+            extra = {
+                "tool": tool_name,
+                "trace_id": call["trace_id"],
+                "duration_ms": int(elapsed * 1000),
+                "phases_ms": {p: round(phases[p] * 1000, 1) for p in _TOOL_PHASES if p in phases},
+                "status": status,
+                **{k: kwargs[k] for k in ("league_id", "year", "week") if kwargs.get(k) is not None},
+                **call["fields"],
+            }
+            if error:
+                extra["error"] = error
+            slow = _record_slow_call(tool_name, kwargs, elapsed, call, extra)
+            if slow:
+                extra["slow"] = True
+            logger.log(logging.WARNING if error or slow else logging.INFO, f"{tool_name} completed", extra=extra)
+    return wrapper
+
+# --- Profiling ---------------------------------------------------------------
+# Sampled cProfile capture of whole tool calls. A profiled call writes
+# <time>_<tool>_<args>.pstats (load with pstats, snakeviz, or flameprof) plus a
+# .json sidecar with the arguments, timing, trace id, and hottest functions.
+_PROFILE_LOCK = threading.Lock()
+
+
+def _profile_dir() -> str:
+    return PROFILE_DIR or os.path.join(CACHE_DIR, "profiles")
+
+
+def _should_profile(tool_name: str) -> bool:
+    if PROFILE_SAMPLE_RATE <= 0:
+        return False
+    if "*" not in PROFILE_TOOLS and tool_name not in PROFILE_TOOLS:
+        return False
+    return PROFILE_SAMPLE_RATE >= 1 or random.random() < PROFILE_SAMPLE_RATE
+
+
+def _start_profile(tool_name: str) -> Optional[cProfile.Profile]:
+    """Start a profiler for this call if it is sampled and no other call is being profiled."""
+    if not _should_profile(tool_name) or not _PROFILE_LOCK.acquire(blocking=False):
+        return None
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def _save_profile(
+    profiler: cProfile.Profile,
+    tool_name: str,
+    kwargs: Dict[str, Any],
+    elapsed: float,
+    trace_id: str,
+) -> None:
+    """Write the profile and its sidecar, then prune the oldest beyond PROFILE_MAX_FILES."""
+    profiler.disable()
+    _PROFILE_LOCK.release()
+    directory = _profile_dir()
+    args = _span_args(kwargs)
+    slug = "_".join(f"{k}={v}" for k, v in args.items() if v is not None)
+    slug = re.sub(r"[^A-Za-z0-9=.-]+", "-", slug)[:80]
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
+    base = os.path.join(directory, "_".join(part for part in (stamp, tool_name, slug) if part))
+    try:
+        os.makedirs(directory, exist_ok=True)
+        profiler.dump_stats(f"{base}.pstats")
+        import pstats
+
+        stats = pstats.Stats(profiler).stats
+        hottest = heapq.nlargest(10, stats.items(), key=lambda item: item[1][3])
+        meta = {
+            "tool": tool_name,
+            "args": args,
+            "duration_ms": round(elapsed * 1000, 1),
+            "trace_id": trace_id,
+            "created": stamp,
+            "profile": f"{base}.pstats",
+            "top_functions": [
+                {
+                    "function": f"{os.path.basename(file)}:{line}({func})",
+                    "calls": nc,
+                    "own_ms": round(tt * 1000, 2),
+                    "cumulative_ms": round(ct * 1000, 2),
+                }
+                for (file, line, func), (_, nc, tt, ct, _) in hottest
+            ],
+        }
+        with open(f"{base}.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        sidecars = sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+        for name in sidecars[:-PROFILE_MAX_FILES] if PROFILE_MAX_FILES > 0 else []:
+            for suffix in (".json", ".pstats"):
+                try:
+                    os.remove(os.path.join(directory, name[:-5] + suffix))
+                except FileNotFoundError:
+                    pass
+    except OSError as e:
+        logger.warning(
+            "Failed to write profile",
+            extra={"tool": tool_name, "error": str(e), "status": "error"}
+        )
+        return
+    logger.info(
+        "Profile written",
+        extra={"tool": tool_name, "trace_id": trace_id, "profile": f"{base}.pstats"}
+    )
+
+
+# --- Slow Calls --------------------------------------------------------------
+# Calls over their tool's threshold are logged at WARNING (so LOG_LEVEL=WARNING
+# shows only slow and failed calls). The slowest SLOW_CALL_BUFFER_SIZE of them
+# are kept in a min-heap keyed on duration, with the arguments, phase timings,
+# and cache behaviour needed to reproduce them, so a burst of calls just over
+# the threshold never pushes out the real outliers. Entries older than
+# SLOW_CALL_MAX_AGE_S are dropped.
+_SLOW_CALLS: List[Tuple[float, int, float, Dict[str, Any]]] = []
+_SLOW_CALLS_LOCK = threading.Lock()
+_SLOW_CALL_SEQ = itertools.count()
+
+
+def _slow_threshold_ms(tool_name: str) -> int:
+    return SLOW_CALL_THRESHOLDS.get(tool_name, SLOW_CALL_THRESHOLD_MS)
+
+
+def _expire_slow_calls(now: float) -> None:
+    """Drop buffered calls older than SLOW_CALL_MAX_AGE_S. Hold _SLOW_CALLS_LOCK."""
+    if SLOW_CALL_MAX_AGE_S <= 0:
+        return
+    kept = [item for item in _SLOW_CALLS if now - item[2] <= SLOW_CALL_MAX_AGE_S]
+    if len(kept) != len(_SLOW_CALLS):
+        heapq.heapify(kept)
+        _SLOW_CALLS[:] = kept
+
+
+def _record_slow_call(
+    tool_name: str,
+    kwargs: Dict[str, Any],
+    elapsed: float,
+    call: Dict[str, Any],
+    extra: Dict[str, Any],
+) -> bool:
+    """Buffer the call if it exceeded its threshold; returns whether it did."""
+    threshold = _slow_threshold_ms(tool_name)
+    if threshold <= 0 or elapsed * 1000 < threshold:
+        return False
+    league_lookups = [s["attributes"].get("hit") for s in call["spans"] if s["name"] == "cache.league"]
+    entry = {
+        "tool": tool_name,
+        "trace_id": call["trace_id"],
+        "finished": datetime.now(timezone.utc).isoformat(),
+        "duration_ms": round(elapsed * 1000, 1),
+        "threshold_ms": threshold,
+        "status": extra["status"],
+        "args": _span_args(kwargs),
+        "phases_ms": extra["phases_ms"],
+        "cache": {
+            "league_hits": sum(1 for hit in league_lookups if hit),
+            "league_misses": sum(1 for hit in league_lookups if not hit),
+            "persistent_reads": sum(1 for s in call["spans"] if s["name"] == "cache.persistent"),
+            "espn_requests": sum(1 for s in call["spans"] if s["name"] == "espn.request"),
+        },
+    }
+    if "error" in extra:
+        entry["error"] = extra["error"]
+    now = time.monotonic()
+    item = (entry["duration_ms"], next(_SLOW_CALL_SEQ), now, entry)
+    with _SLOW_CALLS_LOCK:
+        _expire_slow_calls(now)
+        if len(_SLOW_CALLS) < max(1, SLOW_CALL_BUFFER_SIZE):
+            heapq.heappush(_SLOW_CALLS, item)
+        else:
+            heapq.heappushpop(_SLOW_CALLS, item)  # evicts the fastest kept call
+    _metric_inc("rffl_tool_slow_calls_total", {"tool": tool_name})
+    return True
+
+
+def _tool(fn):
+    """Register a function as an MCP tool behind the shared instrumentation."""
+    return mcp.tool(_instrumented(fn))
+
+
 # --- Cache Management --------------------------------------------------------
-# Simple cache so we reuse the same League object across tools
-_LEAGUE_CACHE: Dict[Tuple[int, int], League] = {}
-_CACHE_STATS = {"hits": 0, "misses": 0, "enabled": ENABLE_CACHE}
+# Reuse the same League object across tools. Each entry's size is estimated when
+# it is cached; past LEAGUE_CACHE_MAX_MB the least recently used leagues are evicted.
+_LEAGUE_CACHE: "OrderedDict[Tuple[int, int], League]" = OrderedDict()
+_LEAGUE_CACHE_BYTES: Dict[Tuple[int, int], int] = {}
+_LEAGUE_CACHE_LOCK = threading.Lock()
+_CACHE_STATS = {"hits": 0, "misses": 0, "evictions": 0, "enabled": ENABLE_CACHE}
+# Shared objects a League points at but does not own
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, logging.Logger)
+
+
+def _object_sizes(obj: Any) -> Dict[str, int]:
+    """Shallow sizes of every object reachable from `obj`, summed by type name.
+
+    Modules, classes, functions, and loggers are shared rather than owned, so the
+    walk stops at them. The total approximates the memory freed by dropping `obj`.
+    """
+    sizes: Dict[str, int] = {}
+    seen = set()
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SHARED_TYPES):
+            continue
+        seen.add(id(item))
+        name = type(item).__name__
+        sizes[name] = sizes.get(name, 0) + sys.getsizeof(item)
+        stack.extend(gc.get_referents(item))
+    return sizes
+
+
+def _cache_league(key: Tuple[int, int], league: League) -> None:
+    """Cache a League and evict least recently used ones beyond the memory budget."""
+    size = sum(_object_sizes(league).values())
+    budget = int(LEAGUE_CACHE_MAX_MB * 1024 * 1024)
+    evicted = []
+    with _LEAGUE_CACHE_LOCK:
+        _LEAGUE_CACHE[key] = league
+        _LEAGUE_CACHE_BYTES[key] = size
+        _LEAGUE_CACHE.move_to_end(key)
+        # The league just loaded is always kept, even if it alone exceeds the budget
+        while budget > 0 and len(_LEAGUE_CACHE) > 1 and sum(_LEAGUE_CACHE_BYTES.values()) > budget:
+            old_key, _ = _LEAGUE_CACHE.popitem(last=False)
+            evicted.append((old_key, _LEAGUE_CACHE_BYTES.pop(old_key)))
+        _CACHE_STATS["evictions"] += len(evicted)
+    for (lid, yr), freed in evicted:
+        logger.info(
+            "Evicted league from cache",
+            extra={"league_id": lid, "year": yr, "freed_bytes": freed, "budget_mb": LEAGUE_CACHE_MAX_MB}
+        )
+
+
+def _reload_league(lid: int, yr: int) -> League:
+    """Drop a season's cached League and load it again from ESPN."""
+    with _LEAGUE_CACHE_LOCK:
+        _LEAGUE_CACHE.pop((lid, yr), None)
+        _LEAGUE_CACHE_BYTES.pop((lid, yr), None)
+    return _get_league(lid, yr)
 
 
 def _get_league(
@@ -87,13 +815,19 @@ def _get_league(
     key = (lid, yr)
 
     # Check cache
-    if ENABLE_CACHE and key in _LEAGUE_CACHE:
+    with _phase("cache", "cache.league", league_id=lid, year=yr) as span:
+        cached = _LEAGUE_CACHE.get(key) if ENABLE_CACHE else None
+        span["hit"] = cached is not None
+    if cached is not None:
+        with _LEAGUE_CACHE_LOCK:
+            if key in _LEAGUE_CACHE:
+                _LEAGUE_CACHE.move_to_end(key)
         _CACHE_STATS["hits"] += 1
         logger.debug(
             "Cache hit",
             extra={"cache_hit": True, "league_id": lid, "year": yr}
         )
-        return _LEAGUE_CACHE[key]
+        return cached
 
     # Cache miss - fetch from ESPN
     _CACHE_STATS["misses"] += 1
@@ -112,13 +846,14 @@ def _get_league(
 
     try:
         start_time = time.time()
-        league = League(
-            league_id=lid,
-            year=yr,
-            espn_s2=ESPN_S2,
-            swid=SWID,
-            debug=DEBUG,
-        )
+        with _span("league.load", league_id=lid, year=yr):
+            league = _espn().League(
+                league_id=lid,
+                year=yr,
+                espn_s2=ESPN_S2,
+                swid=SWID,
+                debug=DEBUG,
+            )
         duration_ms = int((time.time() - start_time) * 1000)
         logger.info(
             "Successfully loaded league from ESPN",
@@ -132,7 +867,7 @@ def _get_league(
         )
 
         if ENABLE_CACHE:
-            _LEAGUE_CACHE[key] = league
+            _cache_league(key, league)
 
         return league
     except Exception as e:
@@ -147,487 +882,3805 @@ def _get_league(
             }
         )
 
-        # Provide helpful error messages based on context
-        if not using_auth and yr < 2023:
-            raise RuntimeError(
-                f"Unable to load league {lid} ({yr}). Historical data (pre-2023) requires "
-                "authentication. Set ESPN_S2 and SWID environment variables."
-            ) from e
-        elif not using_auth:
-            raise RuntimeError(
-                f"Unable to load league {lid} ({yr}). This may be a private league requiring "
-                "authentication. Set ESPN_S2 and SWID environment variables if needed."
-            ) from e
-        else:
-            raise RuntimeError(
-                f"Unable to load league {lid} ({yr}) even with authentication. "
-                "Check that your ESPN_S2 and SWID credentials are valid and you have access to this league."
-            ) from e
+        raise _league_load_error(lid, yr, using_auth) from e
 
 
-def _team_dict(t) -> Dict[str, Any]:
-    if t is None:
-        return {}
-    return {
-        "id": getattr(t, "team_id", None),
-        "abbrev": getattr(t, "team_abbrev", None),
-        "name": getattr(t, "team_name", None),
-        "division_id": getattr(t, "division_id", None),
-        "division_name": getattr(t, "division_name", None),
-        "wins": getattr(t, "wins", None),
-        "losses": getattr(t, "losses", None),
-        "ties": getattr(t, "ties", None),
-        "points_for": getattr(t, "points_for", None),
-        "points_against": getattr(t, "points_against", None),
-        "waiver_rank": getattr(t, "waiver_rank", None),
-        "streak_type": getattr(t, "streak_type", None),
-        "streak_length": getattr(t, "streak_length", None),
-        "standing": getattr(t, "standing", None),
-        "final_standing": getattr(t, "final_standing", None),
-        "logo_url": getattr(t, "logo_url", None),
-    }
+def _league_load_error(lid: int, yr: int, using_auth: bool) -> RuntimeError:
+    """Build a helpful error message based on auth state and season."""
+    if not using_auth and yr < 2023:
+        return RuntimeError(
+            f"Unable to load league {lid} ({yr}). Historical data (pre-2023) requires "
+            "authentication. Set ESPN_S2 and SWID environment variables."
+        )
+    elif not using_auth:
+        return RuntimeError(
+            f"Unable to load league {lid} ({yr}). This may be a private league requiring "
+            "authentication. Set ESPN_S2 and SWID environment variables if needed."
+        )
+    else:
+        return RuntimeError(
+            f"Unable to load league {lid} ({yr}) even with authentication. "
+            "Check that your ESPN_S2 and SWID credentials are valid and you have access to this league."
+        )
 
 
-def _box_player_dict(bp) -> Dict[str, Any]:
-    if bp is None:
-        return {}
-    return {
-        "name": getattr(bp, "name", None),
-        "slot": getattr(bp, "slot_position", None),
-        "position": getattr(bp, "position", None),
-        "points": getattr(bp, "points", None),
-        "projected": getattr(bp, "projected_points", getattr(bp, "projected", None)),
-        "pro_team": getattr(bp, "pro_team", None),
-        "pro_opponent": getattr(bp, "pro_opponent", None),
-        "pro_pos_rank": getattr(bp, "pro_pos_rank", None),
-        "injury_status": getattr(bp, "injury_status", getattr(bp, "injuryStatus", None)),
-    }
+# --- Persistent Cache --------------------------------------------------------
+# Finished weeks never change, so indexes derived from them are written to disk
+# as JSON (one file per namespace/league/year) and survive restarts.
+_PERSIST_LOCK = threading.Lock()
+_PERSIST_STATS = {"reads": 0, "writes": 0, "errors": 0}
+_PERSIST_NAMESPACES = (
+    "h2h", "all_play", "records", "player_points", "optimal_lineups", "projection_accuracy", "activity", "draft",
+)
 
 
-def _format_boxscore_markdown(week: int, matchups_data: List[Dict[str, Any]]) -> str:
-    """Generate markdown formatted boxscore tables for enhanced display."""
-    lines = [f"# Week {week} Enhanced Boxscores\n"]
+def _persist_path(namespace: str, lid: int, yr: int) -> str:
+    return os.path.join(CACHE_DIR, namespace, f"{lid}_{yr}.json")
 
-    for idx, matchup in enumerate(matchups_data, 1):
-        home_team = matchup["home_team"]
-        home_score = matchup["home_score"]
-        away_team = matchup["away_team"]
-        away_score = matchup["away_score"]
 
-        # Matchup header
-        lines.append(f"## Matchup {idx}: {home_team} ({home_score:.2f}) vs {away_team} ({away_score:.2f})\n")
+def _persist_load(namespace: str, lid: int, yr: int) -> Optional[Dict[str, Any]]:
+    """Return a persisted entry, or None if missing/disabled/unreadable."""
+    if not ENABLE_PERSISTENT_CACHE:
+        return None
+    path = _persist_path(namespace, lid, yr)
+    try:
+        with _phase("cache", "cache.persistent", namespace=namespace), open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        _PERSIST_STATS["errors"] += 1
+        logger.warning(
+            "Ignoring unreadable persistent cache entry",
+            extra={"league_id": lid, "year": yr, "status": "error"}
+        )
+        return None
+    _PERSIST_STATS["reads"] += 1
+    return data
 
-        # Home team lineup
-        lines.append(f"### {home_team} Lineup\n")
-        lines.append("| SLOT | PLAYER | POSITION | INJURY STATUS | PROJ PF | ACTUAL PF |")
-        lines.append("|------|--------|----------|---------------|---------|-----------|")
 
-        for player in matchup["home_lineup"]:
-            slot = player.get("slot", "N/A")
-            name = player.get("name", "Unknown")
-            position = player.get("position", "N/A")
-            injury = player.get("injury_status", "ACTIVE") or "ACTIVE"
-            projected = player.get("projected", 0.0) or 0.0
-            actual = player.get("points", 0.0) or 0.0
+def _persist_save(namespace: str, lid: int, yr: int, data: Dict[str, Any]) -> None:
+    """Atomically write a persisted entry. Failures are logged, never raised."""
+    if not ENABLE_PERSISTENT_CACHE:
+        return
+    path = _persist_path(namespace, lid, yr)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with _PERSIST_LOCK:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        _PERSIST_STATS["writes"] += 1
+    except OSError:
+        _PERSIST_STATS["errors"] += 1
+        logger.warning(
+            "Failed to write persistent cache entry",
+            extra={"league_id": lid, "year": yr, "status": "error"}
+        )
 
-            lines.append(f"| {slot} | {name} | {position} | {injury} | {projected:.2f} | {actual:.2f} |")
 
-        lines.append("")  # Blank line
+def _persist_files() -> List[str]:
+    """Paths of persisted entries. Only namespace directories are read, so profiles
+    and the warehouse that share CACHE_DIR are never counted or deleted."""
+    paths = []
+    for namespace in _PERSIST_NAMESPACES:
+        directory = os.path.join(CACHE_DIR, namespace)
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            continue
+        paths.extend(os.path.join(directory, name) for name in names if name.endswith(".json"))
+    return paths
+
+
+def _persist_entries() -> int:
+    """Count persisted entries across all namespaces."""
+    return len(_persist_files())
+
+
+def _persist_clear() -> int:
+    """Delete all persisted entries and return how many were removed."""
+    with _PERSIST_LOCK:
+        paths = _persist_files()
+        for path in paths:
+            os.remove(path)
+    return len(paths)
+
+
+# --- Season Scoreboards ------------------------------------------------------
+# A single mMatchupScore request returns every matchup of a season, which is far
+# cheaper than loading a full League or calling scoreboard() week by week.
+_SCOREBOARD_CACHE: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+
+def _espn_requests(lid: int, yr: int) -> EspnFantasyRequests:
+    """Reuse a cached League's request client, or build a bare one without loading the league."""
+    league = _LEAGUE_CACHE.get((lid, yr))
+    if league is not None:
+        return league.espn_request
+    cookies = {"espn_s2": ESPN_S2, "SWID": SWID} if ESPN_S2 and SWID else None
+    return _espn().EspnFantasyRequests(sport="nfl", year=yr, league_id=lid, cookies=cookies)
+
+
+def _schedule_rows(schedule: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flatten raw ESPN schedule entries into one row per matchup."""
+    rows: List[Dict[str, Any]] = []
+    for m in schedule:
+        home = m.get("home") or {}
+        away = m.get("away") or {}
+        matchup_type = m.get("playoffTierType", "NONE")
+        rows.append({
+            "week": m.get("matchupPeriodId"),
+            "home_id": home.get("teamId"),
+            "home_score": float(home.get("totalPoints") or 0.0),
+            "away_id": away.get("teamId"),
+            "away_score": float(away.get("totalPoints") or 0.0),
+            "winner": m.get("winner", "UNDECIDED"),
+            "is_playoff": matchup_type != "NONE",
+            "matchup_type": matchup_type,
+        })
+    return rows
 
-        # Away team lineup
-        lines.append(f"### {away_team} Lineup\n")
-        lines.append("| SLOT | PLAYER | POSITION | INJURY STATUS | PROJ PF | ACTUAL PF |")
-        lines.append("|------|--------|----------|---------------|---------|-----------|")
 
-        for player in matchup["away_lineup"]:
-            slot = player.get("slot", "N/A")
-            name = player.get("name", "Unknown")
-            position = player.get("position", "N/A")
-            injury = player.get("injury_status", "ACTIVE") or "ACTIVE"
-            projected = player.get("projected", 0.0) or 0.0
-            actual = player.get("points", 0.0) or 0.0
+def _final_weeks(rows: List[Dict[str, Any]]) -> List[int]:
+    """Weeks whose head-to-head matchups all have a decided winner."""
+    decided: Dict[int, bool] = {}
+    for r in rows:
+        if r["away_id"] is None:
+            continue
+        decided[r["week"]] = decided.get(r["week"], True) and r["winner"] != "UNDECIDED"
+    return sorted(w for w, done in decided.items() if done)
 
-            lines.append(f"| {slot} | {name} | {position} | {injury} | {projected:.2f} | {actual:.2f} |")
 
-        lines.append("")  # Blank line between matchups
+def _season_scoreboard(lid: int, yr: int) -> Dict[str, Any]:
+    """
+    Return every matchup of a season plus team names and which weeks are final.
 
-    return "\n".join(lines)
+    Completed seasons are cached for the life of the process; in-progress seasons
+    are re-fetched after SCOREBOARD_TTL_SECONDS so newly final weeks show up.
+    """
+    key = (lid, yr)
+    cached = _SCOREBOARD_CACHE.get(key)
+    if cached and (cached["complete"] or time.time() - cached["fetched_at"] < SCOREBOARD_TTL_SECONDS):
+        return cached
+
+    using_auth = ESPN_S2 is not None or SWID is not None
+    try:
+        start_time = time.time()
+        data = _espn_requests(lid, yr).league_get(params={"view": ["mMatchupScore", "mTeam"]})
+        duration_ms = int((time.time() - start_time) * 1000)
+    except Exception as e:
+        logger.error(
+            "Failed to load season scoreboard",
+            extra={"league_id": lid, "year": yr, "authenticated": using_auth, "status": "error"}
+        )
+        raise _league_load_error(lid, yr, using_auth) from e
+
+    teams: Dict[int, Dict[str, Any]] = {}
+    for t in data.get("teams", []):
+        name = t.get("name") or f"{t.get('location', 'Unknown')} {t.get('nickname', 'Unknown')}"
+        teams[t["id"]] = {"id": t["id"], "abbrev": t.get("abbrev"), "name": name}
+
+    rows = _schedule_rows(data.get("schedule", []))
+    final_weeks = _final_weeks(rows)
+    all_weeks = {r["week"] for r in rows if r["away_id"] is not None}
+    board = {
+        "teams": teams,
+        "matchups": rows,
+        "final_weeks": final_weeks,
+        "complete": bool(all_weeks) and all_weeks == set(final_weeks),
+        "fetched_at": time.time(),
+    }
+    _SCOREBOARD_CACHE[key] = board
+    logger.info(
+        "Loaded season scoreboard",
+        extra={"league_id": lid, "year": yr, "duration_ms": duration_ms, "status": "success"}
+    )
+    return board
+
+
+
+# --- Head-to-Head Index ------------------------------------------------------
+# Per-season team-by-team matrices (row team vs column team) built from the
+# season scoreboard and extended one finished week at a time.
+H2H_INDEX_VERSION = 1
+_H2H_MATRICES = ("wins", "ties", "points", "games", "playoff_wins", "playoff_games")
+_H2H_INDEX: Dict[Tuple[int, int], Dict[str, Any]] = {}
+_INDEX_LOCK = threading.RLock()
+
+
+def _h2h_slot(index: Dict[str, Any], team_id: int) -> int:
+    """Return the matrix row for a team, growing the matrices if it is new."""
+    if team_id not in index["team_ids"]:
+        index["team_ids"].append(team_id)
+        for name in _H2H_MATRICES:
+            matrix = index[name]
+            for row in matrix:
+                row.append(0)
+            matrix.append([0] * len(index["team_ids"]))
+    return index["team_ids"].index(team_id)
+
+
+def _h2h_apply_week(index: Dict[str, Any], rows: List[Dict[str, Any]], week: int) -> None:
+    for r in rows:
+        if r["week"] != week or r["away_id"] is None:
+            continue
+        h = _h2h_slot(index, r["home_id"])
+        a = _h2h_slot(index, r["away_id"])
+        for i, j, score, result in (
+            (h, a, r["home_score"], "HOME"),
+            (a, h, r["away_score"], "AWAY"),
+        ):
+            index["games"][i][j] += 1
+            index["points"][i][j] = round(index["points"][i][j] + score, 2)
+            if r["winner"] == result:
+                index["wins"][i][j] += 1
+            elif r["winner"] == "TIE":
+                index["ties"][i][j] += 1
+            if r["is_playoff"]:
+                index["playoff_games"][i][j] += 1
+                if r["winner"] == result:
+                    index["playoff_wins"][i][j] += 1
+    index["weeks"].append(week)
+
+
+def _h2h_season_index(lid: int, yr: int) -> Dict[str, Any]:
+    """Return the head-to-head index for a season, ingesting any newly final weeks."""
+    key = (lid, yr)
+    with _INDEX_LOCK:
+        index = _H2H_INDEX.get(key)
+        if index is None:
+            index = _persist_load("h2h", lid, yr)
+            if index is not None and index.get("version") != H2H_INDEX_VERSION:
+                index = None
+        if index is not None and index["complete"]:
+            _H2H_INDEX[key] = index
+            return index
+
+    board = _season_scoreboard(lid, yr)
+    with _INDEX_LOCK:
+        # Another call may have merged some of these weeks (or cleared the cache) meanwhile
+        index = _H2H_INDEX.get(key, index)
+        if index is None:
+            index = {
+                "version": H2H_INDEX_VERSION,
+                "weeks": [],
+                "complete": False,
+                "teams": {},
+                "team_ids": [],
+                **{name: [] for name in _H2H_MATRICES},
+            }
+            for team_id in sorted(board["teams"]):
+                _h2h_slot(index, team_id)
+
+        new_weeks = [w for w in board["final_weeks"] if w not in set(index["weeks"])]
+        changed = bool(new_weeks) or index["complete"] != board["complete"]
+        if changed:
+            index = copy.deepcopy(index)  # readers hold the current index outside the lock
+        for week in new_weeks:
+            _h2h_apply_week(index, board["matchups"], week)
+        index["teams"] = {str(tid): t for tid, t in board["teams"].items()}
+        index["complete"] = board["complete"]
+        if changed:
+            _persist_save("h2h", lid, yr, index)
+            logger.info(
+                "Updated head-to-head index",
+                extra={"league_id": lid, "year": yr, "status": "success"}
+            )
+        _H2H_INDEX[key] = index
+        return index
+
+
+def _resolve_team_id(teams: Dict[str, Dict[str, Any]], team: Union[int, str]) -> Optional[int]:
+    """Match a team by ESPN id, abbreviation, or name (case-insensitive) within one season."""
+    if isinstance(team, int) or str(team).strip().isdigit():
+        tid = int(team)
+        return tid if str(tid) in teams else None
+    needle = str(team).strip().lower()
+    for t in teams.values():
+        if needle in ((t.get("abbrev") or "").lower(), (t.get("name") or "").lower()):
+            return t["id"]
+    return None
+
+
+# --- All-Play Index ----------------------------------------------------------
+# Per-season teams x weeks score and result matrices for finished regular-season
+# weeks, persisted and extended one week at a time like the head-to-head index.
+ALL_PLAY_INDEX_VERSION = 1
+_ALL_PLAY_INDEX: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+
+def _all_play_season_index(lid: int, yr: int) -> Dict[str, Any]:
+    """Return the all-play index for a season, appending any newly final weeks."""
+    key = (lid, yr)
+    with _INDEX_LOCK:
+        index = _ALL_PLAY_INDEX.get(key)
+        if index is None:
+            index = _persist_load("all_play", lid, yr)
+            if index is not None and index.get("version") != ALL_PLAY_INDEX_VERSION:
+                index = None
+        if index is not None and index["complete"]:
+            _ALL_PLAY_INDEX[key] = index
+            return index
+
+    board = _season_scoreboard(lid, yr)
+    with _INDEX_LOCK:
+        # Another call may have merged some of these weeks (or cleared the cache) meanwhile
+        index = _ALL_PLAY_INDEX.get(key, index)
+        if index is None:
+            team_ids = sorted(board["teams"])
+            index = {
+                "version": ALL_PLAY_INDEX_VERSION,
+                "weeks": [],
+                "complete": False,
+                "teams": {},
+                "team_ids": team_ids,
+                "scores": [[] for _ in team_ids],
+                "results": [[] for _ in team_ids],
+            }
 
+        regular_weeks = {r["week"] for r in board["matchups"] if not r["is_playoff"]}
+        new_weeks = [w for w in board["final_weeks"] if w in regular_weeks and w not in set(index["weeks"])]
+        changed = bool(new_weeks) or index["complete"] != board["complete"]
+        if changed:
+            index = copy.deepcopy(index)  # readers hold the current index outside the lock
+        for week in new_weeks:
+            scores: Dict[int, Optional[float]] = {}
+            results: Dict[int, Optional[float]] = {}
+            for r in board["matchups"]:
+                if r["week"] != week:
+                    continue
+                scores[r["home_id"]] = r["home_score"]
+                if r["away_id"] is None:
+                    continue
+                scores[r["away_id"]] = r["away_score"]
+                home_result = {"HOME": 1.0, "AWAY": 0.0, "TIE": 0.5}.get(r["winner"])
+                results[r["home_id"]] = home_result
+                results[r["away_id"]] = None if home_result is None else 1.0 - home_result
+            for tid in scores:
+                if tid not in index["team_ids"]:
+                    index["team_ids"].append(tid)
+                    index["scores"].append([None] * len(index["weeks"]))
+                    index["results"].append([None] * len(index["weeks"]))
+            for row, tid in enumerate(index["team_ids"]):
+                index["scores"][row].append(scores.get(tid))
+                index["results"][row].append(results.get(tid))
+            index["weeks"].append(week)
+
+        index["teams"] = {str(tid): t for tid, t in board["teams"].items()}
+        index["complete"] = board["complete"]
+        if changed:
+            _persist_save("all_play", lid, yr, index)
+        _ALL_PLAY_INDEX[key] = index
+        return index
+
+
+def _all_play_table(index: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    All-play records, expected wins, and luck for every team in one pass.
 
-def _settings_dict(s) -> Dict[str, Any]:
+    Each week a team is credited with a win against every team it outscored.
+    Expected wins are the sum of weekly all-play win percentages, and luck is
+    actual wins minus expected wins.
+    """
+    import numpy as np
+    scores = np.array(index["scores"], dtype=float)  # None -> nan
+    results = np.array(index["results"], dtype=float)
+    played = ~np.isnan(scores)
+    if scores.size == 0:
+        return []
+
+    # [team, other, week] comparisons; nan compares False so missing scores drop out
+    higher = (scores[:, None, :] > scores[None, :, :]).sum(axis=1)
+    lower = (scores[:, None, :] < scores[None, :, :]).sum(axis=1)
+    opponents = played.sum(axis=0)[None, :] - 1
+    equal = np.where(played, opponents - higher - lower, 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weekly_pct = np.where(played & (opponents > 0), (higher + 0.5 * equal) / opponents, 0.0)
+    expected = weekly_pct.sum(axis=1)
+    actual_wins = (results == 1.0).sum(axis=1)
+    actual_ties = (results == 0.5).sum(axis=1)
+    actual_losses = (results == 0.0).sum(axis=1)
+    actual = actual_wins + 0.5 * actual_ties
+    ap_wins, ap_losses, ap_ties = higher.sum(axis=1), lower.sum(axis=1), equal.sum(axis=1)
+    ap_games = ap_wins + ap_losses + ap_ties
+
+    table = []
+    for i, tid in enumerate(index["team_ids"]):
+        if not played[i].any():
+            continue
+        team = index["teams"].get(str(tid), {})
+        table.append({
+            "team_id": tid,
+            "abbrev": team.get("abbrev"),
+            "name": team.get("name"),
+            "weeks": int(played[i].sum()),
+            "points_for": round(float(np.nansum(scores[i])), 2),
+            "all_play_wins": int(ap_wins[i]),
+            "all_play_losses": int(ap_losses[i]),
+            "all_play_ties": int(ap_ties[i]),
+            "all_play_pct": round(float((ap_wins[i] + 0.5 * ap_ties[i]) / ap_games[i]), 4) if ap_games[i] else 0.0,
+            "actual_wins": int(actual_wins[i]),
+            "actual_losses": int(actual_losses[i]),
+            "actual_ties": int(actual_ties[i]),
+            "expected_wins": round(float(expected[i]), 2),
+            "luck": round(float(actual[i] - expected[i]), 2),
+        })
+    return table
+
+
+# --- Standings Timeline ------------------------------------------------------
+# Cumulative record, points-for, and rank per team after every finished
+# regular-season week, materialized as teams x weeks arrays from the all-play
+# index in one vectorized pass and rebuilt only when that index gains weeks.
+_STANDINGS_TIMELINES: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+
+def _standings_timeline(lid: int, yr: int) -> Dict[str, Any]:
+    """Return the standings timeline for a season, rebuilding it if new weeks are final."""
+    import numpy as np
+    index = _all_play_season_index(lid, yr)
+    key = (lid, yr)
+    with _INDEX_LOCK:
+        timeline = _STANDINGS_TIMELINES.get(key)
+        if timeline is not None and timeline["weeks"] == index["weeks"]:
+            return timeline
+
+        n_teams, n_weeks = len(index["team_ids"]), len(index["weeks"])
+        scores = np.array(index["scores"], dtype=float).reshape(n_teams, n_weeks)  # None -> nan
+        results = np.array(index["results"], dtype=float).reshape(n_teams, n_weeks)
+        wins = np.cumsum(results == 1.0, axis=1)
+        losses = np.cumsum(results == 0.0, axis=1)
+        ties = np.cumsum(results == 0.5, axis=1)
+        points_for = np.round(np.cumsum(np.nan_to_num(scores), axis=1), 2)
+        games = wins + losses + ties
+        with np.errstate(invalid="ignore", divide="ignore"):
+            pct = np.where(games > 0, (wins + 0.5 * ties) / games, 0.0)
+
+        # Rank each week by win percentage, then points-for
+        order = np.lexsort((-points_for, -pct), axis=0)
+        rank = np.empty_like(order)
+        np.put_along_axis(rank, order, np.arange(1, n_teams + 1)[:, None].repeat(n_weeks, axis=1), axis=0)
+
+        timeline = {
+            "weeks": list(index["weeks"]),
+            "columns": {w: i for i, w in enumerate(index["weeks"])},
+            "team_ids": list(index["team_ids"]),
+            "teams": index["teams"],
+            "wins": wins,
+            "losses": losses,
+            "ties": ties,
+            "points_for": points_for,
+            "rank": rank,
+        }
+        _STANDINGS_TIMELINES[key] = timeline
+        return timeline
+
+
+def _standings_at(timeline: Dict[str, Any], week: int) -> List[Dict[str, Any]]:
+    """Standings after one week, read from a single column of the timeline."""
+    col = timeline["columns"][week]
+    rows = []
+    for i, tid in enumerate(timeline["team_ids"]):
+        team = timeline["teams"].get(str(tid), {})
+        rows.append({
+            "rank": int(timeline["rank"][i, col]),
+            "team_id": tid,
+            "abbrev": team.get("abbrev"),
+            "name": team.get("name"),
+            "wins": int(timeline["wins"][i, col]),
+            "losses": int(timeline["losses"][i, col]),
+            "ties": int(timeline["ties"][i, col]),
+            "points_for": float(timeline["points_for"][i, col]),
+        })
+    rows.sort(key=lambda x: x["rank"])
+    return rows
+
+
+# --- League Records Index ----------------------------------------------------
+# Per-season record candidates (best/worst single games), per-team results in
+# week order, and regular-season totals. Each newly final week is folded in
+# without revisiting earlier weeks; seasons are merged at query time.
+RECORDS_INDEX_VERSION = 1
+RECORDS_TOP_N = 10
+_RECORD_GAME_TYPES = ("NONE", "WINNERS_BRACKET")  # consolation games are excluded
+_RECORD_ORDER = {
+    "highest_score": ("score", True),
+    "lowest_score": ("score", False),
+    "biggest_blowout": ("margin", True),
+    "narrowest_win": ("margin", False),
+    "highest_combined": ("combined", True),
+}
+_RECORDS_INDEX: Dict[Tuple[int, int], Dict[str, Any]] = {}
+_RECORDS_STATS = {"weeks_applied": 0, "update_ms": 0.0}
+
+
+def _record_sort_key(name: str, entry: Dict[str, Any]) -> Tuple[float, int, int]:
+    field, descending = _RECORD_ORDER[name]
+    value = entry[field]
+    return (-value if descending else value, entry["year"], entry["week"])
+
+
+def _records_push(index: Dict[str, Any], name: str, entry: Dict[str, Any]) -> None:
+    """Insert a candidate and keep only the RECORDS_TOP_N best for this record."""
+    entries = index["records"][name]
+    entries.append(entry)
+    entries.sort(key=lambda e: _record_sort_key(name, e))
+    del entries[RECORDS_TOP_N:]
+
+
+def _records_apply_week(index: Dict[str, Any], yr: int, rows: List[Dict[str, Any]], week: int) -> None:
+    teams = index["teams"]
+
+    def team_name(tid):
+        return teams.get(str(tid), {}).get("name")
+
+    for r in rows:
+        if r["week"] != week or r["away_id"] is None or r["matchup_type"] not in _RECORD_GAME_TYPES:
+            continue
+        sides = ((r["home_id"], r["home_score"], r["away_id"], r["away_score"], "HOME"),
+                 (r["away_id"], r["away_score"], r["home_id"], r["home_score"], "AWAY"))
+        for tid, score, opp, opp_score, result in sides:
+            entry = {
+                "year": yr, "week": week, "team_id": tid, "team": team_name(tid), "score": score,
+                "opponent_id": opp, "opponent": team_name(opp), "opponent_score": opp_score,
+                "is_playoff": r["is_playoff"],
+            }
+            _records_push(index, "highest_score", entry)
+            _records_push(index, "lowest_score", entry)
+            outcome = "T" if r["winner"] == "TIE" else "W" if r["winner"] == result else "L"
+            index["results"].setdefault(str(tid), []).append([week, outcome])
+            if not r["is_playoff"]:
+                totals = index["season_totals"].setdefault(str(tid), {"W": 0, "L": 0, "T": 0, "points": 0.0})
+                totals[outcome] += 1
+                totals["points"] = round(totals["points"] + score, 2)
+
+        if r["winner"] in ("HOME", "AWAY"):
+            w, l = sides if r["winner"] == "HOME" else sides[::-1]
+            game = {
+                "year": yr, "week": week,
+                "winner_id": w[0], "winner": team_name(w[0]), "winner_score": w[1],
+                "loser_id": l[0], "loser": team_name(l[0]), "loser_score": l[1],
+                "margin": round(w[1] - l[1], 2), "combined": round(w[1] + l[1], 2),
+                "is_playoff": r["is_playoff"],
+            }
+            _records_push(index, "biggest_blowout", game)
+            _records_push(index, "narrowest_win", game)
+            _records_push(index, "highest_combined", game)
+    index["weeks"].append(week)
+
+
+def _records_season_index(lid: int, yr: int) -> Dict[str, Any]:
+    """Return the records index for a season, folding in any newly final weeks."""
+    key = (lid, yr)
+    with _INDEX_LOCK:
+        index = _RECORDS_INDEX.get(key)
+        if index is None:
+            index = _persist_load("records", lid, yr)
+            if index is not None and index.get("version") != RECORDS_INDEX_VERSION:
+                index = None
+        if index is not None and index["complete"]:
+            _RECORDS_INDEX[key] = index
+            return index
+
+    board = _season_scoreboard(lid, yr)
+    with _INDEX_LOCK:
+        # Another call may have merged some of these weeks (or cleared the cache) meanwhile
+        index = _RECORDS_INDEX.get(key, index)
+        if index is None:
+            index = {
+                "version": RECORDS_INDEX_VERSION,
+                "weeks": [],
+                "complete": False,
+                "teams": {},
+                "records": {name: [] for name in _RECORD_ORDER},
+                "results": {},
+                "season_totals": {},
+            }
+        new_weeks = [w for w in board["final_weeks"] if w not in set(index["weeks"])]
+        changed = bool(new_weeks) or index["complete"] != board["complete"]
+        if changed:
+            index = copy.deepcopy(index)  # readers hold the current index outside the lock
+        index["teams"] = {str(tid): t for tid, t in board["teams"].items()}
+        start = time.perf_counter()
+        for week in new_weeks:
+            _records_apply_week(index, yr, board["matchups"], week)
+        if new_weeks:
+            _RECORDS_STATS["weeks_applied"] += len(new_weeks)
+            _RECORDS_STATS["update_ms"] += (time.perf_counter() - start) * 1000
+        index["complete"] = board["complete"]
+        if changed:
+            _persist_save("records", lid, yr, index)
+        _RECORDS_INDEX[key] = index
+        return index
+
+
+def _longest_streaks(seasons: List[Tuple[int, Dict[str, Any]]], outcome: str, limit: int) -> List[Dict[str, Any]]:
+    """Longest runs of `outcome` per team, continuing across season boundaries."""
+    runs: List[Dict[str, Any]] = []
+    names: Dict[str, Optional[str]] = {}
+    current: Dict[str, Dict[str, Any]] = {}
+    for yr, index in seasons:
+        for tid, games in index["results"].items():
+            names[tid] = index["teams"].get(tid, {}).get("name") or names.get(tid)
+            for week, result in games:
+                run = current.get(tid)
+                if result != outcome:
+                    if run:
+                        runs.append(run)
+                    current[tid] = None
+                elif run:
+                    run["length"] += 1
+                    run["end"] = {"year": yr, "week": week}
+                else:
+                    current[tid] = {"team_id": int(tid), "length": 1,
+                                    "start": {"year": yr, "week": week}, "end": {"year": yr, "week": week}}
+    runs.extend(dict(run, active=True) for run in current.values() if run)
+    top = heapq.nsmallest(limit, runs, key=lambda r: (-r["length"], r["start"]["year"], r["start"]["week"]))
+    return [{"team": names.get(str(r["team_id"])), "active": False, **r} for r in top]
+
+
+def _season_records(seasons: List[Tuple[int, Dict[str, Any]]], limit: int) -> Dict[str, List[Dict[str, Any]]]:
+    rows = []
+    for yr, index in seasons:
+        for tid, t in index["season_totals"].items():
+            games = t["W"] + t["L"] + t["T"]
+            rows.append({
+                "year": yr, "team_id": int(tid), "team": index["teams"].get(tid, {}).get("name"),
+                "wins": t["W"], "losses": t["L"], "ties": t["T"], "points": t["points"],
+                "win_pct": round((t["W"] + 0.5 * t["T"]) / games, 4) if games else 0.0,
+            })
     return {
-        "team_count": getattr(s, "team_count", None),
-        "reg_season_count": getattr(s, "reg_season_count", None),
-        "veto_votes_required": getattr(s, "veto_votes_required", None),
-        "playoff_team_count": getattr(s, "playoff_team_count", None),
-        "tie_rule": getattr(s, "tie_rule", None),
-        "scoring_type": getattr(s, "scoring_type", None),
+        "most_points_season": heapq.nlargest(limit, rows, key=lambda r: r["points"]),
+        "fewest_points_season": heapq.nsmallest(limit, rows, key=lambda r: r["points"]),
+        "best_record_season": heapq.nlargest(limit, rows, key=lambda r: (r["win_pct"], r["points"])),
+        "worst_record_season": heapq.nsmallest(limit, rows, key=lambda r: (r["win_pct"], r["points"])),
     }
 
 
-# --- Tools -------------------------------------------------------------------
+# --- Vectorized Power Rankings -----------------------------------------------
+def _power_rankings_series(league: League, weeks: List[int]) -> Dict[int, List[Tuple[float, Any]]]:
+    """
+    Two-step dominance power rankings for many weeks in one vectorized pass.
 
-@mcp.tool
-def get_league(
-    league_id: Optional[int] = None,
-    year: Optional[int] = None,
-) -> Dict[str, Any]:
+    Mirrors espn_api's League.power_rankings(): for week w the win matrix counts
+    wins by margin over the first w games, dominance is the row sum of W² + W,
+    and power = int(dominance)*0.8 + int(avg score)*0.15 + int(avg margin)*0.05.
+    Cumulative win matrices for every week are built with one cumsum and squared
+    with one batched matmul.
     """
-    Get league metadata, settings, and team list for any season.
+    import numpy as np
+    teams = sorted(league.teams, key=lambda x: x.team_id)
+    slot = {t.team_id: i for i, t in enumerate(teams)}
+    n = len(teams)
+    depth = max(weeks)
+
+    # Teams x games arrays; missing games (e.g. eliminated in playoffs) pad as
+    # a zero-margin game against themselves, which adds no wins or points.
+    opp = np.tile(np.arange(n)[:, None], (1, depth))
+    mov = np.zeros((n, depth))
+    scores = np.zeros((n, depth))
+    for i, t in enumerate(teams):
+        games = min(depth, len(t.schedule), len(t.mov))
+        opp[i, :games] = [slot[o.team_id] for o in t.schedule[:games]]
+        mov[i, :games] = t.mov[:games]
+        scores[i, :games] = [s or 0.0 for s in t.scores[:games]]
+
+    # wins[k, i, j] = 1 when team i beat team j in game k
+    wins = np.zeros((depth, n, n))
+    rows = np.broadcast_to(np.arange(n)[:, None], (n, depth))
+    games = np.broadcast_to(np.arange(depth)[None, :], (n, depth))
+    np.add.at(wins, (games, rows, opp), (mov > 0).astype(float))
+    win_matrix = np.cumsum(wins, axis=0)
+    dominance = (np.matmul(win_matrix, win_matrix) + win_matrix).sum(axis=2)
+
+    played = np.arange(1, depth + 1)[:, None]
+    avg_score = np.trunc(np.cumsum(scores, axis=1).T / played)
+    avg_mov = np.trunc(np.cumsum(mov, axis=1).T / played)
+    power = np.trunc(dominance) * 0.8 + avg_score * 0.15 + avg_mov * 0.05
+
+    # Round through the same "{:.2f}" formatting espn_api uses so ties and
+    # half-cent cases order identically
+    out: Dict[int, List[Tuple[float, Any]]] = {}
+    for w in weeks:
+        scored = [(float("{0:.2f}".format(p)), t) for p, t in zip(power[w - 1].tolist(), teams)]
+        out[w] = sorted(scored, key=lambda tup: tup[0], reverse=True)
+    return out
 
-    Args:
-        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
-        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
 
-    Returns:
-        League info including settings, teams, current week
+# --- Playoff Odds Simulation -------------------------------------------------
+def _playoff_bye_count(playoff_teams: int) -> int:
+    """Byes needed to fill a single-elimination bracket (e.g. 6 teams -> 2 byes)."""
+    if playoff_teams <= 1:
+        return 0
+    return 2 ** math.ceil(math.log2(playoff_teams)) - playoff_teams
 
-    Examples:
-        - get_league() → Uses env var defaults
-        - get_league(year=2016) → Get 2016 season data
-        - get_league(year=2022, league_id=323196) → Explicit parameters
 
-    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+def _season_to_date(league: League) -> Dict[str, Any]:
     """
-    league = _get_league(league_id, year)
+    Current regular-season records plus the remaining regular-season schedule.
+
+    Teams are indexed in team_id order. A game is remaining when espn_api reports
+    its outcome as undecided ("U").
+    """
+    import numpy as np
+    teams = sorted(league.teams, key=lambda x: x.team_id)
+    slot = {t.team_id: i for i, t in enumerate(teams)}
+    reg_weeks = int(league.settings.reg_season_count)
+
+    wins = np.zeros(len(teams))
+    losses = np.zeros(len(teams))
+    ties = np.zeros(len(teams))
+    points = np.zeros(len(teams))
+    played: List[List[float]] = [[] for _ in teams]
+    remaining: Dict[Tuple[int, int, int], None] = {}
+    for i, t in enumerate(teams):
+        for k, (opponent, outcome, score) in enumerate(zip(t.schedule, t.outcomes, t.scores)):
+            if k >= reg_weeks or opponent.team_id == t.team_id:
+                continue
+            if outcome == "U":
+                j = slot[opponent.team_id]
+                remaining[(k + 1, min(i, j), max(i, j))] = None
+                continue
+            wins[i] += outcome == "W"
+            losses[i] += outcome == "L"
+            ties[i] += outcome == "T"
+            points[i] += score or 0.0
+            played[i].append(score or 0.0)
+
+    games = sorted(remaining)
     return {
-        "league_id": league.league_id,
-        "year": league.year,
-        "current_week": getattr(league, "current_week", None),
-        "nfl_week": getattr(league, "nfl_week", None),
-        "settings": _settings_dict(league.settings),
-        "teams": [_team_dict(t) for t in league.teams],
+        "teams": teams,
+        "wins": wins,
+        "losses": losses,
+        "ties": ties,
+        "points": points,
+        "played": played,
+        "weeks": sorted({g[0] for g in games}),
+        "game_weeks": [g[0] for g in games],
+        "home": np.array([g[1] for g in games], dtype=int),
+        "away": np.array([g[2] for g in games], dtype=int),
     }
 
 
-@mcp.tool
-def get_standings(
-    league_id: Optional[int] = None,
-    year: Optional[int] = None,
-) -> List[Dict[str, Any]]:
+def _score_model(played: List[List[float]]) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Get final season standings for any year, ranked by wins/losses.
-
-    Args:
-        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
-        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
-
-    Returns:
-        List of teams with rank, wins, losses, points for/against
+    Per-team normal scoring model from season-to-date points.
 
-    Examples:
-        - get_standings() → Current season standings (uses env vars)
-        - get_standings(year=2016) → 2016 season final standings
-        - get_standings(year=2022, league_id=323196) → Specific league/year
+    Means and standard deviations are shrunk toward the league average with a
+    weight of two games, so a team with one or two results is not over-fit.
+    """
+    import numpy as np
+    all_scores = [s for scores in played for s in scores]
+    league_mean = float(np.mean(all_scores)) if all_scores else 100.0
+    league_std = float(np.std(all_scores)) if len(all_scores) > 1 else 20.0
+    league_std = max(league_std, 1.0)
+    prior = 2.0
+    mean = np.empty(len(played))
+    std = np.empty(len(played))
+    for i, scores in enumerate(played):
+        n = len(scores)
+        team_mean = float(np.mean(scores)) if n else league_mean
+        team_var = float(np.var(scores)) if n > 1 else league_std ** 2
+        mean[i] = (n * team_mean + prior * league_mean) / (n + prior)
+        std[i] = math.sqrt((n * team_var + prior * league_std ** 2) / (n + prior))
+    return mean, std
+
+
+def _simulate_playoff_batch(
+    seed: np.random.SeedSequence,
+    size: int,
+    base_wins: np.ndarray,
+    base_points: np.ndarray,
+    home: np.ndarray,
+    away: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
+    divisions: List[np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate `size` seasons at once and return (seed counts, summed wins).
 
-    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    seed_counts[team, seed] counts how often a team finished with that seed.
+    Each batch draws from its own SeedSequence so results do not depend on
+    how batches are spread across workers.
     """
-    league = _get_league(league_id, year)
-    teams = league.standings()
-    return [
-        {
-            "rank": i + 1,
-            **_team_dict(t),
-        }
-        for i, t in enumerate(teams)
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    n = len(base_wins)
+    wins = np.tile(base_wins, (size, 1))
+    points = np.tile(base_points, (size, 1))
+    if len(home):
+        eye = np.eye(n)
+        home_onehot, away_onehot = eye[home], eye[away]
+        home_scores = np.maximum(rng.normal(mean[home], std[home], size=(size, len(home))), 0.0)
+        away_scores = np.maximum(rng.normal(mean[away], std[away], size=(size, len(away))), 0.0)
+        home_result = (home_scores > away_scores) + 0.5 * (home_scores == away_scores)
+        wins += home_result @ home_onehot + (1.0 - home_result) @ away_onehot
+        points += home_scores @ home_onehot + away_scores @ away_onehot
+
+    # Seed by wins, then points for; division winners are seeded first
+    key = wins * 1e5 + points
+    for members in divisions:
+        winner = members[np.argmax(key[:, members], axis=1)]
+        key[np.arange(size), winner] += 1e9
+    order = np.argsort(-key, axis=1)
+    flat = (order * n + np.arange(n)).ravel()
+    seed_counts = np.bincount(flat, minlength=n * n).reshape(n, n)
+    return seed_counts, wins.sum(axis=0)
+
+
+# Worker pools are started with "spawn": forking this process would copy the
+# logging listener, thread pools, and any locks they hold into the children.
+# Spawned workers import the module once, so pools are kept per worker count.
+_SIMULATION_POOLS: Dict[int, Any] = {}
+_SIMULATION_POOLS_LOCK = threading.Lock()
+
+
+def _simulation_pool(workers: int) -> Any:
+    """Shared process pool with `workers` spawned processes, created on first use."""
+    with _SIMULATION_POOLS_LOCK:
+        pool = _SIMULATION_POOLS.get(workers)
+        if pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _SIMULATION_POOLS[workers] = pool
+        return pool
+
+
+def _run_playoff_simulations(
+    state: Dict[str, Any],
+    simulations: int,
+    seed: Optional[int],
+    workers: int,
+    divisions: List[np.ndarray],
+    mean: np.ndarray,
+    std: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Split simulations into batches and run them serially or on a process pool."""
+    import numpy as np
+    base_wins = state["wins"] + 0.5 * state["ties"]
+    sizes = [SIMULATION_BATCH_SIZE] * (simulations // SIMULATION_BATCH_SIZE)
+    if simulations % SIMULATION_BATCH_SIZE:
+        sizes.append(simulations % SIMULATION_BATCH_SIZE)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [
+        (s, size, base_wins, state["points"], state["home"], state["away"], mean, std, divisions)
+        for s, size in zip(seeds, sizes)
     ]
 
+    n = len(base_wins)
+    seed_counts = np.zeros((n, n), dtype=np.int64)
+    win_totals = np.zeros(n)
+    if workers > 1 and len(args) > 1:
+        results = list(_simulation_pool(workers).map(_simulate_playoff_batch, *zip(*args)))
+    else:
+        results = [_simulate_playoff_batch(*a) for a in args]
+    for counts, wins in results:
+        seed_counts += counts
+        win_totals += wins
+    return seed_counts, win_totals
+
+
+# --- Clinch / Elimination Solver ---------------------------------------------
+# Exact search over remaining regular-season results. Playoff spots go to one
+# winner per division plus the best remaining records, and a team's status only
+# changes when its wins cross the target team's final total. Both questions
+# below are monotone in the other teams' wins, which gives cheap bounds and
+# lets most games be decided without branching.
+def _teams_ahead(
+    wins: List[float],
+    target: int,
+    divisions: List[List[int]],
+    threshold: float,
+    strict: bool,
+) -> int:
+    """
+    Playoff spots that must go to teams other than `target`.
 
-@mcp.tool
-def get_matchups(
-    week: Optional[int] = None,
-    league_id: Optional[int] = None,
+    A team counts as ahead when its wins reach `threshold` (strictly exceed it
+    when `strict`), which resolves ties against the target (strict=False) or in
+    its favor (strict=True). A target that leads its division is in outright;
+    otherwise every other division's winner takes a spot.
+    """
+    total = 0
+    for members in divisions:
+        above = sum(
+            1 for i in members
+            if i != target and (wins[i] > threshold if strict else wins[i] >= threshold)
+        )
+        if target in members:
+            if above == 0:
+                return 0
+            total += above
+        else:
+            total += 1 + max(0, above - 1)
+    return total
+
+
+def _search_outcomes(
+    wins: List[float],
+    games: List[Tuple[int, int]],
+    target: int,
+    divisions: List[List[int]],
+    spots: int,
+    miss: bool,
+    counter: List[int],
+) -> bool:
+    """
+    Depth-first search for one outcome of `games` that keeps `target` out of the
+    playoffs (miss=True) or gets it in (miss=False). The target's own games
+    must already be resolved in `wins`.
+    """
+    counter[0] += 1
+    threshold = wins[target]
+    remaining = [0] * len(wins)
+    for a, b in games:
+        remaining[a] += 1
+        remaining[b] += 1
+    best = [w + r for w, r in zip(wins, remaining)]
+    low = _teams_ahead(wins, target, divisions, threshold, strict=not miss)
+    high = _teams_ahead(best, target, divisions, threshold, strict=not miss)
+    if miss:
+        if low >= spots:
+            return True
+        if high < spots:
+            return False
+    else:
+        if high < spots:
+            return True
+        if low >= spots:
+            return False
+
+    def undecided(i: int) -> bool:
+        if miss:
+            return wins[i] < threshold <= best[i]
+        return wins[i] <= threshold < best[i]
+
+    # Games involving at most one undecided team have a dominant result: give
+    # the win to the undecided team when pushing the target out, and to the
+    # other team when pulling the target in. Only contested games branch.
+    wins = list(wins)
+    contested: List[Tuple[int, int]] = []
+    for a, b in games:
+        ua, ub = undecided(a), undecided(b)
+        if ua and ub:
+            contested.append((a, b))
+        elif ua or ub:
+            winner = (a if ua else b) if miss else (b if ua else a)
+            wins[winner] += 1
+    if not contested:
+        return _search_outcomes(wins, [], target, divisions, spots, miss, counter)
+
+    (a, b), rest = contested[0], contested[1:]
+    # Try the result that helps the goal most first: when pushing the target
+    # out, credit the team closer to the threshold; when pulling it in, the one
+    # further from it.
+    first, second = (a, b) if (wins[a] >= wins[b]) == miss else (b, a)
+    for winner in (first, second):
+        wins[winner] += 1
+        if _search_outcomes(wins, rest, target, divisions, spots, miss, counter):
+            return True
+        wins[winner] -= 1
+    return False
+
+
+def _can_miss_playoffs(wins, games, target, divisions, spots, counter) -> bool:
+    """Whether some outcome leaves `target` out; its remaining games are losses."""
+    wins = list(wins)
+    others = []
+    for a, b in games:
+        if target in (a, b):
+            wins[b if a == target else a] += 1
+        else:
+            others.append((a, b))
+    return _search_outcomes(wins, others, target, divisions, spots, True, counter)
+
+
+def _can_make_playoffs(wins, games, target, divisions, spots, counter) -> bool:
+    """Whether some outcome gets `target` in; its remaining games are wins."""
+    wins = list(wins)
+    others = []
+    for a, b in games:
+        if target in (a, b):
+            wins[target] += 1
+        else:
+            others.append((a, b))
+    return _search_outcomes(wins, others, target, divisions, spots, False, counter)
+
+
+def _final_seeds(wins: List[float], points: List[float], divisions: List[List[int]]) -> List[int]:
+    """Seed order once the regular season is over: division winners, then wins and points for."""
+    key = [(w, p) for w, p in zip(wins, points)]
+    winners = {max(members, key=lambda i: key[i]) for members in divisions} if len(divisions) > 1 else set()
+    return sorted(range(len(wins)), key=lambda i: (i not in winners, -key[i][0], -key[i][1]))
+
+
+# --- Player Search Index -----------------------------------------------------
+# Built once per season from league.player_map and team rosters. Names are
+# normalized and indexed three ways: a sorted list of full names and a sorted
+# list of name tokens (bisect gives trie-style prefix lookups), plus trigram
+# postings for fuzzy matches. Roster changes are applied incrementally.
+_NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+_PLAYER_INDEX: Dict[Tuple[int, int], Dict[str, Any]] = {}
+_PLAYER_DETAIL_CACHE: "OrderedDict[Tuple[int, int, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_PLAYER_DETAIL_LOCK = threading.Lock()
+_PLAYER_SEARCH_STATS = {"index_builds": 0, "roster_refreshes": 0, "detail_hits": 0, "detail_misses": 0}
+
+
+def _normalize_name(name: str) -> str:
+    """Lowercase, strip accents/punctuation and generational suffixes."""
+    text = unicodedata.normalize("NFKD", name or "").encode("ascii", "ignore").decode()
+    text = re.sub(r"[^a-z0-9/ ]+", "", text.lower().replace("-", " "))
+    tokens = [t for t in text.split() if t not in _NAME_SUFFIXES]
+    return " ".join(tokens)
+
+
+def _trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _player_index_add(index: Dict[str, Any], pid: int, name: str) -> Dict[str, Any]:
+    """Add a player to the index (no-op if present) and return its record."""
+    record = index["records"].get(pid)
+    if record is not None:
+        return record
+    norm = _normalize_name(name)
+    record = {
+        "player_id": pid,
+        "name": name,
+        "norm": norm,
+        "position": None,
+        "pro_team": None,
+        "on_team_id": None,
+        "team_name": None,
+    }
+    index["records"][pid] = record
+    bisect.insort(index["names"], (norm, pid))
+    for token in norm.split():
+        bisect.insort(index["tokens"], (token, pid))
+    for gram in _trigrams(norm):
+        index["trigrams"].setdefault(gram, []).append(pid)
+    return record
+
+
+def _player_index_sync(index: Dict[str, Any], league: League) -> None:
+    """Apply player_map additions and roster moves since the last sync."""
+    player_map = getattr(league, "player_map", {}) or {}
+    if len(player_map) != index["player_map_size"]:
+        for key, value in player_map.items():
+            if isinstance(key, int) and isinstance(value, str):
+                _player_index_add(index, key, value)
+        index["player_map_size"] = len(player_map)
+
+    changed = False
+    for team in league.teams:
+        roster = list(getattr(team, "roster", []) or [])
+        signature = tuple(sorted(getattr(p, "playerId", 0) for p in roster))
+        if index["rosters"].get(team.team_id) == signature:
+            continue
+        changed = True
+        for pid in index["rosters"].get(team.team_id, ()):
+            record = index["records"].get(pid)
+            if record is not None and record["on_team_id"] == team.team_id:
+                record["on_team_id"] = record["team_name"] = None
+        for p in roster:
+            record = _player_index_add(index, p.playerId, p.name)
+            record.update({
+                "position": getattr(p, "position", None) or record["position"],
+                "pro_team": getattr(p, "proTeam", None) or record["pro_team"],
+                "on_team_id": team.team_id,
+                "team_name": team.team_name,
+            })
+        index["rosters"][team.team_id] = signature
+    if changed and index["built"]:
+        _PLAYER_SEARCH_STATS["roster_refreshes"] += 1
+    index["built"] = True
+
+
+def _player_index(league: League) -> Dict[str, Any]:
+    """Return the search index for a league season, syncing roster changes."""
+    key = (int(league.league_id), int(league.year))
+    with _INDEX_LOCK:
+        index = _PLAYER_INDEX.get(key)
+        if index is None:
+            index = {
+                "records": {}, "names": [], "tokens": [], "trigrams": {},
+                "rosters": {}, "player_map_size": -1, "built": False,
+            }
+            _PLAYER_INDEX[key] = index
+            _PLAYER_SEARCH_STATS["index_builds"] += 1
+        _player_index_sync(index, league)
+        return index
+
+
+def _prefix_matches(entries: List[Tuple[str, int]], prefix: str) -> List[int]:
+    start = bisect.bisect_left(entries, (prefix, -1))
+    out = []
+    for text, pid in entries[start:]:
+        if not text.startswith(prefix):
+            break
+        out.append(pid)
+    return out
+
+
+def _search_player_index(
+    index: Dict[str, Any],
+    query: str,
+    limit: int = 10,
+    position: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Ranked candidates for a name query.
+
+    Scores: exact name 1.0, name prefix 0.95, exact token such as a last name
+    0.9, token prefix 0.8, otherwise trigram similarity scaled to at most 0.75.
+    Rostered players win ties.
+    """
+    norm = _normalize_name(query)
+    if not norm:
+        return []
+    scores: Dict[int, float] = {}
+
+    def credit(pids, score):
+        for pid in pids:
+            if scores.get(pid, 0.0) < score:
+                scores[pid] = score
+
+    credit(_prefix_matches(index["names"], norm), 0.95)
+    credit([pid for n, pid in index["names"][bisect.bisect_left(index["names"], (norm, -1)):] if n == norm][:50], 1.0)
+    if " " not in norm:
+        credit([pid for t, pid in index["tokens"][bisect.bisect_left(index["tokens"], (norm, -1)):] if t == norm][:200], 0.9)
+        credit(_prefix_matches(index["tokens"], norm)[:200], 0.8)
+
+    grams = _trigrams(norm)
+    counts: Dict[int, int] = {}
+    for gram in grams:
+        for pid in index["trigrams"].get(gram, ()):
+            counts[pid] = counts.get(pid, 0) + 1
+    for pid, common in counts.items():
+        size = len(_trigrams(index["records"][pid]["norm"]))
+        similarity = 2.0 * common / (len(grams) + size)
+        if similarity >= 0.3:
+            credit([pid], round(0.75 * similarity, 4))
+
+    records = index["records"]
+    if position:
+        wanted = position.upper()
+        scores = {pid: s for pid, s in scores.items() if (records[pid]["position"] or "").upper() == wanted}
+    ranked = sorted(
+        scores.items(),
+        key=lambda kv: (-kv[1], records[kv[0]]["on_team_id"] is None, records[kv[0]]["name"]),
+    )[:limit]
+    return [
+        {k: v for k, v in {**records[pid], "score": score}.items() if k != "norm"}
+        for pid, score in ranked
+    ]
+
+
+# --- Player Points Store -----------------------------------------------------
+# Per-season columnar table with one row per rostered player per finished week,
+# filled from league.box_scores() one week at a time and persisted like the
+# head-to-head index. Player names and eligible lineup slots are stored once
+# per player in side tables, along with the league's starting slot counts.
+PLAYER_POINTS_VERSION = 2
+_PLAYER_POINTS_COLUMNS = ("player_id", "week", "team_id", "slot", "position", "points", "projected")
+_PLAYER_POINTS: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+
+def _box_score_rows(league: League, week: int) -> List[Tuple[Optional[int], Dict[str, Any]]]:
+    """(team_id, player dict) for every rostered player in one week's box scores."""
+    rows = []
+    for matchup in league.box_scores(week=week):
+        for side in ("home", "away"):
+            team = getattr(matchup, f"{side}_team", None)
+            for bp in getattr(matchup, f"{side}_lineup", []) or []:
+                rows.append((getattr(team, "team_id", None), _lineup_player_dict(bp)))
+    return rows
+
+
+def _player_points_store(lid: int, yr: int) -> Dict[str, Any]:
+    """
+    Return the player-points store for a season, fetching box scores for newly final weeks.
+
+    Box scores are fetched without holding _INDEX_LOCK; the lock is only taken
+    to merge them. Merges build a new store, so callers reading a store they
+    were handed never see half-appended columns.
+    """
+    key = (lid, yr)
+    with _INDEX_LOCK:
+        store = _PLAYER_POINTS.get(key)
+        if store is None:
+            store = _persist_load("player_points", lid, yr)
+            if store is not None and store.get("version") != PLAYER_POINTS_VERSION:
+                store = None
+        if store is not None and store["complete"]:
+            _PLAYER_POINTS[key] = store
+            return store
+        stored = set(store["weeks"]) if store else set()
+
+    board = _season_scoreboard(lid, yr)
+    new_weeks = [w for w in board["final_weeks"] if w not in stored]
+    fetched: Dict[int, List[Tuple[Optional[int], Dict[str, Any]]]] = {}
+    slot_counts = None
+    if new_weeks:
+        if yr < 2019:
+            raise RuntimeError(
+                f"Player points for {yr} are unavailable: ESPN box scores only exist for seasons 2019+."
+            )
+        start_time = time.time()
+        league = _get_league(lid, yr)
+        # box_scores() silently swaps in the current week for later weeks, so a
+        # cached League that predates the scoreboard is reloaded first
+        if max(new_weeks) > league.current_week:
+            league = _reload_league(lid, yr)
+        slot_counts = {
+            slot: count for slot, count in league.settings.position_slot_counts.items()
+            if count and slot not in ("BE", "IR")
+        }
+        for week in new_weeks:
+            if week <= league.current_week:
+                fetched[week] = _box_score_rows(league, week)
+        logger.info(
+            "Updated player points store",
+            extra={
+                "league_id": lid,
+                "year": yr,
+                "weeks_added": len(fetched),
+                "duration_ms": int((time.time() - start_time) * 1000),
+                "status": "success"
+            }
+        )
+
+    with _INDEX_LOCK:
+        # Another call may have merged some of these weeks (or cleared the cache) meanwhile
+        current = _PLAYER_POINTS.get(key, store) or {
+            "version": PLAYER_POINTS_VERSION,
+            "weeks": [],
+            "complete": False,
+            "names": {},
+            "eligible": {},
+            "slot_counts": {},
+            "columns": {name: [] for name in _PLAYER_POINTS_COLUMNS},
+        }
+        known = set(current["weeks"])
+        weeks = [w for w in sorted(fetched) if w not in known]
+        if weeks:
+            current = {
+                **current,
+                "weeks": current["weeks"] + weeks,
+                "names": dict(current["names"]),
+                "eligible": dict(current["eligible"]),
+                "slot_counts": slot_counts,
+                "columns": {name: list(values) for name, values in current["columns"].items()},
+            }
+            columns = current["columns"]
+            for week in weeks:
+                for team_id, p in fetched[week]:
+                    current["names"][str(p["player_id"])] = p["name"]
+                    current["eligible"][str(p["player_id"])] = p["eligible_slots"]
+                    columns["player_id"].append(p["player_id"])
+                    columns["week"].append(week)
+                    columns["team_id"].append(team_id)
+                    columns["slot"].append(p["slot"])
+                    columns["position"].append(p["position"])
+                    columns["points"].append(round(float(p["points"] or 0.0), 2))
+                    columns["projected"].append(round(float(p["projected"] or 0.0), 2))
+
+        complete = board["complete"] and set(board["final_weeks"]) <= set(current["weeks"])
+        changed = bool(weeks) or current["complete"] != complete
+        current = {**current, "complete": complete}
+        if changed:
+            _persist_save("player_points", lid, yr, current)
+        _PLAYER_POINTS[key] = current
+        return current
+
+
+def _player_leaderboard(
+    store: Dict[str, Any],
+    position: Optional[str],
+    start_week: int,
+    end_week: int,
+    top_k: int,
+) -> List[Dict[str, Any]]:
+    """
+    Top players by total points over a week range.
+
+    Rows are filtered and summed per player with NumPy; heapq.nlargest then
+    picks the top_k without sorting every player.
+    """
+    import numpy as np
+    columns = store["columns"]
+    if not columns["player_id"]:
+        return []
+    player_ids = np.asarray(columns["player_id"], dtype=np.int64)
+    weeks = np.asarray(columns["week"], dtype=np.int64)
+    mask = (weeks >= start_week) & (weeks <= end_week)
+    if position:
+        mask &= np.char.upper(np.asarray(columns["position"], dtype=str)) == position.upper()
+    if not mask.any():
+        return []
+
+    ids, codes = np.unique(player_ids[mask], return_inverse=True)
+    totals = np.bincount(codes, weights=np.asarray(columns["points"], dtype=float)[mask])
+    projected = np.bincount(codes, weights=np.asarray(columns["projected"], dtype=float)[mask])
+    games = np.bincount(codes)
+    slots = np.asarray(columns["slot"], dtype=str)[mask]
+    starts = np.bincount(codes, weights=~np.isin(slots, ("BE", "IR")))
+
+    # Last row per player gives their most recent position and fantasy team
+    last_row = np.zeros(len(ids), dtype=np.int64)
+    last_row[codes] = np.flatnonzero(mask)
+
+    leaders = heapq.nlargest(top_k, range(len(ids)), key=lambda i: (totals[i], -ids[i]))
+    out = []
+    for rank, i in enumerate(leaders, 1):
+        row = int(last_row[i])
+        out.append({
+            "rank": rank,
+            "player_id": int(ids[i]),
+            "name": store["names"].get(str(int(ids[i]))),
+            "position": columns["position"][row],
+            "team_id": columns["team_id"][row],
+            "total_points": round(float(totals[i]), 2),
+            "avg_points": round(float(totals[i] / games[i]), 2),
+            "projected_points": round(float(projected[i]), 2),
+            "weeks": int(games[i]),
+            "starts": int(starts[i]),
+        })
+    return out
+
+
+# --- Optimal Lineups ---------------------------------------------------------
+# Best possible starting lineup per team per finished week, computed from the
+# player-points store and persisted per week. Lineups that can be filled form a
+# transversal matroid, so taking players from highest score down and keeping
+# each one that still fits (checked with an augmenting path) is optimal.
+OPTIMAL_LINEUP_VERSION = 2
+_OPTIMAL_LINEUPS: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+
+def _optimal_lineup(
+    players: List[Tuple[float, int, List[str]]],
+    slot_counts: Dict[str, int],
+) -> Tuple[float, Dict[int, str]]:
+    """
+    Maximum-points assignment of players to starting slots.
+
+    players: (points, player_id, eligible slot labels). Returns the optimal
+    total and a player_id -> slot assignment. Slots may stay empty, so players
+    with no positive points are never started.
+    """
+    seats = [slot for slot, count in slot_counts.items() for _ in range(count)]
+    seat_owner: List[Optional[int]] = [None] * len(seats)
+    eligible = {pid: set(slots) for _, pid, slots in players}
+
+    def place(pid: int, visited: List[bool]) -> bool:
+        for s, slot in enumerate(seats):
+            if visited[s] or slot not in eligible[pid]:
+                continue
+            visited[s] = True
+            if seat_owner[s] is None or place(seat_owner[s], visited):
+                seat_owner[s] = pid
+                return True
+        return False
+
+    total = 0.0
+    for points, pid, _ in sorted(players, key=lambda p: (-p[0], p[1])):
+        if points <= 0 or len([o for o in seat_owner if o is not None]) == len(seats):
+            break
+        if place(pid, [False] * len(seats)):
+            total += points
+    return round(total, 2), {pid: seats[s] for s, pid in enumerate(seat_owner) if pid is not None}
+
+
+def _optimal_lineup_index(lid: int, yr: int) -> Dict[str, Any]:
+    """Return per-week optimal lineup results for a season, solving only newly stored weeks."""
+    import numpy as np
+    key = (lid, yr)
+    with _INDEX_LOCK:
+        index = _OPTIMAL_LINEUPS.get(key)
+        if index is None:
+            index = _persist_load("optimal_lineups", lid, yr)
+            if index is not None and index.get("version") != OPTIMAL_LINEUP_VERSION:
+                index = None
+        if index is not None and index["complete"]:
+            _OPTIMAL_LINEUPS[key] = index
+            return index
+
+    # Fill the store (which may fetch box scores) before taking the lock again
+    store = _player_points_store(lid, yr)
+    teams_by_id = _season_scoreboard(lid, yr)["teams"]
+    with _INDEX_LOCK:
+        index = _OPTIMAL_LINEUPS.get(key, index)
+        if index is None:
+            index = {"version": OPTIMAL_LINEUP_VERSION, "weeks": {}, "complete": False}
+        new_weeks = [w for w in store["weeks"] if str(w) not in index["weeks"]]
+        if new_weeks:
+            columns = store["columns"]
+            week_col = np.asarray(columns["week"])
+            for week in new_weeks:
+                teams: Dict[Any, Dict[str, Any]] = {}
+                for row in np.flatnonzero(week_col == week):
+                    pid, slot, points = columns["player_id"][row], columns["slot"][row], columns["points"][row]
+                    team = teams.setdefault(
+                        columns["team_id"][row], {"actual": 0.0, "bench": 0.0, "ir": 0.0, "players": []}
+                    )
+                    if slot == "IR":
+                        team["ir"] += points
+                        continue
+                    eligible = store["eligible"].get(str(pid), [])
+                    if slot == "BE":
+                        team["bench"] += points
+                    else:
+                        team["actual"] += points
+                        if slot not in eligible:
+                            # e.g. a mid-season position change: starting there shows
+                            # the player could fill the slot
+                            eligible = eligible + [slot]
+                            logger.warning(
+                                "Started slot missing from eligible slots",
+                                extra={"league_id": lid, "year": yr, "week": week, "player_id": pid, "slot": slot}
+                            )
+                    team["players"].append((points, pid, eligible))
+                results = {}
+                for tid, team in teams.items():
+                    optimal, lineup = _optimal_lineup(team["players"], store["slot_counts"])
+                    actual = round(team["actual"], 2)
+                    if optimal < actual:
+                        logger.warning(
+                            "Optimal lineup scored below actual lineup",
+                            extra={"league_id": lid, "year": yr, "week": week, "team_id": tid,
+                                   "optimal": optimal, "actual": actual}
+                        )
+                    results[str(tid)] = {
+                        "actual": actual,
+                        "optimal": optimal,
+                        "bench_points": round(team["bench"], 2),
+                        "ir_points": round(team["ir"], 2),
+                        "optimal_lineup": {str(pid): slot for pid, slot in lineup.items()},
+                    }
+                index["weeks"][str(week)] = results
+
+        complete = store["complete"]
+        if new_weeks or index["complete"] != complete:
+            index["complete"] = complete
+            index["slot_counts"] = store["slot_counts"]
+            index["teams"] = {str(tid): t["name"] for tid, t in teams_by_id.items()}
+            _persist_save("optimal_lineups", lid, yr, index)
+        _OPTIMAL_LINEUPS[key] = index
+        return index
+
+
+# --- Projection Accuracy -----------------------------------------------------
+# Sufficient statistics (count, sums of projected/actual/abs error/squared
+# error, per-bucket sums) per group, aggregated from the player-points store
+# with NumPy. Finished seasons are aggregated once and persisted; summing the
+# statistics merges seasons without touching player rows again.
+PROJECTION_ACCURACY_VERSION = 1
+PROJECTION_GROUPS = ("position", "team", "week")
+PROJECTION_BUCKETS = (0.0, 5.0, 10.0, 15.0, 20.0, 25.0)
+_PROJECTION_STATS = ("n", "projected", "actual", "abs_error", "sq_error")
+_PROJECTION_ACCURACY: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+
+def _projection_group_stats(store: Dict[str, Any], group_by: str) -> Dict[str, Dict[str, Any]]:
+    """Per-group error sums for every player-week with a positive projection."""
+    import numpy as np
+    columns = store["columns"]
+    projected = np.asarray(columns["projected"], dtype=float)
+    mask = projected > 0
+    if not mask.any():
+        return {}
+    projected = projected[mask]
+    actual = np.asarray(columns["points"], dtype=float)[mask]
+    column = {"position": "position", "team": "team_id", "week": "week"}[group_by]
+    keys, codes = np.unique(np.asarray([str(v) for v in columns[column]])[mask], return_inverse=True)
+
+    error = actual - projected
+    sums = {
+        "n": np.bincount(codes, minlength=len(keys)),
+        "projected": np.bincount(codes, weights=projected, minlength=len(keys)),
+        "actual": np.bincount(codes, weights=actual, minlength=len(keys)),
+        "abs_error": np.bincount(codes, weights=np.abs(error), minlength=len(keys)),
+        "sq_error": np.bincount(codes, weights=error ** 2, minlength=len(keys)),
+    }
+    nb = len(PROJECTION_BUCKETS)
+    cells = codes * nb + (np.digitize(projected, PROJECTION_BUCKETS) - 1)
+    bucket_n = np.bincount(cells, minlength=len(keys) * nb).reshape(len(keys), nb)
+    bucket_proj = np.bincount(cells, weights=projected, minlength=len(keys) * nb).reshape(len(keys), nb)
+    bucket_act = np.bincount(cells, weights=actual, minlength=len(keys) * nb).reshape(len(keys), nb)
+
+    return {
+        str(key): {
+            **{name: float(sums[name][i]) for name in _PROJECTION_STATS},
+            "buckets": [
+                [int(bucket_n[i, b]), float(bucket_proj[i, b]), float(bucket_act[i, b])] for b in range(nb)
+            ],
+        }
+        for i, key in enumerate(keys)
+    }
+
+
+def _projection_season_stats(lid: int, yr: int) -> Dict[str, Any]:
+    """Aggregated projection statistics for a season; finished seasons are computed once."""
+    key = (lid, yr)
+    with _INDEX_LOCK:
+        cached = _PROJECTION_ACCURACY.get(key)
+        if cached is None:
+            cached = _persist_load("projection_accuracy", lid, yr)
+            if cached is not None and cached.get("version") != PROJECTION_ACCURACY_VERSION:
+                cached = None
+        if cached is not None and cached["complete"]:
+            _PROJECTION_ACCURACY[key] = cached
+            return cached
+
+    # The store may fetch box scores, so it is filled and aggregated outside the lock
+    store = _player_points_store(lid, yr)
+    stats = {
+        "version": PROJECTION_ACCURACY_VERSION,
+        "complete": store["complete"],
+        "weeks": list(store["weeks"]),
+        "teams": {str(tid): t["name"] for tid, t in _season_scoreboard(lid, yr)["teams"].items()},
+        "groups": {group_by: _projection_group_stats(store, group_by) for group_by in PROJECTION_GROUPS},
+    }
+    with _INDEX_LOCK:
+        if stats["complete"]:
+            _persist_save("projection_accuracy", lid, yr, stats)
+        _PROJECTION_ACCURACY[key] = stats
+        return stats
+
+
+def _projection_summary(sums: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn summed statistics into MAE, bias, RMSE, and calibration buckets."""
+    n = sums["n"]
+    edges = list(PROJECTION_BUCKETS) + [None]
+    calibration = []
+    for b, (count, proj, act) in enumerate(sums["buckets"]):
+        if not count:
+            continue
+        low, high = edges[b], edges[b + 1]
+        calibration.append({
+            "bucket": f"{low:g}-{high:g}" if high is not None else f"{low:g}+",
+            "n": count,
+            "mean_projected": round(proj / count, 2),
+            "mean_actual": round(act / count, 2),
+        })
+    return {
+        "n": int(n),
+        "mean_projected": round(sums["projected"] / n, 2),
+        "mean_actual": round(sums["actual"] / n, 2),
+        "mae": round(sums["abs_error"] / n, 3),
+        "bias": round((sums["actual"] - sums["projected"]) / n, 3),
+        "rmse": round(math.sqrt(sums["sq_error"] / n), 3),
+        "calibration": calibration,
+    }
+
+
+def _merge_projection_sums(target: Dict[str, Any], sums: Dict[str, Any]) -> None:
+    for name in _PROJECTION_STATS:
+        target[name] = target.get(name, 0.0) + sums[name]
+    buckets = target.setdefault("buckets", [[0, 0.0, 0.0] for _ in PROJECTION_BUCKETS])
+    for total, cell in zip(buckets, sums["buckets"]):
+        for i in range(3):
+            total[i] += cell[i]
+
+
+# --- League Activity Log -----------------------------------------------------
+# Per-season transaction log kept as compact rows (one per message) with a
+# cursor at the newest topic seen. A sync pages through ESPN's communication
+# feed newest first and stops at the first topic already stored, so repeat
+# calls fetch only new activity. Logs are persisted; finished seasons are frozen.
+ACTIVITY_LOG_VERSION = 1
+_ACTIVITY_FIELDS = ("topic_id", "date", "action", "team_id", "player_id", "bid_amount", "to_team_id")
+_ACTIVITY_MESSAGE_TYPES = [178, 180, 179, 239, 181, 244]
+_TRANSACTION_TYPES = {
+    "add": {"FA ADDED", "WAIVER ADDED"},
+    "fa": {"FA ADDED"},
+    "waiver": {"WAIVER ADDED"},
+    "drop": {"DROPPED"},
+    "trade": {"TRADED"},
+}
+_ACTIVITY_LOGS: Dict[Tuple[int, int], Dict[str, Any]] = {}
+_ACTIVITY_STATS = {"syncs": 0, "pages_fetched": 0, "entries_added": 0}
+
+
+def _activity_rows(topic: Dict[str, Any]) -> List[List[Any]]:
+    """Flatten one ESPN activity topic into log rows (see _ACTIVITY_FIELDS)."""
+    activity_map = _espn().ACTIVITY_MAP
+    rows = []
+    for msg in topic.get("messages", []):
+        msg_id = msg.get("messageTypeId")
+        action = activity_map.get(msg_id, "UNKNOWN")
+        if msg_id == 244:
+            team_id, to_team_id = msg.get("from"), msg.get("to")
+        else:
+            team_id, to_team_id = msg.get("for") if msg_id == 239 else msg.get("to"), None
+        bid = msg.get("from", 0) if action == "WAIVER ADDED" else 0
+        rows.append([topic.get("id"), topic.get("date"), action, team_id, msg.get("targetId"), bid, to_team_id])
+    return rows
+
+
+def _activity_log(lid: int, yr: int) -> Dict[str, Any]:
+    """
+    Return the activity log for a season, fetching only topics newer than the cursor.
+
+    Pages are fetched without holding _INDEX_LOCK; the lock is only taken to
+    merge new rows and advance the cursor.
+    """
+    key = (lid, yr)
+    with _INDEX_LOCK:
+        log = _ACTIVITY_LOGS.get(key)
+        if log is None:
+            log = _persist_load("activity", lid, yr)
+            if log is not None and log.get("version") != ACTIVITY_LOG_VERSION:
+                log = None
+        if log is not None and (log["complete"] or time.time() - log["synced_at"] < ACTIVITY_TTL_SECONDS):
+            _ACTIVITY_LOGS[key] = log
+            return log
+        if yr < 2019:
+            raise RuntimeError(f"League activity for {yr} is unavailable: ESPN only provides it for seasons 2019+.")
+
+        if log is None:
+            log = {"version": ACTIVITY_LOG_VERSION, "cursor": 0, "complete": False, "synced_at": 0.0, "entries": []}
+        seen = {row[0] for row in log["entries"]}
+        cursor = log["cursor"]
+
+    client = _espn_requests(lid, yr)
+    new_rows: List[List[Any]] = []
+    offset = pages = 0
+    start_time = time.time()
+    try:
+        complete = _season_scoreboard(lid, yr)["complete"]
+        while True:
+            filters = {"topics": {
+                "filterType": {"value": ["ACTIVITY_TRANSACTIONS"]},
+                "limit": ACTIVITY_PAGE_SIZE,
+                "limitPerMessageSet": {"value": 25},
+                "offset": offset,
+                "sortMessageDate": {"sortPriority": 1, "sortAsc": False},
+                "sortFor": {"sortPriority": 2, "sortAsc": False},
+                "filterIncludeMessageTypeIds": {"value": _ACTIVITY_MESSAGE_TYPES},
+            }}
+            data = client.league_get(
+                extend="/communication/",
+                params={"view": "kona_league_communication"},
+                headers={"x-fantasy-filter": json.dumps(filters)},
+            )
+            topics = data.get("topics", [])
+            pages += 1
+            caught_up = False
+            for topic in topics:
+                if topic.get("id") in seen or topic.get("date", 0) < cursor:
+                    caught_up = True
+                    break
+                new_rows.extend(_activity_rows(topic))
+            if caught_up or len(topics) < ACTIVITY_PAGE_SIZE:
+                break
+            offset += ACTIVITY_PAGE_SIZE
+    except Exception as e:
+        logger.warning(
+            "Failed to sync league activity",
+            extra={"league_id": lid, "year": yr, "error": str(e), "status": "error"}
+        )
+        if log["synced_at"]:
+            return log  # serve the stale log rather than failing
+        raise RuntimeError(f"League activity for {yr} could not be loaded: {e}") from e
+
+    with _INDEX_LOCK:
+        # Another call may have synced meanwhile; skip topics it already added
+        current = _ACTIVITY_LOGS.get(key, log)
+        known = {row[0] for row in current["entries"]}
+        added = [row for row in new_rows if row[0] not in known]
+        # Pages arrive newest first; the log is kept oldest first
+        entries = current["entries"] + sorted(added, key=lambda row: row[1])
+        log = {
+            **current,
+            "entries": entries,
+            "cursor": entries[-1][1] if entries else current["cursor"],
+            "complete": complete,
+            "synced_at": time.time(),
+        }
+        _ACTIVITY_STATS["syncs"] += 1
+        _ACTIVITY_STATS["pages_fetched"] += pages
+        _ACTIVITY_STATS["entries_added"] += len(added)
+        _persist_save("activity", lid, yr, log)
+        _ACTIVITY_LOGS[key] = log
+    logger.info(
+        "Synced league activity",
+        extra={
+            "league_id": lid,
+            "year": yr,
+            "pages": pages,
+            "entries_added": len(added),
+            "duration_ms": int((time.time() - start_time) * 1000),
+            "status": "success"
+        }
+    )
+    return log
+
+
+def _parse_since(since: Union[int, str, None]) -> Optional[int]:
+    """Epoch milliseconds from an int/digit string or an ISO date like "2024-10-01"."""
+    if since is None or since == "":
+        return None
+    if isinstance(since, (int, float)) or str(since).strip().isdigit():
+        return int(since)
+    parsed = datetime.fromisoformat(str(since).strip())
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+# --- Draft History -----------------------------------------------------------
+# Completed drafts never change, so each one is fetched once (picks and teams in
+# a single mDraftDetail request, names from the season's pro player list) and
+# persisted for good. Seasons are fetched on a thread pool since the work is
+# network-bound; leagues that have not drafted yet are re-checked after
+# SCOREBOARD_TTL_SECONDS.
+DRAFT_VERSION = 1
+_DRAFT_FIELDS = (
+    "overall", "round", "round_pick", "team_id", "player_id", "player",
+    "bid_amount", "keeper", "nominating_team_id",
+)
+_DRAFTS: Dict[Tuple[int, int], Dict[str, Any]] = {}
+_DRAFT_LOCK = threading.Lock()
+
+
+def _fetch_draft(lid: int, yr: int) -> Dict[str, Any]:
+    client = _espn_requests(lid, yr)
+    using_auth = ESPN_S2 is not None or SWID is not None
+    try:
+        data = client.league_get(params={"view": ["mDraftDetail", "mTeam"]})
+        detail = data.get("draftDetail", {})
+        names: Dict[int, str] = {}
+        if detail.get("drafted"):
+            names = {p["id"]: p.get("fullName") for p in client.get_pro_players() if "id" in p}
+    except Exception as e:
+        logger.error(
+            "Failed to load draft",
+            extra={"league_id": lid, "year": yr, "authenticated": using_auth, "status": "error"}
+        )
+        raise _league_load_error(lid, yr, using_auth) from e
+
+    teams = {}
+    for t in data.get("teams", []):
+        name = t.get("name") or f"{t.get('location', 'Unknown')} {t.get('nickname', 'Unknown')}"
+        teams[str(t["id"])] = {"id": t["id"], "abbrev": t.get("abbrev"), "name": name}
+    picks = [
+        [
+            p.get("overallPickNumber") or i + 1, p.get("roundId"), p.get("roundPickNumber"),
+            p.get("teamId"), p.get("playerId"), names.get(p.get("playerId")),
+            p.get("bidAmount") or 0, bool(p.get("keeper")), p.get("nominatingTeamId") or None,
+        ]
+        for i, p in enumerate(detail.get("picks", []))
+    ]
+    return {
+        "version": DRAFT_VERSION,
+        "drafted": bool(detail.get("drafted")),
+        "auction": any(pick[6] for pick in picks),
+        "teams": teams,
+        "picks": picks,
+        "fetched_at": time.time(),
+    }
+
+
+def _cached_draft(lid: int, yr: int) -> Optional[Dict[str, Any]]:
+    key = (lid, yr)
+    with _DRAFT_LOCK:
+        draft = _DRAFTS.get(key)
+        if draft is None:
+            draft = _persist_load("draft", lid, yr)
+            if draft is not None and draft.get("version") == DRAFT_VERSION:
+                _DRAFTS[key] = draft
+            else:
+                draft = None
+    if draft is not None and (draft["drafted"] or time.time() - draft["fetched_at"] < SCOREBOARD_TTL_SECONDS):
+        return draft
+    return None
+
+
+def _load_draft(lid: int, yr: int) -> Dict[str, Any]:
+    """Return a season's draft, fetching and persisting it on first use."""
+    draft = _cached_draft(lid, yr)
+    if draft is not None:
+        return draft
+    draft = _fetch_draft(lid, yr)
+    with _DRAFT_LOCK:
+        _DRAFTS[(lid, yr)] = draft
+    if draft["drafted"]:
+        _persist_save("draft", lid, yr, draft)
+    return draft
+
+
+def _load_drafts(lid: int, years: List[int]) -> Tuple[Dict[int, Dict[str, Any]], List[Dict[str, Any]]]:
+    """Load several seasons' drafts, fetching uncached ones concurrently."""
+    drafts: Dict[int, Dict[str, Any]] = {}
+    skipped: List[Dict[str, Any]] = []
+    missing = []
+    for yr in years:
+        draft = _cached_draft(lid, yr)
+        if draft is not None:
+            drafts[yr] = draft
+        else:
+            missing.append(yr)
+    if missing:
+        workers = max(1, min(DRAFT_FETCH_WORKERS, len(missing)))
+        with _phase("espn", "draft.fetch", years=len(missing)), ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {yr: pool.submit(_worker_context().run, _load_draft, lid, yr) for yr in missing}
+        for yr, future in futures.items():
+            try:
+                drafts[yr] = future.result()
+            except RuntimeError as e:
+                skipped.append({"year": yr, "error": str(e)})
+    return dict(sorted(drafts.items())), skipped
+
+
+def _draft_picks(
+    draft: Dict[str, Any],
+    team_id: Optional[Union[int, str]],
+    round_num: Optional[int],
+) -> List[Dict[str, Any]]:
+    """Picks as dicts, filtered by team (id, abbreviation, or name) and round."""
+    teams = draft["teams"]
+    tid = _resolve_team_id(teams, team_id) if team_id is not None else None
+    if team_id is not None and tid is None:
+        return []
+    picks = []
+    for row in draft["picks"]:
+        pick = dict(zip(_DRAFT_FIELDS, row))
+        if (tid is not None and pick["team_id"] != tid) or (round_num is not None and pick["round"] != round_num):
+            continue
+        team = teams.get(str(pick["team_id"]), {})
+        pick["team"] = team.get("name")
+        pick["team_abbrev"] = team.get("abbrev")
+        picks.append(pick)
+    return picks
+
+
+# --- Free Agent Pool ---------------------------------------------------------
+# One unfiltered free-agent request per (league, year, week) fills a pool that
+# is reused for FREE_AGENT_TTL_SECONDS; position filters, sorting and top-N
+# slicing all happen locally on that pool.
+FREE_AGENT_SORTS = {
+    "owned": "percent_owned",
+    "projected": "projected",
+    "points": "points",
+    "started": "percent_started",
+}
+_FREE_AGENT_POOLS: Dict[Tuple[int, int, int], Dict[str, Any]] = {}
+_FREE_AGENT_STATS = {"hits": 0, "misses": 0}
+
+
+def _free_agent_pool(league: League, week: int) -> Dict[str, Any]:
+    """Return the cached free-agent pool for a week, refetching after the TTL."""
+    key = (int(league.league_id), int(league.year), int(week))
+    pool = _FREE_AGENT_POOLS.get(key)
+    if pool is not None and time.time() - pool["fetched_at"] < FREE_AGENT_TTL_SECONDS:
+        _FREE_AGENT_STATS["hits"] += 1
+        return pool
+
+    _FREE_AGENT_STATS["misses"] += 1
+    start_time = time.time()
+    try:
+        players = league.free_agents(week=week, size=FREE_AGENT_POOL_SIZE)
+    except Exception as e:
+        raise RuntimeError(f"Free agents unavailable for {league.year} week {week}: {e}") from e
+    pool = {
+        "fetched_at": time.time(),
+        "players": [
+            {
+                **_lineup_player_dict(p),
+                "percent_owned": getattr(p, "percent_owned", None),
+                "percent_started": getattr(p, "percent_started", None),
+            }
+            for p in players
+        ],
+    }
+    _FREE_AGENT_POOLS[key] = pool
+    logger.info(
+        "Fetched free agent pool",
+        extra={
+            "league_id": key[0],
+            "year": key[1],
+            "week": week,
+            "players": len(pool["players"]),
+            "duration_ms": int((time.time() - start_time) * 1000),
+            "status": "success"
+        }
+    )
+    return pool
+
+
+def _team_dict(t) -> Dict[str, Any]:
+    if t is None:
+        return {}
+    return {
+        "id": getattr(t, "team_id", None),
+        "abbrev": getattr(t, "team_abbrev", None),
+        "name": getattr(t, "team_name", None),
+        "division_id": getattr(t, "division_id", None),
+        "division_name": getattr(t, "division_name", None),
+        "wins": getattr(t, "wins", None),
+        "losses": getattr(t, "losses", None),
+        "ties": getattr(t, "ties", None),
+        "points_for": getattr(t, "points_for", None),
+        "points_against": getattr(t, "points_against", None),
+        "waiver_rank": getattr(t, "waiver_rank", None),
+        "streak_type": getattr(t, "streak_type", None),
+        "streak_length": getattr(t, "streak_length", None),
+        "standing": getattr(t, "standing", None),
+        "final_standing": getattr(t, "final_standing", None),
+        "logo_url": getattr(t, "logo_url", None),
+    }
+
+
+def _box_player_dict(bp) -> Dict[str, Any]:
+    if bp is None:
+        return {}
+    return {
+        "name": getattr(bp, "name", None),
+        "slot": getattr(bp, "slot_position", None),
+        "position": getattr(bp, "position", None),
+        "points": getattr(bp, "points", None),
+        "projected": getattr(bp, "projected_points", getattr(bp, "projected", None)),
+        "pro_team": getattr(bp, "pro_team", None),
+        "pro_opponent": getattr(bp, "pro_opponent", None),
+        "pro_pos_rank": getattr(bp, "pro_pos_rank", None),
+        "injury_status": getattr(bp, "injury_status", getattr(bp, "injuryStatus", None)),
+    }
+
+
+def _lineup_player_dict(bp) -> Dict[str, Any]:
+    """_box_player_dict plus the id and eligible slots the lineup solver and position filters need."""
+    return {
+        **_box_player_dict(bp),
+        "player_id": getattr(bp, "playerId", None),
+        "eligible_slots": list(getattr(bp, "eligibleSlots", []) or []),
+    }
+
+
+def _format_boxscore_markdown(week: int, matchups_data: List[Dict[str, Any]]) -> str:
+    """Generate markdown formatted boxscore tables for enhanced display."""
+    lines = [f"# Week {week} Enhanced Boxscores\n"]
+
+    for idx, matchup in enumerate(matchups_data, 1):
+        home_team = matchup["home_team"]
+        home_score = matchup["home_score"]
+        away_team = matchup["away_team"]
+        away_score = matchup["away_score"]
+
+        # Matchup header
+        lines.append(f"## Matchup {idx}: {home_team} ({home_score:.2f}) vs {away_team} ({away_score:.2f})\n")
+
+        # Home team lineup
+        lines.append(f"### {home_team} Lineup\n")
+        lines.append("| SLOT | PLAYER | POSITION | INJURY STATUS | PROJ PF | ACTUAL PF |")
+        lines.append("|------|--------|----------|---------------|---------|-----------|")
+
+        for player in matchup["home_lineup"]:
+            slot = player.get("slot", "N/A")
+            name = player.get("name", "Unknown")
+            position = player.get("position", "N/A")
+            injury = player.get("injury_status", "ACTIVE") or "ACTIVE"
+            projected = player.get("projected", 0.0) or 0.0
+            actual = player.get("points", 0.0) or 0.0
+
+            lines.append(f"| {slot} | {name} | {position} | {injury} | {projected:.2f} | {actual:.2f} |")
+
+        lines.append("")  # Blank line
+
+        # Away team lineup
+        lines.append(f"### {away_team} Lineup\n")
+        lines.append("| SLOT | PLAYER | POSITION | INJURY STATUS | PROJ PF | ACTUAL PF |")
+        lines.append("|------|--------|----------|---------------|---------|-----------|")
+
+        for player in matchup["away_lineup"]:
+            slot = player.get("slot", "N/A")
+            name = player.get("name", "Unknown")
+            position = player.get("position", "N/A")
+            injury = player.get("injury_status", "ACTIVE") or "ACTIVE"
+            projected = player.get("projected", 0.0) or 0.0
+            actual = player.get("points", 0.0) or 0.0
+
+            lines.append(f"| {slot} | {name} | {position} | {injury} | {projected:.2f} | {actual:.2f} |")
+
+        lines.append("")  # Blank line between matchups
+
+    return "\n".join(lines)
+
+
+def _settings_dict(s) -> Dict[str, Any]:
+    return {
+        "team_count": getattr(s, "team_count", None),
+        "reg_season_count": getattr(s, "reg_season_count", None),
+        "veto_votes_required": getattr(s, "veto_votes_required", None),
+        "playoff_team_count": getattr(s, "playoff_team_count", None),
+        "tie_rule": getattr(s, "tie_rule", None),
+        "scoring_type": getattr(s, "scoring_type", None),
+    }
+
+
+# --- League Data Warehouse ---------------------------------------------------
+# A local SQLite file (inside RFFL_CACHE_DIR) mirrors the season scoreboards
+# and player-points stores as plain tables so ad-hoc questions can be answered
+# with one SQL query. Queries only copy what other tools already hold in memory;
+# loading seasons from ESPN is an explicit refresh_league_data job on a
+# background thread. Only weeks not yet copied are inserted, and seasons that
+# are fully copied are skipped.
+_WAREHOUSE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    league_id INTEGER, year INTEGER, complete INTEGER, final_weeks INTEGER, players_complete INTEGER,
+    PRIMARY KEY (league_id, year)
+);
+CREATE TABLE IF NOT EXISTS teams (
+    league_id INTEGER, year INTEGER, team_id INTEGER, abbrev TEXT, name TEXT,
+    PRIMARY KEY (league_id, year, team_id)
+);
+CREATE TABLE IF NOT EXISTS matchups (
+    league_id INTEGER, year INTEGER, week INTEGER, matchup_type TEXT, is_playoff INTEGER,
+    home_team_id INTEGER, away_team_id INTEGER, home_score REAL, away_score REAL, winner TEXT
+);
+CREATE INDEX IF NOT EXISTS matchups_season ON matchups (league_id, year, week);
+CREATE TABLE IF NOT EXISTS player_weeks (
+    league_id INTEGER, year INTEGER, week INTEGER, player_id INTEGER, player_name TEXT,
+    team_id INTEGER, slot TEXT, position TEXT, points REAL, projected REAL
+);
+CREATE INDEX IF NOT EXISTS player_weeks_season ON player_weeks (league_id, year, week);
+CREATE INDEX IF NOT EXISTS player_weeks_player ON player_weeks (player_id);
+CREATE VIEW IF NOT EXISTS team_weeks AS
+    SELECT league_id, year, week, home_team_id AS team_id, away_team_id AS opponent_id,
+           home_score AS points_for, away_score AS points_against,
+           CASE winner WHEN 'HOME' THEN 'W' WHEN 'AWAY' THEN 'L' WHEN 'TIE' THEN 'T' END AS result,
+           is_playoff, matchup_type
+    FROM matchups
+    UNION ALL
+    SELECT league_id, year, week, away_team_id, home_team_id, away_score, home_score,
+           CASE winner WHEN 'AWAY' THEN 'W' WHEN 'HOME' THEN 'L' WHEN 'TIE' THEN 'T' END,
+           is_playoff, matchup_type
+    FROM matchups WHERE away_team_id IS NOT NULL;
+"""
+# Statement kinds a read-only query may use; everything else (ATTACH, PRAGMA,
+# writes, DDL) is refused by the authorizer.
+_WAREHOUSE_ALLOWED_ACTIONS = {sqlite3.SQLITE_SELECT, sqlite3.SQLITE_READ, sqlite3.SQLITE_FUNCTION, 33}  # 33: RECURSIVE
+_WAREHOUSE: Dict[str, Any] = {"target": None, "conn": None}
+_WAREHOUSE_LOCK = threading.Lock()
+_WAREHOUSE_STATS = {"queries": 0, "timeouts": 0, "rows_ingested": 0}
+# The latest refresh_league_data job; its thread runs outside any tool call
+_WAREHOUSE_REFRESH: Dict[str, Any] = {"state": "idle", "thread": None}
+_WAREHOUSE_REFRESH_LOCK = threading.Lock()
+
+
+def _warehouse_target() -> Tuple[str, bool]:
+    """Return the SQLite target and whether it is an in-memory database."""
+    if ENABLE_PERSISTENT_CACHE:
+        return os.path.join(CACHE_DIR, "warehouse.sqlite"), False
+    return "file:rffl_warehouse?mode=memory&cache=shared", True
+
+
+def _warehouse_writer() -> sqlite3.Connection:
+    """Return the shared writer connection, reopening it if CACHE_DIR changed. Hold _WAREHOUSE_LOCK."""
+    target, in_memory = _warehouse_target()
+    if _WAREHOUSE["target"] != target:
+        _warehouse_close()
+        if not in_memory:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+        conn = sqlite3.connect(target, uri=in_memory, check_same_thread=False)
+        conn.executescript(_WAREHOUSE_SCHEMA)
+        _WAREHOUSE.update(target=target, conn=conn)
+    return _WAREHOUSE["conn"]
+
+
+def _warehouse_close() -> None:
+    if _WAREHOUSE["conn"] is not None:
+        _WAREHOUSE["conn"].close()
+    _WAREHOUSE.update(target=None, conn=None)
+
+
+def _warehouse_reset() -> bool:
+    """Drop the warehouse entirely; it is rebuilt from the indexes on next use."""
+    with _WAREHOUSE_LOCK:
+        _warehouse_close()
+        target, in_memory = _warehouse_target()
+        if in_memory or not os.path.exists(target):
+            return False
+        os.remove(target)
+        return True
+
+
+def _warehouse_sync_season(lid: int, yr: int, fetch: bool) -> int:
+    """
+    Copy newly final weeks of one season into the warehouse and return rows inserted.
+
+    With fetch=False only the scoreboard and player-points store already in
+    memory are used, so nothing is requested from ESPN. Data is gathered
+    without holding _WAREHOUSE_LOCK; the lock covers the insert.
+    """
+    with _WAREHOUSE_LOCK:
+        done = _warehouse_writer().execute(
+            "SELECT complete, players_complete FROM seasons WHERE league_id = ? AND year = ?", (lid, yr)
+        ).fetchone()
+    if done is not None and done[0] and (yr < 2019 or done[1]):
+        return 0
+
+    if fetch:
+        board = _season_scoreboard(lid, yr)
+        store = _player_points_store(lid, yr) if yr >= 2019 else None
+    else:
+        board = _SCOREBOARD_CACHE.get((lid, yr))
+        store = _PLAYER_POINTS.get((lid, yr)) if yr >= 2019 else None
+        if board is None:
+            return 0
+
+    with _WAREHOUSE_LOCK:
+        conn = _warehouse_writer()
+        have = {w for (w,) in conn.execute(
+            "SELECT DISTINCT week FROM matchups WHERE league_id = ? AND year = ?", (lid, yr)
+        )}
+        new_weeks = set(board["final_weeks"]) - have
+        matchup_rows = [
+            (lid, yr, r["week"], r["matchup_type"], int(r["is_playoff"]), r["home_id"], r["away_id"],
+             r["home_score"], r["away_score"] if r["away_id"] is not None else None, r["winner"])
+            for r in board["matchups"] if r["week"] in new_weeks
+        ]
+        team_rows = [(lid, yr, tid, t.get("abbrev"), t.get("name")) for tid, t in board["teams"].items()]
+
+        player_rows: List[Tuple[Any, ...]] = []
+        if store is not None:
+            have_players = {w for (w,) in conn.execute(
+                "SELECT DISTINCT week FROM player_weeks WHERE league_id = ? AND year = ?", (lid, yr)
+            )}
+            columns = store["columns"]
+            for i, week in enumerate(columns["week"]):
+                if week in have_players:
+                    continue
+                pid = columns["player_id"][i]
+                player_rows.append((
+                    lid, yr, week, pid, store["names"].get(str(pid)), columns["team_id"][i],
+                    columns["slot"][i], columns["position"][i], columns["points"][i], columns["projected"][i],
+                ))
+
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO teams VALUES (?, ?, ?, ?, ?)", team_rows)
+            conn.executemany("INSERT INTO matchups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", matchup_rows)
+            conn.executemany("INSERT INTO player_weeks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", player_rows)
+            conn.execute(
+                "INSERT OR REPLACE INTO seasons VALUES (?, ?, ?, ?, ?)",
+                (lid, yr, int(board["complete"]), len(have | new_weeks), int(bool(store and store["complete"]))),
+            )
+        _WAREHOUSE_STATS["rows_ingested"] += len(matchup_rows) + len(player_rows)
+    return len(matchup_rows) + len(player_rows)
+
+
+def _warehouse_seasons(lid: int) -> List[int]:
+    """Seasons of a league that have been copied into the warehouse."""
+    with _WAREHOUSE_LOCK:
+        return [yr for (yr,) in _warehouse_writer().execute(
+            "SELECT year FROM seasons WHERE league_id = ? ORDER BY year", (lid,)
+        )]
+
+
+def _warehouse_refresh(lid: int, years: List[int]) -> None:
+    """Background job behind refresh_league_data: load each season from ESPN into the warehouse."""
+    start_time = time.time()
+    try:
+        for yr in years:
+            try:
+                rows = _warehouse_sync_season(lid, yr, fetch=True)
+                skipped = None
+            except RuntimeError as e:
+                rows, skipped = 0, {"year": yr, "error": str(e)}
+            with _WAREHOUSE_REFRESH_LOCK:
+                _WAREHOUSE_REFRESH["seasons_done"] += 1
+                _WAREHOUSE_REFRESH["rows_added"] += rows
+                if skipped:
+                    _WAREHOUSE_REFRESH["skipped_years"].append(skipped)
+        state = "done"
+    except Exception as e:
+        state = "failed"
+        with _WAREHOUSE_REFRESH_LOCK:
+            _WAREHOUSE_REFRESH["error"] = str(e)
+        logger.error(
+            "League data warehouse refresh failed",
+            extra={"league_id": lid, "error": str(e), "status": "error"},
+            exc_info=True,
+        )
+    with _WAREHOUSE_REFRESH_LOCK:
+        _WAREHOUSE_REFRESH["state"] = state
+        _WAREHOUSE_REFRESH["duration_ms"] = int((time.time() - start_time) * 1000)
+        status = _warehouse_refresh_status()
+    if state == "done":
+        logger.info(
+            "Refreshed league data warehouse",
+            extra={
+                "league_id": lid,
+                "years": years,
+                "rows": status["rows_added"],
+                "skipped_years": [s["year"] for s in status["skipped_years"]],
+                "duration_ms": status["duration_ms"],
+                "status": "success"
+            }
+        )
+
+
+def _warehouse_refresh_status() -> Dict[str, Any]:
+    """The latest refresh job without its thread handle. Hold _WAREHOUSE_REFRESH_LOCK."""
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in _WAREHOUSE_REFRESH.items() if k != "thread"}
+
+
+def _warehouse_authorizer(action: int, *_: Any) -> int:
+    return sqlite3.SQLITE_OK if action in _WAREHOUSE_ALLOWED_ACTIONS else sqlite3.SQLITE_DENY
+
+
+def _warehouse_query(sql: str, max_rows: int) -> Tuple[List[str], List[Tuple[Any, ...]], bool]:
+    """
+    Run one read-only statement on its own connection.
+
+    The connection is opened read-only, refuses anything but SELECT through an
+    authorizer, and is interrupted by a progress handler once
+    WAREHOUSE_QUERY_TIMEOUT_MS has passed. At most max_rows rows are fetched.
+    """
+    target, in_memory = _warehouse_target()
+    uri = target if in_memory else f"file:{pathname2url(os.path.abspath(target))}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    try:
+        conn.execute("PRAGMA query_only = ON")
+        conn.set_authorizer(_warehouse_authorizer)
+        deadline = time.monotonic() + WAREHOUSE_QUERY_TIMEOUT_MS / 1000.0
+        conn.set_progress_handler(lambda: int(time.monotonic() > deadline), 1000)
+        try:
+            cursor = conn.execute(sql)
+            rows = cursor.fetchmany(max_rows + 1)
+        except sqlite3.OperationalError as e:
+            if "interrupted" in str(e):
+                _WAREHOUSE_STATS["timeouts"] += 1
+                raise ValueError(f"Query exceeded the {WAREHOUSE_QUERY_TIMEOUT_MS} ms time limit") from e
+            raise ValueError(f"Query failed: {e}") from e
+        except (sqlite3.Error, sqlite3.Warning) as e:
+            raise ValueError(f"Query failed: {e}") from e
+        columns = [d[0] for d in cursor.description or []]
+        return columns, rows[:max_rows], len(rows) > max_rows
+    finally:
+        conn.close()
+
+
+# --- Tools -------------------------------------------------------------------
+
+@_tool
+def get_league(
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get league metadata, settings, and team list for any season.
+
+    Args:
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+
+    Returns:
+        League info including settings, teams, current week
+
+    Examples:
+        - get_league() → Uses env var defaults
+        - get_league(year=2016) → Get 2016 season data
+        - get_league(year=2022, league_id=323196) → Explicit parameters
+
+    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    league = _get_league(league_id, year)
+    return {
+        "league_id": league.league_id,
+        "year": league.year,
+        "current_week": getattr(league, "current_week", None),
+        "nfl_week": getattr(league, "nfl_week", None),
+        "settings": _settings_dict(league.settings),
+        "teams": [_team_dict(t) for t in league.teams],
+    }
+
+
+@_tool
+def get_standings(
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Get final season standings for any year, ranked by wins/losses.
+
+    Args:
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+
+    Returns:
+        List of teams with rank, wins, losses, points for/against
+
+    Examples:
+        - get_standings() → Current season standings (uses env vars)
+        - get_standings(year=2016) → 2016 season final standings
+        - get_standings(year=2022, league_id=323196) → Specific league/year
+
+    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    league = _get_league(league_id, year)
+    teams = league.standings()
+    return [
+        {
+            "rank": i + 1,
+            **_team_dict(t),
+        }
+        for i, t in enumerate(teams)
+    ]
+
+
+@_tool
+def get_matchups(
+    week: Optional[int] = None,
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+    include_lineups: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Get weekly matchups with scores and optional lineup details for any season/week.
+
+    Args:
+        week: NFL week number 1-18 (optional, defaults to current week)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+        include_lineups: Include full rosters (default: False)
+
+    Returns:
+        List of matchups with home/away teams, scores, and optional lineups
+
+    Examples:
+        - get_matchups() → Current week matchups (simple, works all years 2011-2025)
+        - get_matchups(week=5) → Week 5 of current season (simple)
+        - get_matchups(week=1, year=2016) → Week 1 of 2016 season (simple, works!)
+        - get_matchups(week=10, year=2022, include_lineups=True) → With rosters (enhanced, requires 2019+)
+
+    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+          Enhanced boxscores (include_lineups=True) only available for seasons 2019+ (rolling ~7 year window).
+    """
+    league = _get_league(league_id, year)
+    w = int(week or getattr(league, "current_week", 0))
+
+    # Use scoreboard (simple) by default, box_scores (enhanced) only when lineups requested
+    # This allows simple matchups to work for ALL years 2011-2025
+    # Enhanced boxscores only work for recent years (currently 2019-2025, rolling window)
+    if include_lineups:
+        # Enhanced: Use box_scores for detailed player lineup data
+        matchups = league.box_scores(week=week)
+    else:
+        # Simple: Use scoreboard for basic matchup scores (works all years)
+        matchups = league.scoreboard(week=week)
+
+    out: List[Dict[str, Any]] = []
+    for matchup in matchups:
+        item = {
+            "week": w,
+            "is_playoff": getattr(matchup, "is_playoff", False),
+            "matchup_type": getattr(matchup, "matchup_type", "NONE"),
+            "home": {
+                **_team_dict(getattr(matchup, "home_team", None)),
+                "score": getattr(matchup, "home_score", None),
+                "projected": getattr(matchup, "home_projected", None),
+            },
+            "away": {
+                **_team_dict(getattr(matchup, "away_team", None)),
+                "score": getattr(matchup, "away_score", None),
+                "projected": getattr(matchup, "away_projected", None),
+            },
+        }
+        if include_lineups:
+            item["lineups"] = {
+                "home": [_box_player_dict(p) for p in getattr(matchup, "home_lineup", [])],
+                "away": [_box_player_dict(p) for p in getattr(matchup, "away_lineup", [])],
+            }
+        out.append(item)
+
+    _annotate(week=w, matchup_count=len(out), include_lineups=include_lineups)
+    return out
+
+
+@_tool
+def get_enhanced_boxscores(
+    week: Optional[int] = None,
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get detailed box scores with formatted lineup tables (starters + bench) for any week.
+
+    Args:
+        week: NFL week number 1-18 (optional, defaults to current week)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+
+    Returns:
+        Structured matchup data + formatted markdown tables with player stats
+
+    Examples:
+        - get_enhanced_boxscores() → Current week boxscores
+        - get_enhanced_boxscores(week=5) → Week 5 of current season
+        - get_enhanced_boxscores(week=1, year=2022) → Week 1 of 2022 season
+
+    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+          Box scores availability is limited for seasons before 2019.
+    """
+    league = _get_league(league_id, year)
+    with _span("league.box_scores", week=week):
+        box_scores = league.box_scores(week=week)
+    w = int(week or getattr(league, "current_week", 0))
+
+    matchups_data: List[Dict[str, Any]] = []
+
+    for bs in box_scores:
+        home_team = getattr(bs, "home_team", None)
+        away_team = getattr(bs, "away_team", None)
+
+        matchup = {
+            "home_team": getattr(home_team, "team_name", "Unknown") if home_team else "Unknown",
+            "home_score": getattr(bs, "home_score", 0.0),
+            "away_team": getattr(away_team, "team_name", "Unknown") if away_team else "Unknown",
+            "away_score": getattr(bs, "away_score", 0.0),
+            "home_lineup": [_box_player_dict(p) for p in getattr(bs, "home_lineup", [])],
+            "away_lineup": [_box_player_dict(p) for p in getattr(bs, "away_lineup", [])],
+        }
+        matchups_data.append(matchup)
+
+    # Generate formatted markdown output
+    with _phase("format", "format.markdown"):
+        formatted_output = _format_boxscore_markdown(w, matchups_data)
+
+    _annotate(week=w, matchup_count=len(matchups_data))
+
+    return {
+        "week": w,
+        "matchups": matchups_data,
+        "formatted_output": formatted_output,
+    }
+
+
+@_tool
+def get_power_rankings(
+    week: Optional[int] = None,
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Get two-step dominance power rankings for any week/season.
+
+    Args:
+        week: NFL week number 1-18 (optional, defaults to current week)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+
+    Returns:
+        Teams ranked by power ranking score
+
+    Examples:
+        - get_power_rankings() → Current week rankings
+        - get_power_rankings(week=10) → Week 10 of current season
+        - get_power_rankings(week=5, year=2022) → Week 5 of 2022 season
+
+    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    league = _get_league(league_id, year)
+    rankings = league.power_rankings(week=week)
+    return [{"score": float(score), "team": _team_dict(team)} for score, team in rankings]
+
+
+@_tool
+def get_power_rankings_series(
+    start_week: Optional[int] = None,
+    end_week: Optional[int] = None,
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get two-step dominance power rankings for every week in a range (for charting a season).
+
+    Args:
+        start_week: First week (optional, defaults to 1)
+        end_week: Last week (optional, defaults to current week)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+
+    Returns:
+        Per-week rankings plus a per-team series of scores and ranks
+
+    Examples:
+        - get_power_rankings_series() → Weeks 1 through current week
+        - get_power_rankings_series(start_week=1, end_week=14, year=2022) → 2022 regular season
+
+    Note: Scores match get_power_rankings for each week, computed in a single pass.
+          Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    league = _get_league(league_id, year)
+    current = int(getattr(league, "current_week", 0) or 0)
+    first = max(1, int(start_week or 1))
+    last = min(int(end_week or current), current)
+    if last < first:
+        raise ValueError(f"No weeks to rank between {first} and {last} (current week is {current})")
+
+    weeks = list(range(first, last + 1))
+    rankings = _power_rankings_series(league, weeks)
+
+    series: Dict[int, Dict[str, Any]] = {
+        t.team_id: {"team_id": t.team_id, "abbrev": t.team_abbrev, "name": t.team_name, "scores": [], "ranks": []}
+        for t in sorted(league.teams, key=lambda x: x.team_id)
+    }
+    by_week: List[Dict[str, Any]] = []
+    for w in weeks:
+        ranked = []
+        for rank, (score, team) in enumerate(rankings[w], 1):
+            ranked.append({"rank": rank, "score": score, "team_id": team.team_id, "name": team.team_name})
+            series[team.team_id]["scores"].append(score)
+            series[team.team_id]["ranks"].append(rank)
+        by_week.append({"week": w, "rankings": ranked})
+
+    _annotate(league_id=league.league_id, year=league.year)
+    return {
+        "league_id": league.league_id,
+        "year": league.year,
+        "weeks": weeks,
+        "rankings": by_week,
+        "series": list(series.values()),
+    }
+
+
+@_tool
+def get_teams(
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Get raw list of all teams in the league for any season.
+
+    Args:
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+
+    Returns:
+        List of all teams with basic info (no ranking)
+
+    Examples:
+        - get_teams() → All teams in current season
+        - get_teams(year=2016) → All teams from 2016 season
+
+    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    league = _get_league(league_id, year)
+    return [_team_dict(t) for t in league.teams]
+
+
+@_tool
+def get_scoreboard(
+    week: Optional[int] = None,
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Get simple scoreboard view (lighter than box scores) for any week.
+
+    Args:
+        week: NFL week number 1-18 (optional, defaults to current week)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+
+    Returns:
+        Matchups with basic scores (no player-level details)
+
+    Examples:
+        - get_scoreboard() → Current week scores
+        - get_scoreboard(week=5) → Week 5 of current season
+        - get_scoreboard(week=1, year=2022) → Week 1 of 2022 season
+
+    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    league = _get_league(league_id, year)
+    scoreboard = league.scoreboard(week=week)
+    w = int(week or getattr(league, "current_week", 0))
+    out: List[Dict[str, Any]] = []
+    for m in scoreboard:
+        out.append({
+            "week": w,
+            "home": {**_team_dict(getattr(m, "home_team", None)), "score": getattr(m, "home_score", None)},
+            "away": {**_team_dict(getattr(m, "away_team", None)), "score": getattr(m, "away_score", None)},
+        })
+    return out
+
+
+@_tool
+def get_player_info(
+    name: Optional[str] = None,
+    player_id: Optional[int] = None,
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+):
+    """
+    Look up player information by name or ESPN player ID for any season.
+
+    Args:
+        name: Player name like "Patrick Mahomes" (optional; partial and misspelled names resolve to the best match)
+        player_id: ESPN player ID (optional, direct lookup)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+
+    Returns:
+        Player details including stats, position, team
+
+    Examples:
+        - get_player_info(name="Patrick Mahomes") → Search current season
+        - get_player_info(name="Tom Brady", year=2022) → 2022 season player
+        - get_player_info(player_id=12345) → Direct lookup by ID
+
+    Note: Must provide either 'name' or 'player_id'. Name lookups go through the
+          search_players index and include a "match" field; details are cached per player.
+          Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    league = _get_league(league_id, year)
+    match = None
+    if name and player_id is None:
+        candidates = _search_player_index(_player_index(league), name, limit=1)
+        if not candidates or candidates[0]["score"] < 0.5:
+            return None
+        player_id = candidates[0]["player_id"]
+        match = {"query": name, "name": candidates[0]["name"], "score": candidates[0]["score"]}
+
+    key = (int(league.league_id), int(league.year), int(player_id)) if isinstance(player_id, int) else None
+    with _PLAYER_DETAIL_LOCK:
+        cached = _PLAYER_DETAIL_CACHE.get(key) if key else None
+        fresh = cached is not None and time.time() - cached[0] < PLAYER_DETAIL_TTL_SECONDS
+        if fresh:
+            _PLAYER_DETAIL_CACHE.move_to_end(key)
+        _PLAYER_SEARCH_STATS["detail_hits" if fresh else "detail_misses"] += 1
+    if fresh:
+        return {**cached[1], "match": match} if match else cached[1]
+
+    try:
+        res = league.player_info(playerId=player_id)
+    except Exception as e:
+        raise RuntimeError("Player info unavailable without auth for this query.") from e
+
+    def _pd(p):
+        return {
+            "name": getattr(p, "name", None),
+            "playerId": getattr(p, "playerId", None),
+            "position": getattr(p, "position", None),
+            "proTeam": getattr(p, "proTeam", None),
+            "injuryStatus": getattr(p, "injury_status", getattr(p, "injuryStatus", None)),
+            "total_points": getattr(p, "total_points", None),
+            "avg_points": getattr(p, "avg_points", None),
+            "projected_total_points": getattr(p, "projected_total_points", None),
+            "projected_avg_points": getattr(p, "projected_avg_points", None),
+        }
+
+    if res is None:
+        return None
+    if isinstance(res, list):
+        return [_pd(p) for p in res]
+    details = _pd(res)
+    if key:
+        with _PLAYER_DETAIL_LOCK:
+            _PLAYER_DETAIL_CACHE[key] = (time.time(), details)
+            while len(_PLAYER_DETAIL_CACHE) > PLAYER_DETAIL_CACHE_SIZE:
+                _PLAYER_DETAIL_CACHE.popitem(last=False)
+    return {**details, "match": match} if match else details
+
+
+@_tool
+def search_players(
+    query: str,
+    limit: int = 10,
+    position: Optional[str] = None,
+    league_id: Optional[int] = None,
     year: Optional[int] = None,
-    include_lineups: bool = False,
 ) -> List[Dict[str, Any]]:
     """
-    Get weekly matchups with scores and optional lineup details for any season/week.
+    Search players by full name, name prefix, last name only, or misspelled name.
+
+    Args:
+        query: Name text like "Patrick Mahomes", "mahomes", "pat mah", or "Patrik Mahomas"
+        limit: Maximum candidates to return (default: 10)
+        position: Only return players at this position, e.g. "QB" (optional; rostered players only)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+
+    Returns:
+        Ranked candidates with player_id, name, match score, and fantasy team if rostered
+
+    Examples:
+        - search_players(query="mahomes") → Last name only
+        - search_players(query="Jamarr Chase") → Fuzzy match for "Ja'Marr Chase"
+        - search_players(query="jef", position="WR") → Prefix search limited to WRs
+
+    Note: Answered from an in-memory index built once per season; no ESPN request is
+          made after the league is loaded. Use get_player_info(player_id=...) for stats.
+    """
+    league = _get_league(league_id, year)
+    return _search_player_index(_player_index(league), query, limit=max(1, int(limit)), position=position)
+
+
+@_tool
+def get_player_leaderboard(
+    position: Optional[str] = None,
+    start_week: Optional[int] = None,
+    end_week: Optional[int] = None,
+    top_k: int = 10,
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get the top rostered players by fantasy points over a range of weeks.
+
+    Args:
+        position: Player position like "QB", "RB", "WR", "TE", "D/ST", "K" (optional, all positions)
+        start_week: First week to include (optional, defaults to 1)
+        end_week: Last week to include (optional, defaults to the last finished week)
+        top_k: Number of players to return (default: 10)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year like 2019, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+
+    Returns:
+        Ranked players with total, average and projected points, weeks rostered, and starts
+
+    Examples:
+        - get_player_leaderboard(position="RB", start_week=1, end_week=8) → Top 10 RBs weeks 1-8
+        - get_player_leaderboard(top_k=25, year=2022) → Top 25 players of 2022
+        - get_player_leaderboard(position="QB", start_week=14) → Best playoff QBs
+
+    Note: Built from box scores of finished weeks only, so free agents are not ranked.
+          Finished weeks are cached persistently. Seasons before 2019 have no box scores.
+          Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    lid = int(league_id or DEFAULT_LEAGUE_ID)
+    yr = int(year or DEFAULT_YEAR)
+    store = _player_points_store(lid, yr)
+    first = int(start_week or 1)
+    last = int(end_week or (max(store["weeks"]) if store["weeks"] else first))
+    if first > last:
+        raise ValueError(f"start_week ({first}) must not be after end_week ({last})")
+    leaders = _player_leaderboard(store, position, first, last, max(1, int(top_k)))
+
+    _annotate(league_id=lid, year=yr)
+    return {
+        "league_id": lid,
+        "year": yr,
+        "position": position.upper() if position else None,
+        "start_week": first,
+        "end_week": last,
+        "weeks_available": list(store["weeks"]),
+        "leaders": leaders,
+    }
+
+
+@_tool
+def get_optimal_lineup_analysis(
+    year: Optional[int] = None,
+    start_week: Optional[int] = None,
+    end_week: Optional[int] = None,
+    league_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Compare each team's actual lineups with the best lineups they could have started.
+
+    Args:
+        year: Season year like 2019, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+        start_week: First week to include (optional, defaults to 1)
+        end_week: Last week to include (optional, defaults to the last finished week)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+
+    Returns:
+        Teams ranked by points left on the bench, with actual vs optimal points,
+        lineup efficiency, bench and IR scoring, and a per-week breakdown
+
+    Examples:
+        - get_optimal_lineup_analysis() → Current season so far
+        - get_optimal_lineup_analysis(year=2022) → Full 2022 season
+        - get_optimal_lineup_analysis(start_week=1, end_week=4) → First four weeks
+
+    Note: The optimal lineup respects the league's starting slots (including FLEX)
+          and each player's eligible positions; IR players are never started.
+          "points_left_on_bench" is optimal minus actual; "bench_points" excludes IR,
+          which is reported as "ir_points". Finished weeks are cached
+          persistently. Seasons before 2019 have no box scores.
+          Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    lid = int(league_id or DEFAULT_LEAGUE_ID)
+    yr = int(year or DEFAULT_YEAR)
+    index = _optimal_lineup_index(lid, yr)
+    available = sorted(int(w) for w in index["weeks"])
+    first = int(start_week or 1)
+    last = int(end_week or (available[-1] if available else first))
+    if first > last:
+        raise ValueError(f"start_week ({first}) must not be after end_week ({last})")
+    weeks = [w for w in available if first <= w <= last]
+
+    names = index.get("teams", {})
+    teams: Dict[str, Dict[str, Any]] = {}
+    for week in weeks:
+        for tid, r in index["weeks"][str(week)].items():
+            team = teams.setdefault(tid, {
+                "team_id": int(tid), "team": names.get(tid), "actual_points": 0.0,
+                "optimal_points": 0.0, "bench_points": 0.0, "ir_points": 0.0, "weeks": [],
+            })
+            team["actual_points"] += r["actual"]
+            team["optimal_points"] += r["optimal"]
+            team["bench_points"] += r["bench_points"]
+            team["ir_points"] += r["ir_points"]
+            team["weeks"].append({
+                "week": week,
+                "actual": r["actual"],
+                "optimal": r["optimal"],
+                "left_on_bench": round(r["optimal"] - r["actual"], 2),
+            })
+
+    rows = []
+    for team in teams.values():
+        actual, optimal = round(team["actual_points"], 2), round(team["optimal_points"], 2)
+        rows.append({
+            **team,
+            "actual_points": actual,
+            "optimal_points": optimal,
+            "bench_points": round(team["bench_points"], 2),
+            "ir_points": round(team["ir_points"], 2),
+            "points_left_on_bench": round(optimal - actual, 2),
+            "efficiency_pct": round(100.0 * actual / optimal, 2) if optimal else 100.0,
+        })
+    rows.sort(key=lambda r: (-r["points_left_on_bench"], r["team_id"]))
+
+    _annotate(league_id=lid, year=yr)
+    return {
+        "league_id": lid,
+        "year": yr,
+        "start_week": first,
+        "end_week": last,
+        "lineup_slots": index.get("slot_counts", {}),
+        "teams": rows,
+    }
+
+
+@_tool
+def get_projection_accuracy(
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    group_by: str = "position",
+    league_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Measure how accurate ESPN's weekly player projections were for rostered players.
+
+    Args:
+        start_year: First season to include (optional, defaults to end_year)
+        end_year: Last season to include (optional, defaults to ESPN_YEAR env var)
+        group_by: "position", "team" (fantasy team), or "week" (default: "position")
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+
+    Returns:
+        Overall and per-group MAE, bias (actual minus projected), RMSE, and calibration
+        buckets comparing mean projected with mean actual points
+
+    Examples:
+        - get_projection_accuracy() → Current season by position
+        - get_projection_accuracy(start_year=2019, group_by="position") → Every box-score season
+        - get_projection_accuracy(start_year=2023, end_year=2023, group_by="week") → Weekly trend
+
+    Note: Uses finished weeks of the get_player_leaderboard player-points store and only
+          player-weeks with a positive projection. Finished seasons are aggregated once
+          and cached persistently. Seasons before 2019 have no box scores and are listed
+          in skipped_years. Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    if group_by not in PROJECTION_GROUPS:
+        raise ValueError(f"group_by must be one of {', '.join(PROJECTION_GROUPS)}")
+    lid = int(league_id or DEFAULT_LEAGUE_ID)
+    last = int(end_year or DEFAULT_YEAR)
+    first = int(start_year or last)
+
+    overall: Dict[str, Any] = {}
+    groups: Dict[str, Dict[str, Any]] = {}
+    team_names: Dict[str, str] = {}
+    seasons: List[int] = []
+    skipped: List[Dict[str, Any]] = []
+    for yr in range(first, last + 1):
+        try:
+            stats = _projection_season_stats(lid, yr)
+        except RuntimeError as e:
+            skipped.append({"year": yr, "error": str(e)})
+            continue
+        seasons.append(yr)
+        team_names.update(stats["teams"])
+        for key, sums in stats["groups"][group_by].items():
+            _merge_projection_sums(groups.setdefault(key, {}), sums)
+            _merge_projection_sums(overall, sums)
+
+    rows = []
+    for key, sums in groups.items():
+        row = {"group": int(key) if key.isdigit() else key, **_projection_summary(sums)}
+        if group_by == "team":
+            row["team"] = team_names.get(key)
+        rows.append(row)
+    rows.sort(key=lambda r: r["group"] if group_by == "week" else r["mae"])
+
+    _annotate(league_id=lid)
+    return {
+        "league_id": lid,
+        "start_year": first,
+        "end_year": last,
+        "group_by": group_by,
+        "seasons": seasons,
+        "overall": _projection_summary(overall) if overall else None,
+        "groups": rows,
+        "skipped_years": skipped,
+    }
+
+
+@_tool
+def get_transactions(
+    year: Optional[int] = None,
+    team_id: Optional[Union[int, str]] = None,
+    type: Optional[str] = None,
+    since: Optional[Union[int, str]] = None,
+    limit: int = 100,
+    league_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get league transactions (adds, drops, waiver claims, trades) from the local activity log.
+
+    Args:
+        year: Season year like 2019, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+        team_id: Team ID, abbreviation, or name (optional, all teams)
+        type: "add", "fa", "waiver", "drop", or "trade" (optional, all types)
+        since: Only entries at or after this time: ISO date like "2024-10-01" or epoch ms (optional)
+        limit: Maximum entries to return, newest first (default: 100)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+
+    Returns:
+        Matching transactions newest first with team and player names, plus log metadata
+
+    Examples:
+        - get_transactions() → Latest transactions this season
+        - get_transactions(type="trade", year=2023) → Every 2023 trade
+        - get_transactions(team_id="BRO", type="waiver", since="2024-11-01") → Recent waiver claims
+
+    Note: The log is synced at most every ACTIVITY_TTL_SECONDS and each sync only fetches
+          pages newer than the stored cursor. Trades list both teams and match either.
+          Activity is only available for seasons 2019+.
+          Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    lid = int(league_id or DEFAULT_LEAGUE_ID)
+    yr = int(year or DEFAULT_YEAR)
+    actions = None
+    if type is not None:
+        actions = _TRANSACTION_TYPES.get(type.strip().lower())
+        if actions is None:
+            raise ValueError(f"type must be one of {', '.join(_TRANSACTION_TYPES)}")
+    since_ms = _parse_since(since)
+
+    log = _activity_log(lid, yr)
+    teams = {str(tid): t for tid, t in _season_scoreboard(lid, yr)["teams"].items()}
+    tid = None
+    if team_id is not None:
+        tid = _resolve_team_id(teams, team_id)
+        if tid is None:
+            raise ValueError(f"Unknown team '{team_id}' for {yr}")
+
+    matches = [
+        row for row in reversed(log["entries"])
+        if (actions is None or row[2] in actions)
+        and (tid is None or tid in (row[3], row[6]))
+        and (since_ms is None or row[1] >= since_ms)
+    ]
+    player_map = getattr(_get_league(lid, yr), "player_map", {}) if matches else {}
+
+    def team_name(team):
+        return teams.get(str(team), {}).get("name") if team is not None else None
+
+    transactions = []
+    for row in matches[:max(1, int(limit))]:
+        entry = dict(zip(_ACTIVITY_FIELDS, row))
+        transactions.append({
+            "date": entry["date"],
+            "date_utc": datetime.fromtimestamp(entry["date"] / 1000, tz=timezone.utc).isoformat(),
+            "action": entry["action"],
+            "team_id": entry["team_id"],
+            "team": team_name(entry["team_id"]),
+            "player_id": entry["player_id"],
+            "player": player_map.get(entry["player_id"]),
+            "bid_amount": entry["bid_amount"],
+            "to_team_id": entry["to_team_id"],
+            "to_team": team_name(entry["to_team_id"]),
+        })
+
+    _annotate(league_id=lid, year=yr)
+    return {
+        "league_id": lid,
+        "year": yr,
+        "total_matching": len(matches),
+        "log_entries": len(log["entries"]),
+        "synced_at": log["synced_at"],
+        "transactions": transactions,
+    }
+
+
+@_tool
+def get_draft(
+    year: Optional[int] = None,
+    team_id: Optional[Union[int, str]] = None,
+    round_num: Optional[int] = None,
+    league_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get a season's draft results, optionally for one team or one round.
+
+    Args:
+        year: Season year like 2012, 2019, 2025 (optional, defaults to ESPN_YEAR env var)
+        team_id: Team ID, abbreviation, or name (optional, all teams)
+        round_num: Draft round (optional, all rounds)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+
+    Returns:
+        Picks in draft order with round, pick, team, player, bid amount, and keeper flag
+
+    Examples:
+        - get_draft() → This season's draft
+        - get_draft(year=2016, round_num=1) → 2016 first round
+        - get_draft(year=2022, team_id="BRO") → One team's 2022 picks
+
+    Note: Completed drafts are stored permanently in the persistent cache, so repeat
+          calls make no ESPN request. Player names come from ESPN's active player list
+          and may be missing for long-retired players.
+          Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    lid = int(league_id or DEFAULT_LEAGUE_ID)
+    yr = int(year or DEFAULT_YEAR)
+    draft = _load_draft(lid, yr)
+    picks = _draft_picks(draft, team_id, round_num)
+
+    _annotate(league_id=lid, year=yr)
+    return {
+        "league_id": lid,
+        "year": yr,
+        "drafted": draft["drafted"],
+        "auction": draft["auction"],
+        "picks": picks,
+    }
+
+
+@_tool
+def get_draft_history(
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    team_id: Optional[Union[int, str]] = None,
+    round_num: Optional[int] = None,
+    league_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get draft results for a range of seasons, optionally for one team or one round.
+
+    Args:
+        start_year: First season (optional, defaults to ESPN_HISTORY_START_YEAR, 2011)
+        end_year: Last season (optional, defaults to ESPN_YEAR env var)
+        team_id: Team ID, abbreviation, or name (optional, all teams)
+        round_num: Draft round (optional, all rounds)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+
+    Returns:
+        Per-season picks after filtering, plus seasons that could not be loaded
+
+    Examples:
+        - get_draft_history(round_num=1) → Every first-round pick since 2011
+        - get_draft_history(team_id=3, start_year=2018) → One team's drafts since 2018
+
+    Note: Uncached seasons are fetched concurrently (DRAFT_FETCH_WORKERS threads) and
+          completed drafts are stored permanently. Seasons that fail to load are listed
+          in skipped_years. Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    lid = int(league_id or DEFAULT_LEAGUE_ID)
+    first, last = int(start_year or HISTORY_START_YEAR), int(end_year or DEFAULT_YEAR)
+    drafts, skipped = _load_drafts(lid, list(range(first, last + 1)))
+    seasons = [
+        {"year": yr, "drafted": draft["drafted"], "picks": _draft_picks(draft, team_id, round_num)}
+        for yr, draft in drafts.items()
+    ]
+
+    _annotate(league_id=lid)
+    return {
+        "league_id": lid,
+        "start_year": first,
+        "end_year": last,
+        "seasons": seasons,
+        "skipped_years": skipped,
+    }
+
+
+@_tool
+def get_free_agents(
+    position: Optional[str] = None,
+    size: int = 25,
+    sort: str = "owned",
+    week: Optional[int] = None,
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get the best available free agents, optionally for one position.
+
+    Args:
+        position: "QB", "RB", "WR", "TE", "FLEX", "D/ST", "K" (optional, all positions)
+        size: Number of players to return (default: 25)
+        sort: "owned" (percent owned), "started", "projected", or "points" (default: "owned")
+        week: Scoring week for points/projections (optional, defaults to current week)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year, 2019 or later (optional, defaults to ESPN_YEAR env var)
+
+    Returns:
+        Free agents with position, eligible slots, week points/projection, and ownership
+
+    Examples:
+        - get_free_agents() → Most-owned available players
+        - get_free_agents(position="RB", sort="projected", size=10) → Best projected RBs
+        - get_free_agents(position="FLEX", sort="points", week=7) → Top week 7 scorers for FLEX
+
+    Note: The pool (top FREE_AGENT_POOL_SIZE by ownership) is fetched once per league and
+          week and reused for FREE_AGENT_TTL_SECONDS, so repeated queries with different
+          filters make no ESPN request. Hit rate is shown in get_cache_stats().
+    """
+    sort_field = FREE_AGENT_SORTS.get(sort)
+    if sort_field is None:
+        raise ValueError(f"sort must be one of {', '.join(FREE_AGENT_SORTS)}")
+    league = _get_league(league_id, year)
+    w = int(week or league.current_week)
+    pool = _free_agent_pool(league, w)
+
+    slot = None
+    if position:
+        slot = position.strip().upper()
+        slot = "RB/WR/TE" if slot == "FLEX" else slot
+    candidates = [
+        p for p in pool["players"]
+        if slot is None or p["position"] == slot or slot in p["eligible_slots"]
+    ]
+    players = heapq.nlargest(
+        max(1, int(size)), candidates, key=lambda p: p[sort_field] if p[sort_field] is not None else float("-inf")
+    )
+
+    _annotate(league_id=league.league_id, year=league.year, week=w)
+    return {
+        "league_id": league.league_id,
+        "year": league.year,
+        "week": w,
+        "position": position.upper() if position else None,
+        "sort": sort,
+        "pool_size": len(pool["players"]),
+        "pool_age_seconds": round(time.time() - pool["fetched_at"], 1),
+        "players": players,
+    }
+
+
+@_tool
+def get_head_to_head(
+    team_a: Union[int, str],
+    team_b: Union[int, str],
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    league_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get the head-to-head record between two teams for one season or all-time.
+
+    Args:
+        team_a: Team ID, abbreviation, or name (see get_teams)
+        team_b: Team ID, abbreviation, or name (see get_teams)
+        start_year: First season to include (optional, defaults to ESPN_HISTORY_START_YEAR env var)
+        end_year: Last season to include (optional, defaults to ESPN_YEAR env var)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+
+    Returns:
+        All-time totals (wins, ties, points, playoff meetings) plus a per-season breakdown
+
+    Examples:
+        - get_head_to_head(team_a=1, team_b=7) → All-time record between teams 1 and 7
+        - get_head_to_head(team_a="BRO", team_b="WAR", start_year=2016) → Since 2016
+        - get_head_to_head(team_a=3, team_b=5, start_year=2024, end_year=2024) → One season
+
+    Note: Answered from a precomputed index kept in the persistent cache. Finished
+          weeks are ingested once; seasons that fail to load are listed in skipped_years.
+          Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    """
+    lid = int(league_id or DEFAULT_LEAGUE_ID)
+    first = int(start_year or HISTORY_START_YEAR)
+    last = int(end_year or DEFAULT_YEAR)
+
+    totals = {
+        "games": 0, "team_a_wins": 0, "team_b_wins": 0, "ties": 0,
+        "team_a_points": 0.0, "team_b_points": 0.0,
+        "playoff_games": 0, "team_a_playoff_wins": 0, "team_b_playoff_wins": 0,
+    }
+    seasons: List[Dict[str, Any]] = []
+    skipped: List[Dict[str, Any]] = []
+    names = {"team_a": None, "team_b": None}
+
+    for yr in range(first, last + 1):
+        try:
+            index = _h2h_season_index(lid, yr)
+        except RuntimeError as e:
+            skipped.append({"year": yr, "error": str(e)})
+            continue
+        a = _resolve_team_id(index["teams"], team_a)
+        b = _resolve_team_id(index["teams"], team_b)
+        if a is None or b is None or a == b:
+            continue
+        i, j = index["team_ids"].index(a), index["team_ids"].index(b)
+        season = {
+            "year": yr,
+            "team_a": index["teams"][str(a)],
+            "team_b": index["teams"][str(b)],
+            "games": index["games"][i][j],
+            "team_a_wins": index["wins"][i][j],
+            "team_b_wins": index["wins"][j][i],
+            "ties": index["ties"][i][j],
+            "team_a_points": index["points"][i][j],
+            "team_b_points": index["points"][j][i],
+            "playoff_games": index["playoff_games"][i][j],
+            "team_a_playoff_wins": index["playoff_wins"][i][j],
+            "team_b_playoff_wins": index["playoff_wins"][j][i],
+        }
+        names["team_a"], names["team_b"] = season["team_a"], season["team_b"]
+        if season["games"] == 0:
+            continue
+        for k in totals:
+            totals[k] += season[k]
+        seasons.append(season)
+
+    totals["team_a_points"] = round(totals["team_a_points"], 2)
+    totals["team_b_points"] = round(totals["team_b_points"], 2)
+
+    _annotate(league_id=lid)
+    return {
+        "league_id": lid,
+        "start_year": first,
+        "end_year": last,
+        "team_a": names["team_a"],
+        "team_b": names["team_b"],
+        "all_time": totals,
+        "seasons": seasons,
+        "skipped_years": skipped,
+    }
+
+
+@_tool
+def get_playoff_odds(
+    simulations: int = 10000,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Estimate playoff, bye, and seed probabilities by simulating the rest of the regular season.
+
+    Args:
+        simulations: Number of simulated seasons (default: 10000, max MAX_SIMULATIONS env var)
+        seed: Random seed; the same seed always returns the same odds (optional)
+        workers: Worker processes for large runs (optional, defaults to SIMULATION_WORKERS env var)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
+        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+
+    Returns:
+        Per-team playoff/bye percentages, seed distribution, and projected wins, plus timing
+
+    Examples:
+        - get_playoff_odds() → Current season odds from 10,000 simulations
+        - get_playoff_odds(simulations=200000, seed=42) → Larger, reproducible run
+        - get_playoff_odds(simulations=1000000, workers=4) → Spread batches over 4 processes
+
+    Note: Each team's weekly score is drawn from a normal distribution fit to its
+          season-to-date points. Seeding uses wins, then points for, with division
+          winners seeded first; head-to-head tiebreakers are not modeled.
+    """
+    import numpy as np
+    start_time = time.time()
+    simulations = int(simulations)
+    if simulations < 1 or simulations > MAX_SIMULATIONS:
+        raise ValueError(f"simulations must be between 1 and {MAX_SIMULATIONS}")
+    worker_count = max(1, int(workers or SIMULATION_WORKERS))
+
+    league = _get_league(league_id, year)
+    settings = league.settings
+    playoff_teams = int(settings.playoff_team_count)
+    byes = _playoff_bye_count(playoff_teams)
+
+    state = _season_to_date(league)
+    teams = state["teams"]
+    division_ids = sorted({t.division_id for t in teams})
+    divisions = (
+        [np.array([i for i, t in enumerate(teams) if t.division_id == d]) for d in division_ids]
+        if len(division_ids) > 1 else []
+    )
+    mean, std = _score_model(state["played"])
+    sim_start = time.time()
+    seed_counts, win_totals = _run_playoff_simulations(
+        state, simulations, seed, worker_count, divisions, mean, std
+    )
+    simulation_ms = max(int((time.time() - sim_start) * 1000), 1)
+
+    out_teams: List[Dict[str, Any]] = []
+    for i, t in enumerate(teams):
+        seed_pct = seed_counts[i] / simulations * 100
+        out_teams.append({
+            "team_id": t.team_id,
+            "abbrev": t.team_abbrev,
+            "name": t.team_name,
+            "wins": int(state["wins"][i]),
+            "losses": int(state["losses"][i]),
+            "ties": int(state["ties"][i]),
+            "points_for": round(float(state["points"][i]), 2),
+            "mean_score": round(float(mean[i]), 2),
+            "std_score": round(float(std[i]), 2),
+            "projected_wins": round(float(win_totals[i] / simulations), 2),
+            "playoff_pct": round(float(seed_pct[:playoff_teams].sum()), 2),
+            "bye_pct": round(float(seed_pct[:byes].sum()), 2),
+            "seed_pct": [round(float(p), 2) for p in seed_pct],
+        })
+    out_teams.sort(key=lambda x: (-x["playoff_pct"], -x["projected_wins"]))
+
+    duration_ms = int((time.time() - start_time) * 1000)
+    _annotate(league_id=league.league_id, year=league.year)
+    return {
+        "league_id": league.league_id,
+        "year": league.year,
+        "simulations": simulations,
+        "seed": seed,
+        "workers": worker_count,
+        "reg_season_count": int(settings.reg_season_count),
+        "playoff_team_count": playoff_teams,
+        "bye_count": byes,
+        "weeks_remaining": state["weeks"],
+        "games_remaining": int(len(state["home"])),
+        "duration_ms": duration_ms,
+        "simulation_ms": simulation_ms,
+        "simulations_per_second": int(simulations / (simulation_ms / 1000)),
+        "teams": out_teams,
+    }
+
+
+@_tool
+def get_clinch_scenarios(
+    league_id: Optional[int] = None,
+    year: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get exact playoff clinch and elimination status for every team.
 
     Args:
-        week: NFL week number 1-18 (optional, defaults to current week)
         league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
         year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
-        include_lineups: Include full rosters (default: False)
 
     Returns:
-        List of matchups with home/away teams, scores, and optional lineups
+        Per-team status ("clinched", "eliminated", "alive"), whether the team clinches
+        with a win or is eliminated with a loss next week, plus nodes explored and timing
 
     Examples:
-        - get_matchups() → Current week matchups (simple, works all years 2011-2025)
-        - get_matchups(week=5) → Week 5 of current season (simple)
-        - get_matchups(week=1, year=2016) → Week 1 of 2016 season (simple, works!)
-        - get_matchups(week=10, year=2022, include_lineups=True) → With rosters (enhanced, requires 2019+)
+        - get_clinch_scenarios() → Current season, e.g. "team 4 clinches with a win"
+        - get_clinch_scenarios(year=2024) → Final statuses for a finished season
 
-    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
-          Enhanced boxscores (include_lineups=True) only available for seasons 2019+ (rolling ~7 year window).
+    Note: Considers every remaining regular-season result. Points are unknown until
+          games are played, so tied records count against a team for clinching and in
+          its favor for elimination; once the regular season is over, seeding is exact
+          (wins, then points for, with division winners first). Future ties are not modeled.
     """
     start_time = time.time()
     league = _get_league(league_id, year)
-    w = int(week or getattr(league, "current_week", 0))
-
-    # Use scoreboard (simple) by default, box_scores (enhanced) only when lineups requested
-    # This allows simple matchups to work for ALL years 2011-2025
-    # Enhanced boxscores only work for recent years (currently 2019-2025, rolling window)
-    if include_lineups:
-        # Enhanced: Use box_scores for detailed player lineup data
-        matchups = league.box_scores(week=week)
-    else:
-        # Simple: Use scoreboard for basic matchup scores (works all years)
-        matchups = league.scoreboard(week=week)
-
-    out: List[Dict[str, Any]] = []
-    for matchup in matchups:
-        item = {
-            "week": w,
-            "is_playoff": getattr(matchup, "is_playoff", False),
-            "matchup_type": getattr(matchup, "matchup_type", "NONE"),
-            "home": {
-                **_team_dict(getattr(matchup, "home_team", None)),
-                "score": getattr(matchup, "home_score", None),
-                "projected": getattr(matchup, "home_projected", None),
-            },
-            "away": {
-                **_team_dict(getattr(matchup, "away_team", None)),
-                "score": getattr(matchup, "away_score", None),
-                "projected": getattr(matchup, "away_projected", None),
-            },
+    spots = int(league.settings.playoff_team_count)
+
+    state = _season_to_date(league)
+    teams = state["teams"]
+    wins = list(state["wins"] + 0.5 * state["ties"])
+    games = list(zip(state["home"].tolist(), state["away"].tolist()))
+    division_ids = sorted({t.division_id for t in teams})
+    divisions = [[i for i, t in enumerate(teams) if t.division_id == d] for d in division_ids]
+    if len(divisions) <= 1:
+        divisions = [list(range(len(teams)))]
+    next_week = state["weeks"][0] if state["weeks"] else None
+
+    counter = [0]
+    out_teams: List[Dict[str, Any]] = []
+    if not games:
+        seeds = _final_seeds(wins, list(state["points"]), divisions)
+    for i, t in enumerate(teams):
+        entry: Dict[str, Any] = {
+            "team_id": t.team_id,
+            "abbrev": t.team_abbrev,
+            "name": t.team_name,
+            "wins": int(state["wins"][i]),
+            "losses": int(state["losses"][i]),
+            "ties": int(state["ties"][i]),
+            "clinches_with_win": False,
+            "eliminated_with_loss": False,
         }
-        if include_lineups:
-            item["lineups"] = {
-                "home": [_box_player_dict(p) for p in getattr(matchup, "home_lineup", [])],
-                "away": [_box_player_dict(p) for p in getattr(matchup, "away_lineup", [])],
-            }
-        out.append(item)
+        if not games:
+            entry["status"] = "clinched" if seeds.index(i) < spots else "eliminated"
+            out_teams.append(entry)
+            continue
+
+        clinched = not _can_miss_playoffs(wins, games, i, divisions, spots, counter)
+        eliminated = not clinched and not _can_make_playoffs(wins, games, i, divisions, spots, counter)
+        entry["status"] = "clinched" if clinched else "eliminated" if eliminated else "alive"
+
+        # Condition on next week's result for teams that are still alive
+        next_game = next(
+            (g for g, w in zip(games, state["game_weeks"]) if w == next_week and i in g), None
+        )
+        if entry["status"] == "alive" and next_game is not None:
+            opponent = next_game[1] if next_game[0] == i else next_game[0]
+            rest = list(games)
+            rest.remove(next_game)
+            won, lost = list(wins), list(wins)
+            won[i] += 1
+            lost[opponent] += 1
+            entry["clinches_with_win"] = not _can_miss_playoffs(won, rest, i, divisions, spots, counter)
+            entry["eliminated_with_loss"] = not _can_make_playoffs(lost, rest, i, divisions, spots, counter)
+        out_teams.append(entry)
+
+    order = {"clinched": 0, "alive": 1, "eliminated": 2}
+    out_teams.sort(key=lambda x: (order[x["status"]], -x["wins"]))
 
     duration_ms = int((time.time() - start_time) * 1000)
-    logger.info(
-        "get_matchups completed",
-        extra={
-            "tool": "get_matchups",
-            "week": w,
-            "duration_ms": duration_ms,
-            "matchup_count": len(out),
-            "include_lineups": include_lineups,
-            "status": "success"
-        }
-    )
-    return out
+    _annotate(league_id=league.league_id, year=league.year)
+    return {
+        "league_id": league.league_id,
+        "year": league.year,
+        "playoff_team_count": spots,
+        "next_week": next_week,
+        "weeks_remaining": state["weeks"],
+        "games_remaining": len(games),
+        "nodes_explored": counter[0],
+        "duration_ms": duration_ms,
+        "teams": out_teams,
+    }
 
 
-@mcp.tool
-def get_enhanced_boxscores(
-    week: Optional[int] = None,
-    league_id: Optional[int] = None,
+@_tool
+def get_all_play_standings(
     year: Optional[int] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    league_id: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
-    Get detailed box scores with formatted lineup tables (starters + bench) for any week.
+    Get all-play standings (record vs every team every week), expected wins, and luck.
 
     Args:
-        week: NFL week number 1-18 (optional, defaults to current week)
-        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
         year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+        start_year: First season for a multi-season luck ranking (optional)
+        end_year: Last season for a multi-season luck ranking (optional, defaults to ESPN_YEAR env var)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
 
     Returns:
-        Structured matchup data + formatted markdown tables with player stats
+        Single season: teams ranked by all-play win percentage.
+        Multi-season (start_year set): every team-season ranked from unluckiest to luckiest.
 
     Examples:
-        - get_enhanced_boxscores() → Current week boxscores
-        - get_enhanced_boxscores(week=5) → Week 5 of current season
-        - get_enhanced_boxscores(week=1, year=2022) → Week 1 of 2022 season
+        - get_all_play_standings() → Current season all-play standings
+        - get_all_play_standings(year=2019) → 2019 season
+        - get_all_play_standings(start_year=2011) → "Unluckiest team ever" across all seasons
 
-    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
-          Box scores availability is limited for seasons before 2019.
+    Note: Regular-season weeks only. Luck is actual wins minus expected (all-play) wins.
+          Finished weeks are cached persistently; seasons that fail to load are listed
+          in skipped_years. Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
     """
-    start_time = time.time()
-    league = _get_league(league_id, year)
-    box_scores = league.box_scores(week=week)
-    w = int(week or getattr(league, "current_week", 0))
-
-    matchups_data: List[Dict[str, Any]] = []
-
-    for bs in box_scores:
-        home_team = getattr(bs, "home_team", None)
-        away_team = getattr(bs, "away_team", None)
+    lid = int(league_id or DEFAULT_LEAGUE_ID)
 
-        matchup = {
-            "home_team": getattr(home_team, "team_name", "Unknown") if home_team else "Unknown",
-            "home_score": getattr(bs, "home_score", 0.0),
-            "away_team": getattr(away_team, "team_name", "Unknown") if away_team else "Unknown",
-            "away_score": getattr(bs, "away_score", 0.0),
-            "home_lineup": [_box_player_dict(p) for p in getattr(bs, "home_lineup", [])],
-            "away_lineup": [_box_player_dict(p) for p in getattr(bs, "away_lineup", [])],
+    if start_year is None:
+        yr = int(year or DEFAULT_YEAR)
+        index = _all_play_season_index(lid, yr)
+        table = sorted(_all_play_table(index), key=lambda x: (-x["all_play_pct"], -x["points_for"]))
+        result: Dict[str, Any] = {
+            "league_id": lid,
+            "year": yr,
+            "weeks": list(index["weeks"]),
+            "standings": [{"rank": i + 1, **row} for i, row in enumerate(table)],
         }
-        matchups_data.append(matchup)
-
-    # Generate formatted markdown output
-    formatted_output = _format_boxscore_markdown(w, matchups_data)
-
-    duration_ms = int((time.time() - start_time) * 1000)
-    logger.info(
-        "get_enhanced_boxscores completed",
-        extra={
-            "tool": "get_enhanced_boxscores",
-            "week": w,
-            "duration_ms": duration_ms,
-            "matchup_count": len(matchups_data),
-            "status": "success"
+    else:
+        first, last = int(start_year), int(end_year or DEFAULT_YEAR)
+        rows: List[Dict[str, Any]] = []
+        skipped: List[Dict[str, Any]] = []
+        for yr in range(first, last + 1):
+            try:
+                index = _all_play_season_index(lid, yr)
+            except RuntimeError as e:
+                skipped.append({"year": yr, "error": str(e)})
+                continue
+            rows.extend({"year": yr, **row} for row in _all_play_table(index))
+        rows.sort(key=lambda x: x["luck"])
+        result = {
+            "league_id": lid,
+            "start_year": first,
+            "end_year": last,
+            "team_seasons": rows,
+            "skipped_years": skipped,
         }
-    )
 
-    return {
-        "week": w,
-        "matchups": matchups_data,
-        "formatted_output": formatted_output,
-    }
+    _annotate(league_id=lid)
+    return result
 
 
-@mcp.tool
-def get_power_rankings(
+@_tool
+def get_standings_timeline(
+    year: Optional[int] = None,
     week: Optional[int] = None,
     league_id: Optional[int] = None,
-    year: Optional[int] = None,
-) -> List[Dict[str, Any]]:
+) -> Dict[str, Any]:
     """
-    Get two-step dominance power rankings for any week/season.
+    Get how the standings evolved week by week through a season (for charting).
 
     Args:
-        week: NFL week number 1-18 (optional, defaults to current week)
-        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
         year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+        week: Return only the standings after this week (optional, defaults to the full timeline)
+        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
 
     Returns:
-        Teams ranked by power ranking score
+        Full timeline: per-team series of cumulative wins, losses, ties, points-for, and rank.
+        With week: standings as they stood after that week.
 
     Examples:
-        - get_power_rankings() → Current week rankings
-        - get_power_rankings(week=10) → Week 10 of current season
-        - get_power_rankings(week=5, year=2022) → Week 5 of 2022 season
+        - get_standings_timeline() → Current season, every finished week
+        - get_standings_timeline(year=2021) → 2021 regular season race
+        - get_standings_timeline(year=2023, week=8) → Standings after week 8 of 2023
 
-    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    Note: Regular-season weeks only. Rank orders by win percentage, then points-for
+          (ESPN's head-to-head tiebreakers are not applied). Built from the cached
+          all-play index, so lookups for any week need no ESPN request.
+          Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
     """
-    league = _get_league(league_id, year)
-    rankings = league.power_rankings(week=week)
-    return [{"score": float(score), "team": _team_dict(team)} for score, team in rankings]
-
-
-@mcp.tool
-def get_teams(
+    lid = int(league_id or DEFAULT_LEAGUE_ID)
+    yr = int(year or DEFAULT_YEAR)
+    timeline = _standings_timeline(lid, yr)
+
+    result: Dict[str, Any] = {"league_id": lid, "year": yr, "weeks": list(timeline["weeks"])}
+    if week is not None:
+        if int(week) not in timeline["columns"]:
+            raise ValueError(
+                f"Week {week} is not a finished regular-season week of {yr} "
+                f"(available: {timeline['weeks'] or 'none'})"
+            )
+        result["week"] = int(week)
+        result["standings"] = _standings_at(timeline, int(week))
+    else:
+        series = []
+        for i, tid in enumerate(timeline["team_ids"]):
+            team = timeline["teams"].get(str(tid), {})
+            series.append({
+                "team_id": tid,
+                "abbrev": team.get("abbrev"),
+                "name": team.get("name"),
+                "wins": timeline["wins"][i].tolist(),
+                "losses": timeline["losses"][i].tolist(),
+                "ties": timeline["ties"][i].tolist(),
+                "points_for": timeline["points_for"][i].tolist(),
+                "rank": timeline["rank"][i].tolist(),
+            })
+        series.sort(key=lambda x: x["rank"][-1] if x["rank"] else 0)
+        result["teams"] = series
+
+    _annotate(league_id=lid, year=yr)
+    return result
+
+
+@_tool
+def get_league_records(
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    limit: int = 5,
     league_id: Optional[int] = None,
-    year: Optional[int] = None,
-) -> List[Dict[str, Any]]:
+) -> Dict[str, Any]:
     """
-    Get raw list of all teams in the league for any season.
+    Get the league record book: best and worst games, blowouts, streaks, and seasons.
 
     Args:
+        start_year: First season to include (optional, defaults to ESPN_HISTORY_START_YEAR, 2011)
+        end_year: Last season to include (optional, defaults to ESPN_YEAR env var)
+        limit: Entries per record, up to 10 (default: 5)
         league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
-        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
 
     Returns:
-        List of all teams with basic info (no ranking)
+        Single-game records (highest/lowest score, biggest blowout, narrowest win,
+        highest combined score), longest win/losing streaks, and regular-season
+        records (most/fewest points, best/worst record), plus index timing
 
     Examples:
-        - get_teams() → All teams in current season
-        - get_teams(year=2016) → All teams from 2016 season
-
-    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+        - get_league_records() → All-time record book
+        - get_league_records(start_year=2020) → Records since 2020
+        - get_league_records(limit=10) → Top 10 of each record
+
+    Note: Regular season and winners-bracket games count; consolation games do not.
+          Streaks continue across seasons and ties end them. Each season's records are
+          cached persistently and only newly final weeks are applied. Seasons that fail
+          to load are listed in skipped_years. Historical seasons (2018-2022) require
+          ESPN_S2 and SWID authentication.
     """
-    league = _get_league(league_id, year)
-    return [_team_dict(t) for t in league.teams]
+    start_time = time.time()
+    lid = int(league_id or DEFAULT_LEAGUE_ID)
+    first, last = int(start_year or HISTORY_START_YEAR), int(end_year or DEFAULT_YEAR)
+    n = max(1, min(int(limit), RECORDS_TOP_N))
+    weeks_before = _RECORDS_STATS["weeks_applied"]
+
+    seasons: List[Tuple[int, Dict[str, Any]]] = []
+    skipped: List[Dict[str, Any]] = []
+    for yr in range(first, last + 1):
+        try:
+            seasons.append((yr, _records_season_index(lid, yr)))
+        except RuntimeError as e:
+            skipped.append({"year": yr, "error": str(e)})
+
+    games = {
+        name: heapq.nsmallest(
+            n,
+            (e for _, index in seasons for e in index["records"][name]),
+            key=lambda e, name=name: _record_sort_key(name, e),
+        )
+        for name in _RECORD_ORDER
+    }
+    duration_ms = int((time.time() - start_time) * 1000)
+    result = {
+        "league_id": lid,
+        "start_year": first,
+        "end_year": last,
+        "seasons": [yr for yr, _ in seasons],
+        **games,
+        "longest_win_streak": _longest_streaks(seasons, "W", n),
+        "longest_losing_streak": _longest_streaks(seasons, "L", n),
+        **_season_records(seasons, n),
+        "skipped_years": skipped,
+        "weeks_applied": _RECORDS_STATS["weeks_applied"] - weeks_before,
+        "duration_ms": duration_ms,
+    }
+    _annotate(league_id=lid)
+    return result
 
 
-@mcp.tool
-def get_scoreboard(
-    week: Optional[int] = None,
+@_tool
+def query_league_data(
+    sql: str,
+    limit: int = 100,
     league_id: Optional[int] = None,
-    year: Optional[int] = None,
-) -> List[Dict[str, Any]]:
+) -> Dict[str, Any]:
     """
-    Get simple scoreboard view (lighter than box scores) for any week.
+    Run a read-only SQL query against a local warehouse of league history.
 
     Args:
-        week: NFL week number 1-18 (optional, defaults to current week)
-        league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
-        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
+        sql: A single SQLite SELECT statement
+        limit: Maximum rows to return, up to WAREHOUSE_MAX_ROWS (default: 100)
+        league_id: ESPN league ID that must have seasons in the warehouse (optional, defaults to ESPN_LEAGUE_ID env var)
 
     Returns:
-        Matchups with basic scores (no player-level details)
+        Column names, rows, whether rows were cut off at the limit, and the seasons loaded for the league
 
-    Examples:
-        - get_scoreboard() → Current week scores
-        - get_scoreboard(week=5) → Week 5 of current season
-        - get_scoreboard(week=1, year=2022) → Week 1 of 2022 season
+    Tables (every table has league_id and year):
+        - seasons(complete, final_weeks, players_complete)
+        - teams(team_id, abbrev, name)
+        - matchups(week, matchup_type, is_playoff, home_team_id, away_team_id, home_score, away_score, winner)
+          winner is HOME, AWAY, or TIE; away_* is NULL for byes
+        - team_weeks view (week, team_id, opponent_id, points_for, points_against, result W/L/T, is_playoff, matchup_type)
+        - player_weeks(week, player_id, player_name, team_id, slot, position, points, projected)
+          rostered players only, seasons 2019+; slot BE/IR means benched
 
-    Note: Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
+    Examples:
+        - query_league_data("SELECT year, MAX(points_for) FROM team_weeks GROUP BY year")
+        - query_league_data("SELECT t.name, COUNT(*) FROM team_weeks w JOIN teams t USING (league_id, year, team_id) WHERE w.result = 'W' AND w.is_playoff GROUP BY t.name ORDER BY 2 DESC")
+        - query_league_data("SELECT player_name, SUM(points) FROM player_weeks WHERE slot IN ('BE', 'IR') GROUP BY player_id ORDER BY 2 DESC", limit=10)
+
+    Note: Only finished weeks are included. Seasons are loaded from ESPN by
+          refresh_league_data(); a query makes no ESPN requests and only adds weeks
+          that other tools have already loaded in this process. A league with no
+          seasons in the warehouse raises an error. Queries run on a read-only
+          connection and are stopped after WAREHOUSE_QUERY_TIMEOUT_MS.
     """
-    league = _get_league(league_id, year)
-    scoreboard = league.scoreboard(week=week)
-    w = int(week or getattr(league, "current_week", 0))
-    out: List[Dict[str, Any]] = []
-    for m in scoreboard:
-        out.append({
-            "week": w,
-            "home": {**_team_dict(getattr(m, "home_team", None)), "score": getattr(m, "home_score", None)},
-            "away": {**_team_dict(getattr(m, "away_team", None)), "score": getattr(m, "away_score", None)},
-        })
-    return out
+    lid = int(league_id or DEFAULT_LEAGUE_ID)
+    max_rows = max(1, min(int(limit), WAREHOUSE_MAX_ROWS))
+    for yr in range(HISTORY_START_YEAR, DEFAULT_YEAR + 1):
+        _warehouse_sync_season(lid, yr, fetch=False)
+    seasons = _warehouse_seasons(lid)
+    if not seasons:
+        with _WAREHOUSE_REFRESH_LOCK:
+            running = _WAREHOUSE_REFRESH["state"] == "running" and _WAREHOUSE_REFRESH["league_id"] == lid
+        hint = (
+            "a refresh is running; check its progress with refresh_league_data()" if running
+            else "call refresh_league_data(start_year=..., end_year=...) to load seasons first"
+        )
+        raise RuntimeError(f"The league data warehouse is not populated for league {lid}: {hint}.")
+    _WAREHOUSE_STATS["queries"] += 1
+    columns, rows, truncated = _warehouse_query(sql, max_rows)
 
+    _annotate(league_id=lid, rows=len(rows))
+    return {
+        "columns": columns,
+        "rows": [list(r) for r in rows],
+        "row_count": len(rows),
+        "truncated": truncated,
+        "seasons_loaded": seasons,
+    }
 
-@mcp.tool
-def get_player_info(
-    name: Optional[str] = None,
-    player_id: Optional[int] = None,
+
+@_tool
+def refresh_league_data(
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
     league_id: Optional[int] = None,
-    year: Optional[int] = None,
-):
+) -> Dict[str, Any]:
     """
-    Look up player information by name or ESPN player ID for any season.
+    Load seasons into the query_league_data warehouse on a background thread.
 
     Args:
-        name: Player name like "Patrick Mahomes" (optional, searches league roster)
-        player_id: ESPN player ID (optional, direct lookup)
+        start_year: First season to load (optional, defaults to ESPN_YEAR env var)
+        end_year: Last season to load (optional, defaults to ESPN_YEAR env var)
         league_id: ESPN league ID (optional, defaults to ESPN_LEAGUE_ID env var)
-        year: Season year like 2016, 2022, 2025 (optional, defaults to ESPN_YEAR env var)
 
     Returns:
-        Player details including stats, position, team
+        The refresh job: state (running/done/failed), league_id, years, seasons_done,
+        rows_added, skipped_years, and whether this call started it
 
     Examples:
-        - get_player_info(name="Patrick Mahomes") → Search current season
-        - get_player_info(name="Tom Brady", year=2022) → 2022 season player
-        - get_player_info(player_id=12345) → Direct lookup by ID
-
-    Note: Must provide either 'name' or 'player_id'.
+        - refresh_league_data() → Load the current season's finished weeks
+        - refresh_league_data(start_year=2011) → Backfill 2011 through the current season
+        - refresh_league_data() while a refresh runs → Its progress; nothing new is started
+
+    Note: Returns immediately; call again to follow progress. Only one refresh runs
+          at a time. Scoreboards are loaded for every season and player points for
+          2019+, so a cold multi-season backfill can take minutes. Finished seasons
+          already in the warehouse are skipped without ESPN requests.
           Historical seasons (2018-2022) require ESPN_S2 and SWID authentication.
     """
-    league = _get_league(league_id, year)
+    lid = int(league_id or DEFAULT_LEAGUE_ID)
+    first = int(start_year or DEFAULT_YEAR)
+    last = int(end_year or DEFAULT_YEAR)
+    if first > last:
+        raise ValueError(f"start_year ({first}) must not be after end_year ({last})")
+
+    with _WAREHOUSE_REFRESH_LOCK:
+        started = _WAREHOUSE_REFRESH["state"] != "running"
+        if started:
+            years = list(range(first, last + 1))
+            thread = threading.Thread(
+                target=_warehouse_refresh, args=(lid, years), name="warehouse-refresh", daemon=True
+            )
+            _WAREHOUSE_REFRESH.clear()
+            _WAREHOUSE_REFRESH.update(
+                state="running", thread=thread, league_id=lid, years=years, seasons_done=0,
+                rows_added=0, skipped_years=[], started_at=datetime.now(timezone.utc).isoformat(),
+            )
+            thread.start()
+        status = _warehouse_refresh_status()
+
+    _annotate(league_id=lid, started=started)
+    return {**status, "started": started}
+
+
+# --- Startup ---------------------------------------------------------------
+# The first ping() logs how long the process took to become ready: startup_ms
+# from process start (read from /proc, or from the start of this module's
+# imports elsewhere) and import_ms for importing this module.
+_STARTUP = {"import_ms": None, "ping_served": False}
+
+
+def _process_age_ms() -> Optional[float]:
+    """Milliseconds since this process started, or None where /proc is unavailable."""
     try:
-        res = league.player_info(name=name, playerId=player_id)
-    except Exception as e:
-        raise RuntimeError("Player info unavailable without auth for this query.") from e
-
-    def _pd(p):
-        return {
-            "name": getattr(p, "name", None),
-            "playerId": getattr(p, "playerId", None),
-            "position": getattr(p, "position", None),
-            "proTeam": getattr(p, "proTeam", None),
-            "injuryStatus": getattr(p, "injury_status", getattr(p, "injuryStatus", None)),
-            "total_points": getattr(p, "total_points", None),
-            "avg_points": getattr(p, "avg_points", None),
-            "projected_total_points": getattr(p, "projected_total_points", None),
-            "projected_avg_points": getattr(p, "projected_avg_points", None),
-        }
-
-    if res is None:
+        with open("/proc/self/stat", encoding="ascii") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime", encoding="ascii") as f:
+            uptime = float(f.read().split()[0])
+        return round((uptime - start_ticks / os.sysconf("SC_CLK_TCK")) * 1000, 1)
+    except (OSError, ValueError, IndexError, AttributeError):
         return None
-    if isinstance(res, list):
-        return [_pd(p) for p in res]
-    return _pd(res)
 
 
 # Optional convenience tool for health checks
-@mcp.tool
+@_tool
 def ping() -> str:
     """
     Health check endpoint to verify server is running.
@@ -637,11 +4690,25 @@ def ping() -> str:
 
     Example:
         - ping() → "pong"
+
+    Note: The first ping is logged as "First ping served" with startup_ms
+          (process start to this call) and import_ms.
     """
+    if not _STARTUP["ping_served"]:
+        _STARTUP["ping_served"] = True
+        age = _process_age_ms()
+        logger.info(
+            "First ping served",
+            extra={
+                "startup_ms": age if age is not None else round((time.perf_counter() - _IMPORT_STARTED) * 1000, 1),
+                "startup_clock": "process" if age is not None else "import",
+                "import_ms": _STARTUP["import_ms"],
+            }
+        )
     return "pong"
 
 
-@mcp.tool
+@_tool
 def get_cache_stats() -> Dict[str, Any]:
     """
     Get cache performance statistics for monitoring and observability.
@@ -656,6 +4723,8 @@ def get_cache_stats() -> Dict[str, Any]:
     """
     total = _CACHE_STATS["hits"] + _CACHE_STATS["misses"]
     hit_rate = (_CACHE_STATS["hits"] / total * 100) if total > 0 else 0.0
+    with _WAREHOUSE_REFRESH_LOCK:
+        refresh = _warehouse_refresh_status()
 
     return {
         "enabled": _CACHE_STATS["enabled"],
@@ -664,34 +4733,200 @@ def get_cache_stats() -> Dict[str, Any]:
         "total_requests": total,
         "hit_rate_percent": round(hit_rate, 2),
         "cached_leagues": len(_LEAGUE_CACHE),
+        "league_memory": {
+            "budget_mb": LEAGUE_CACHE_MAX_MB,
+            "used_mb": round(sum(_LEAGUE_CACHE_BYTES.values()) / (1024 * 1024), 2),
+            "evictions": _CACHE_STATS["evictions"],
+            "leagues_mb": {
+                f"{lid}/{yr}": round(size / (1024 * 1024), 3) for (lid, yr), size in _LEAGUE_CACHE_BYTES.items()
+            },
+        },
+        "cached_scoreboards": len(_SCOREBOARD_CACHE),
+        "player_search": {
+            "indexed_seasons": len(_PLAYER_INDEX),
+            "cached_player_details": len(_PLAYER_DETAIL_CACHE),
+            **_PLAYER_SEARCH_STATS,
+        },
+        "free_agents": {
+            "cached_pools": len(_FREE_AGENT_POOLS),
+            "hits": _FREE_AGENT_STATS["hits"],
+            "misses": _FREE_AGENT_STATS["misses"],
+            "hit_rate_percent": round(
+                100.0 * _FREE_AGENT_STATS["hits"] / (_FREE_AGENT_STATS["hits"] + _FREE_AGENT_STATS["misses"]), 2
+            ) if _FREE_AGENT_STATS["hits"] + _FREE_AGENT_STATS["misses"] else 0.0,
+        },
+        "activity": {
+            "logs": len(_ACTIVITY_LOGS),
+            "entries": sum(len(log["entries"]) for log in _ACTIVITY_LOGS.values()),
+            **_ACTIVITY_STATS,
+        },
+        "records": {
+            "indexed_seasons": len(_RECORDS_INDEX),
+            "weeks_applied": _RECORDS_STATS["weeks_applied"],
+            "avg_week_update_ms": round(
+                _RECORDS_STATS["update_ms"] / _RECORDS_STATS["weeks_applied"], 3
+            ) if _RECORDS_STATS["weeks_applied"] else 0.0,
+        },
+        "warehouse": {
+            "target": _warehouse_target()[0],
+            **_WAREHOUSE_STATS,
+            "refresh": refresh,
+        },
+        "persistent": {
+            "enabled": ENABLE_PERSISTENT_CACHE,
+            "directory": CACHE_DIR,
+            "entries": _persist_entries() if ENABLE_PERSISTENT_CACHE else 0,
+            **_PERSIST_STATS,
+        },
     }
 
 
-@mcp.tool
-def clear_cache() -> Dict[str, str]:
+@_tool
+def clear_cache(include_persistent: bool = False) -> Dict[str, str]:
     """
     Clear all cached league data to force fresh API calls to ESPN.
 
+    Args:
+        include_persistent: Also delete on-disk indexes built from finished weeks (default: False)
+
     Returns:
         Confirmation message with number of cleared entries
 
-    Example:
+    Examples:
         - clear_cache() → {"status": "success", "message": "Cleared 1 cached league(s)"}
+        - clear_cache(include_persistent=True) → Also rebuilds indexes from scratch on next use
 
     Use cases:
         - Testing changes or debugging
         - Forcing fresh data after trades/roster moves
         - Resetting performance metrics
     """
-    count = len(_LEAGUE_CACHE)
-    _LEAGUE_CACHE.clear()
+    with _LEAGUE_CACHE_LOCK:
+        count = len(_LEAGUE_CACHE)
+        _LEAGUE_CACHE.clear()
+        _LEAGUE_CACHE_BYTES.clear()
+    _SCOREBOARD_CACHE.clear()
+    with _PLAYER_DETAIL_LOCK:
+        _PLAYER_DETAIL_CACHE.clear()
+    _FREE_AGENT_POOLS.clear()
+    with _INDEX_LOCK:
+        _H2H_INDEX.clear()
+        _ALL_PLAY_INDEX.clear()
+        _STANDINGS_TIMELINES.clear()
+        _PLAYER_POINTS.clear()
+        _OPTIMAL_LINEUPS.clear()
+        _PROJECTION_ACCURACY.clear()
+        _ACTIVITY_LOGS.clear()
+        _RECORDS_INDEX.clear()
+    with _DRAFT_LOCK:
+        _DRAFTS.clear()
+    message = f"Cleared {count} cached league(s)"
+    if include_persistent:
+        removed = _persist_clear() + _warehouse_reset()
+        message += f" and {removed} persistent entr{'y' if removed == 1 else 'ies'}"
     logger.info("Cache cleared", extra={"cleared_entries": count})
     return {
         "status": "success",
-        "message": f"Cleared {count} cached league(s)",
+        "message": message,
     }
 
 
+@_tool
+def list_profiles(tool: Optional[str] = None, limit: int = 20) -> Dict[str, Any]:
+    """
+    List recently captured tool-call profiles, newest first.
+
+    Args:
+        tool: Only profiles of this tool (optional, defaults to all tools)
+        limit: Maximum profiles to return (default: 20)
+
+    Returns:
+        Profiling settings and, per profile, the tool, arguments, duration, trace id,
+        .pstats path, and its ten hottest functions by cumulative time
+
+    Examples:
+        - list_profiles() → Latest profiles
+        - list_profiles(tool="get_enhanced_boxscores", limit=5) → Slow box score captures
+
+    Note: Profiling is off unless PROFILE_SAMPLE_RATE > 0. PROFILE_TOOLS limits it to
+          named tools (comma-separated, default "*"). Open a .pstats file with
+          `python -m pstats <file>` or snakeviz.
+    """
+    directory = _profile_dir()
+    try:
+        names = sorted((n for n in os.listdir(directory) if n.endswith(".json")), reverse=True)
+    except FileNotFoundError:
+        names = []
+    profiles: List[Dict[str, Any]] = []
+    for name in names:
+        if len(profiles) >= max(1, int(limit)):
+            break
+        try:
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if tool is None or meta.get("tool") == tool:
+            profiles.append(meta)
+    return {
+        "enabled": PROFILE_SAMPLE_RATE > 0,
+        "sample_rate": PROFILE_SAMPLE_RATE,
+        "tools": sorted(PROFILE_TOOLS),
+        "directory": directory,
+        "profiles": profiles,
+    }
+
+
+@_tool
+def get_slow_calls(tool: Optional[str] = None, limit: int = 20) -> Dict[str, Any]:
+    """
+    List recent tool calls that exceeded their slow-call threshold, slowest first.
+
+    Args:
+        tool: Only calls of this tool (optional, defaults to all tools)
+        limit: Maximum calls to return (default: 20)
+
+    Returns:
+        Threshold settings and, per slow call, the tool, arguments, duration, threshold,
+        phase timings, cache behaviour (league cache hits/misses, persistent reads,
+        ESPN requests), status, and trace id
+
+    Examples:
+        - get_slow_calls() → Slowest recent calls across all tools
+        - get_slow_calls(tool="get_league_records") → Which seasons made records slow
+
+    Note: The default threshold is SLOW_CALL_THRESHOLD_MS (1000); SLOW_CALL_THRESHOLDS
+          overrides it per tool ("tool=ms,..."). The slowest SLOW_CALL_BUFFER_SIZE
+          calls of the last SLOW_CALL_MAX_AGE_S seconds are kept, so a burst of
+          calls just over the threshold never evicts a larger outlier. Slow calls
+          are also logged at WARNING.
+    """
+    with _SLOW_CALLS_LOCK:
+        _expire_slow_calls(time.monotonic())
+        buffered = len(_SLOW_CALLS)
+        calls = [item[3] for item in _SLOW_CALLS if tool is None or item[3]["tool"] == tool]
+    calls.sort(key=lambda c: c["duration_ms"], reverse=True)
+    return {
+        "default_threshold_ms": SLOW_CALL_THRESHOLD_MS,
+        "thresholds_ms": dict(SLOW_CALL_THRESHOLDS),
+        "buffered": buffered,
+        "capacity": max(1, SLOW_CALL_BUFFER_SIZE),
+        "max_age_s": SLOW_CALL_MAX_AGE_S,
+        "calls": calls[:max(1, int(limit))],
+    }
+
+
+# --- HTTP Routes -------------------------------------------------------------
+# Served alongside the MCP endpoint when MCP_TRANSPORT is http or sse.
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> PlainTextResponse:
+    """Prometheus scrape endpoint."""
+    from starlette.responses import PlainTextResponse
+
+    return PlainTextResponse(_render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 # --- Prompts -----------------------------------------------------------------
 
 @mcp.prompt()
@@ -729,6 +4964,7 @@ TOOL SELECTION MAPPING:
 League Information:
 - "standings", "rankings", "who's winning" → get_standings(year=X)
 - "power rankings", "power rank" → get_power_rankings(year=X)
+- "power rankings over the season", "power ranking trend/chart" → get_power_rankings_series(year=X)
 - "league info", "league settings" → get_league(year=X)
 
 Matchup & Scoring:
@@ -739,6 +4975,26 @@ Matchup & Scoring:
 Teams & Players:
 - "team list", "all teams" → get_teams(year=X)
 - "player info", "find player" → get_player_info(name="X", year=Y)
+- "search player", partial or misspelled names, last name only → search_players(query="X")
+
+Projections:
+- "playoff chances", "playoff odds", "will I make the playoffs" → get_playoff_odds()
+- "clinched", "eliminated", "what do I need to clinch" → get_clinch_scenarios()
+
+League History:
+- "record vs", "head to head", "rivalry", "all-time series" → get_head_to_head(team_a=X, team_b=Y, start_year=Z)
+- "all-play", "luck", "expected wins" → get_all_play_standings(year=X)
+- "unluckiest team ever", "luckiest season" → get_all_play_standings(start_year=2011)
+- "standings after week X", "how the standings changed", "standings race" → get_standings_timeline(year=X, week=Y)
+- Ad-hoc questions spanning many seasons, teams, or players (counts, averages, "how often") → query_league_data(sql="SELECT ...")
+- "highest score ever", "biggest blowout", "longest win streak", "record book" → get_league_records()
+- "optimal lineup", "points left on bench", "start/sit regrets" → get_optimal_lineup_analysis(year=X)
+- "projection accuracy", "how good are ESPN projections" → get_projection_accuracy(start_year=X, group_by="position")
+- "trades", "waiver claims", "adds and drops", "transactions" → get_transactions(type="trade", year=X)
+- "draft results", "who did X draft" → get_draft(year=X, team_id=Y)
+- "first-round picks ever", "draft history" → get_draft_history(round_num=1)
+- "free agents", "waiver wire", "who should I pick up" → get_free_agents(position="RB", sort="projected")
+- "top RBs", "best players weeks X-Y", "points leaders" → get_player_leaderboard(position="RB", start_week=X, end_week=Y)
 
 System:
 - "cache stats", "cache performance" → get_cache_stats()
@@ -790,6 +5046,9 @@ ALWAYS:
 """
 
 
+_STARTUP["import_ms"] = round((time.perf_counter() - _IMPORT_STARTED) * 1000, 1)
+
+
 if __name__ == "__main__":
     # Choose transport by env:
     #   MCP_TRANSPORT=stdio (default)
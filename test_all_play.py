@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Offline tests for get_all_play_standings() and the all-play index.
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from espn_api.football import League
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+def _loop_all_play(league):
+    """Reference all-play records computed with plain loops over espn_api teams."""
+    reg = league.settings.reg_season_count
+    weeks = [w for w in range(reg) if all(t.outcomes[w] != "U" for t in league.teams)]
+    records = {}
+    for t in league.teams:
+        wins = losses = ties = 0
+        for w in weeks:
+            for o in league.teams:
+                if o is t:
+                    continue
+                wins += t.scores[w] > o.scores[w]
+                losses += t.scores[w] < o.scores[w]
+                ties += t.scores[w] == o.scores[w]
+        records[t.team_id] = (wins, losses, ties, t.wins)
+    return records
+
+
+def test_matches_loop_reference(cache_dir):
+    """Vectorized records equal a plain-loop computation and actual wins match ESPN."""
+    with offline_espn({2024: {}, 2025: {"current_week": 7}}):
+        for yr in (2024, 2025):
+            result = rffl_mcp_server.get_all_play_standings.fn(year=yr)
+            expected = _loop_all_play(League(FIXTURE_LEAGUE_ID, yr))
+            for row in result["standings"]:
+                w, l, t, actual = expected[row["team_id"]]
+                assert (row["all_play_wins"], row["all_play_losses"], row["all_play_ties"]) == (w, l, t)
+                assert row["actual_wins"] == actual
+            # Luck balances out across a league with no byes
+            assert abs(sum(r["luck"] for r in result["standings"])) < 0.05
+
+
+def test_multi_season_luck_ranking(cache_dir):
+    """Range mode ranks every team-season from unluckiest to luckiest."""
+    with offline_espn({2022: {}, 2023: {}, 2024: {}}):
+        result = rffl_mcp_server.get_all_play_standings.fn(start_year=2021, end_year=2024)
+    luck = [r["luck"] for r in result["team_seasons"]]
+    assert luck == sorted(luck)
+    assert len(result["team_seasons"]) == 30
+    assert [s["year"] for s in result["skipped_years"]] == [2021]
+
+
+def test_incremental_weeks_match_rebuild(cache_dir):
+    """Appending newly final weeks gives the same table as building from scratch."""
+    with offline_espn({2025: {"current_week": 5}}):
+        rffl_mcp_server.get_all_play_standings.fn(year=2025)
+    rffl_mcp_server._SCOREBOARD_CACHE.clear()
+    with offline_espn({2025: {"current_week": 9}}):
+        incremental = rffl_mcp_server.get_all_play_standings.fn(year=2025)
+    rffl_mcp_server.clear_cache.fn(include_persistent=True)
+    with offline_espn({2025: {"current_week": 9}}):
+        rebuilt = rffl_mcp_server.get_all_play_standings.fn(year=2025)
+    assert incremental["weeks"] == list(range(1, 9))
+    assert incremental == rebuilt
+
+
+def test_scoreboards_fetched_without_index_lock(cache_dir, monkeypatch):
+    """Other threads can use the index lock while each season's scoreboard is fetched."""
+    fetch = rffl_mcp_server._season_scoreboard
+    acquired = []
+
+    def probe(lid, yr):
+        def try_lock():
+            if rffl_mcp_server._INDEX_LOCK.acquire(timeout=1):
+                rffl_mcp_server._INDEX_LOCK.release()
+                acquired.append(yr)
+        worker = threading.Thread(target=try_lock)
+        worker.start()
+        worker.join()
+        return fetch(lid, yr)
+
+    monkeypatch.setattr(rffl_mcp_server, "_season_scoreboard", probe)
+    with offline_espn({2023: {}, 2024: {}}):
+        result = rffl_mcp_server.get_all_play_standings.fn(start_year=2023, end_year=2024)
+    assert len(result["team_seasons"]) == 20 and acquired == [2023, 2024]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
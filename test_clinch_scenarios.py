@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the clinch/elimination solver behind get_clinch_scenarios().
+
+The pruned search is checked against brute-force enumeration of every
+remaining outcome.
+"""
+
+import itertools
+import os
+import random
+import sys
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from rffl_mcp_server import _teams_ahead
+from espn_fixtures import offline_espn
+
+
+def _brute_force(wins, games, divisions, spots):
+    """Return (clinched, eliminated) sets by trying all 2^games outcomes."""
+    n = len(wins)
+    can_miss, can_make = set(), set()
+    for results in itertools.product((0, 1), repeat=len(games)):
+        final = list(wins)
+        for (a, b), r in zip(games, results):
+            final[a if r else b] += 1
+        for t in range(n):
+            if _teams_ahead(final, t, divisions, final[t], strict=False) >= spots:
+                can_miss.add(t)
+            if _teams_ahead(final, t, divisions, final[t], strict=True) < spots:
+                can_make.add(t)
+    clinched = {t for t in range(n) if t not in can_miss}
+    eliminated = {t for t in range(n) if t not in can_make}
+    return clinched, eliminated
+
+
+def _solve(wins, games, divisions, spots):
+    counter = [0]
+    clinched, eliminated = set(), set()
+    for t in range(len(wins)):
+        if not rffl_mcp_server._can_miss_playoffs(wins, games, t, divisions, spots, counter):
+            clinched.add(t)
+        elif not rffl_mcp_server._can_make_playoffs(wins, games, t, divisions, spots, counter):
+            eliminated.add(t)
+    return clinched, eliminated, counter[0]
+
+
+def test_matches_brute_force():
+    """Random late-season states: solver agrees with full enumeration."""
+    rng = random.Random(11)
+    for trial in range(25):
+        n = rng.choice([6, 8, 10])
+        teams = list(range(n))
+        games = []
+        for _ in range(rng.choice([1, 2, 3])):
+            rng.shuffle(teams)
+            games += [tuple(sorted(teams[i:i + 2])) for i in range(0, n, 2)]
+        wins = [float(rng.randint(3, 9)) for _ in range(n)]
+        divisions = [list(range(n))] if trial % 2 else [list(range(0, n, 2)), list(range(1, n, 2))]
+        spots = rng.choice([2, 4, 6]) if n > 6 else rng.choice([2, 4])
+        expected = _brute_force(wins, games, divisions, spots)
+        clinched, eliminated, _ = _solve(wins, games, divisions, spots)
+        assert (clinched, eliminated) == expected, (trial, wins, games, divisions, spots)
+
+
+def test_prunes_search():
+    """Three weeks left in a 12-team league explores far fewer nodes than 2^games per team."""
+    rng = random.Random(5)
+    teams = list(range(12))
+    games = []
+    for _ in range(3):
+        rng.shuffle(teams)
+        games += [tuple(sorted(teams[i:i + 2])) for i in range(0, 12, 2)]
+    wins = [float(w) for w in (9, 9, 8, 8, 7, 7, 6, 6, 5, 5, 4, 3)]
+    _, _, nodes = _solve(wins, games, [list(range(12))], 6)
+    assert nodes < 12 * 2 * 2 ** len(games) / 100, nodes
+
+
+def test_tool_on_fixture_league():
+    """Tool output is consistent with the playoff odds simulator's extremes."""
+    rffl_mcp_server.clear_cache.fn()
+    with offline_espn({2025: {"current_week": 12}}):
+        result = rffl_mcp_server.get_clinch_scenarios.fn(year=2025)
+        odds = rffl_mcp_server.get_playoff_odds.fn(year=2025, simulations=20000, seed=1)
+    rffl_mcp_server.clear_cache.fn()
+
+    assert result["weeks_remaining"] == [12, 13]
+    assert result["nodes_explored"] > 0
+    pct = {t["team_id"]: t["playoff_pct"] for t in odds["teams"]}
+    for team in result["teams"]:
+        if team["status"] == "clinched":
+            assert pct[team["team_id"]] == 100.0
+        if team["status"] == "eliminated":
+            assert pct[team["team_id"]] == 0.0
+
+
+def test_finished_season_is_exact():
+    """After the regular season every team is clinched or eliminated."""
+    rffl_mcp_server.clear_cache.fn()
+    with offline_espn({2024: {}}):
+        result = rffl_mcp_server.get_clinch_scenarios.fn(year=2024)
+    rffl_mcp_server.clear_cache.fn()
+    statuses = [t["status"] for t in result["teams"]]
+    assert statuses.count("clinched") == result["playoff_team_count"]
+    assert statuses.count("alive") == 0
+
+
+if __name__ == "__main__":
+    tests = [
+        test_matches_brute_force,
+        test_prunes_search,
+        test_tool_on_fixture_league,
+        test_finished_season_is_exact,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
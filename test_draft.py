@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Offline tests for get_draft() and get_draft_history().
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from espn_api.football import League
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+def test_matches_league_draft(cache_dir):
+    """Picks equal espn_api's League.draft, without loading the League."""
+    with offline_espn({2024: {}}) as espn:
+        result = rffl_mcp_server.get_draft.fn(year=2024, league_id=FIXTURE_LEAGUE_ID)
+        calls = list(espn.calls)
+        league = League(FIXTURE_LEAGUE_ID, 2024)
+    assert len(calls) == 2, calls
+    expected = [(p.round_num, p.round_pick, p.team.team_id, p.playerId, p.playerName) for p in league.draft]
+    got = [(p["round"], p["round_pick"], p["team_id"], p["player_id"], p["player"]) for p in result["picks"]]
+    assert got == expected
+    assert result["drafted"] and not result["auction"]
+
+
+def test_history_filters_and_skips(cache_dir):
+    """Team and round filters apply per season; unavailable seasons are reported."""
+    with offline_espn({2015: {}, 2016: {}, 2018: {}}):
+        history = rffl_mcp_server.get_draft_history.fn(
+            start_year=2015, end_year=2018, round_num=1, league_id=FIXTURE_LEAGUE_ID
+        )
+        team = rffl_mcp_server.get_draft.fn(year=2018, team_id="t03", league_id=FIXTURE_LEAGUE_ID)
+    assert [s["year"] for s in history["seasons"]] == [2015, 2016, 2018]
+    assert [s["year"] for s in history["skipped_years"]] == [2017]
+    assert all(len(s["picks"]) == 10 and {p["round"] for p in s["picks"]} == {1} for s in history["seasons"])
+    assert team["picks"] and all(p["team_abbrev"] == "T03" for p in team["picks"])
+
+
+def test_completed_drafts_stored_permanently(cache_dir):
+    """Completed drafts need no ESPN request after a restart; undrafted seasons are not stored."""
+    with offline_espn({2023: {}, 2024: {}, 2025: {"current_week": 1, "drafted": False}}):
+        first = rffl_mcp_server.get_draft_history.fn(
+            start_year=2023, end_year=2025, league_id=FIXTURE_LEAGUE_ID
+        )
+    rffl_mcp_server.clear_cache.fn()
+    with offline_espn({2023: {}, 2024: {}, 2025: {"current_week": 1}}) as espn:
+        second = rffl_mcp_server.get_draft_history.fn(
+            start_year=2023, end_year=2025, league_id=FIXTURE_LEAGUE_ID
+        )
+        assert all("/2025/" in c for c in espn.calls), espn.calls
+    assert [s["drafted"] for s in first["seasons"]] == [True, True, False]
+    assert first["seasons"][:2] == second["seasons"][:2]
+    assert second["seasons"][2]["drafted"] and second["seasons"][2]["picks"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the cached free-agent pool behind get_free_agents().
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+def _free_agents(**kwargs):
+    return rffl_mcp_server.get_free_agents.fn(league_id=FIXTURE_LEAGUE_ID, year=2024, **kwargs)
+
+
+def _pool_calls(espn):
+    return [c for c in espn.calls if "kona_player_info" in c]
+
+
+def test_pool_fetched_once_across_filters(cache_dir):
+    """Different positions and sorts are answered from one ESPN request."""
+    before = dict(rffl_mcp_server._FREE_AGENT_STATS)
+    with offline_espn({2024: {}}) as espn:
+        everyone = _free_agents(size=500)
+        rbs = _free_agents(position="rb", sort="projected", size=5)
+        flex = _free_agents(position="FLEX", sort="points")
+        assert len(_pool_calls(espn)) == 1, espn.calls
+    stats = rffl_mcp_server.get_cache_stats.fn()["free_agents"]
+    assert stats["misses"] - before["misses"] == 1
+    assert stats["hits"] - before["hits"] == 2
+    assert stats["hit_rate_percent"] > 0
+    assert len(everyone["players"]) == everyone["pool_size"] > 0
+    assert rbs["players"] and all("RB" in p["eligible_slots"] for p in rbs["players"])
+    assert all("RB/WR/TE" in p["eligible_slots"] for p in flex["players"])
+
+
+def test_sorting_and_slicing_match_pool(cache_dir):
+    """Results are the top-N of the filtered pool by the requested field."""
+    with offline_espn({2024: {}}):
+        everyone = _free_agents(size=500)["players"]
+        top = _free_agents(position="WR", sort="owned", size=3)["players"]
+    wrs = sorted((p for p in everyone if "WR" in p["eligible_slots"]),
+                 key=lambda p: -p["percent_owned"])
+    assert [p["player_id"] for p in top] == [p["player_id"] for p in wrs[:3]]
+    try:
+        _free_agents(sort="age")
+        assert False, "invalid sort accepted"
+    except ValueError:
+        pass
+
+
+def test_pool_refetched_after_ttl(cache_dir):
+    """An expired pool triggers exactly one new request."""
+    with offline_espn({2024: {}}) as espn:
+        _free_agents(position="QB")
+        for pool in rffl_mcp_server._FREE_AGENT_POOLS.values():
+            pool["fetched_at"] -= rffl_mcp_server.FREE_AGENT_TTL_SECONDS + 1
+        _free_agents(position="TE")
+        _free_agents(position="K")
+        assert len(_pool_calls(espn)) == 2, espn.calls
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the head-to-head index behind get_head_to_head().
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from espn_api.football import League
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+def _brute_force(league, a, b):
+    """Count the series directly from espn_api's per-team schedules."""
+    team = next(t for t in league.teams if t.team_id == a)
+    wins = losses = ties = 0
+    points = 0.0
+    for opponent, outcome, score in zip(team.schedule, team.outcomes, team.scores):
+        if opponent.team_id != b or outcome == "U":
+            continue
+        wins += outcome == "W"
+        losses += outcome == "L"
+        ties += outcome == "T"
+        points += score
+    return wins, losses, ties, round(points, 2)
+
+
+def test_matches_league_schedules(cache_dir):
+    """All-time totals equal the sum of each season's espn_api schedule."""
+    with offline_espn({2022: {}, 2023: {}, 2024: {}}):
+        result = rffl_mcp_server.get_head_to_head.fn(
+            team_a=1, team_b=4, start_year=2022, end_year=2024
+        )
+        expected = [0, 0, 0, 0.0]
+        for yr in (2022, 2023, 2024):
+            w, l, t, pts = _brute_force(League(FIXTURE_LEAGUE_ID, yr), 1, 4)
+            expected = [expected[0] + w, expected[1] + l, expected[2] + t, expected[3] + pts]
+
+    totals = result["all_time"]
+    assert totals["team_a_wins"] == expected[0], (totals, expected)
+    assert totals["team_b_wins"] == expected[1], (totals, expected)
+    assert totals["ties"] == expected[2], (totals, expected)
+    assert abs(totals["team_a_points"] - expected[3]) < 0.01, (totals, expected)
+    assert result["skipped_years"] == []
+    assert all(s["games"] > 0 for s in result["seasons"])
+
+
+def test_resolves_abbrev_and_skips_missing_years(cache_dir):
+    """Teams can be named by abbreviation; seasons that fail to load are reported."""
+    with offline_espn({2024: {}}):
+        by_abbrev = rffl_mcp_server.get_head_to_head.fn(
+            team_a="t01", team_b="T04", start_year=2023, end_year=2024
+        )
+        by_id = rffl_mcp_server.get_head_to_head.fn(
+            team_a=1, team_b=4, start_year=2024, end_year=2024
+        )
+    assert by_abbrev["all_time"] == by_id["all_time"]
+    assert [s["year"] for s in by_abbrev["skipped_years"]] == [2023]
+
+
+def test_incremental_week_ingestion(cache_dir):
+    """An in-progress season only ingests final weeks and catches up later."""
+    with offline_espn({2025: {"current_week": 6}}):
+        rffl_mcp_server.get_head_to_head.fn(team_a=1, team_b=2, start_year=2025, end_year=2025)
+    index = rffl_mcp_server._H2H_INDEX[(FIXTURE_LEAGUE_ID, 2025)]
+    assert index["weeks"] == [1, 2, 3, 4, 5]
+    assert not index["complete"]
+
+    # Two more weeks finish; the scoreboard TTL expires and only new weeks are applied
+    rffl_mcp_server._SCOREBOARD_CACHE.clear()
+    with offline_espn({2025: {"current_week": 8}}):
+        incremental = rffl_mcp_server.get_head_to_head.fn(
+            team_a=1, team_b=2, start_year=2025, end_year=2025
+        )
+    assert rffl_mcp_server._H2H_INDEX[(FIXTURE_LEAGUE_ID, 2025)]["weeks"] == list(range(1, 8))
+
+    rffl_mcp_server.clear_cache.fn(include_persistent=True)
+    with offline_espn({2025: {"current_week": 8}}):
+        rebuilt = rffl_mcp_server.get_head_to_head.fn(
+            team_a=1, team_b=2, start_year=2025, end_year=2025
+        )
+    assert incremental["all_time"] == rebuilt["all_time"]
+
+
+def test_completed_seasons_served_from_persistent_cache(cache_dir):
+    """After a restart, completed seasons are answered without any ESPN request."""
+    with offline_espn({2023: {}, 2024: {}}):
+        first = rffl_mcp_server.get_head_to_head.fn(team_a=2, team_b=3, start_year=2023, end_year=2024)
+
+    # Simulate a restart: drop in-memory state but keep the files on disk
+    rffl_mcp_server.clear_cache.fn()
+    with offline_espn({2023: {}, 2024: {}}) as espn:
+        second = rffl_mcp_server.get_head_to_head.fn(team_a=2, team_b=3, start_year=2023, end_year=2024)
+        assert espn.calls == [], espn.calls
+    assert first == second
+
+
+def test_scoreboard_fetched_without_index_lock(cache_dir, monkeypatch):
+    """Other threads can use the index lock while a season's scoreboard is fetched."""
+    fetch = rffl_mcp_server._season_scoreboard
+    acquired = []
+
+    def probe(lid, yr):
+        def try_lock():
+            if rffl_mcp_server._INDEX_LOCK.acquire(timeout=1):
+                rffl_mcp_server._INDEX_LOCK.release()
+                acquired.append(yr)
+        worker = threading.Thread(target=try_lock)
+        worker.start()
+        worker.join()
+        return fetch(lid, yr)
+
+    monkeypatch.setattr(rffl_mcp_server, "_season_scoreboard", probe)
+    with offline_espn({2023: {}, 2024: {}}):
+        result = rffl_mcp_server.get_head_to_head.fn(
+            team_a=1, team_b=4, start_year=2023, end_year=2024, league_id=FIXTURE_LEAGUE_ID
+        )
+    assert result["all_time"]["games"] and acquired == [2023, 2024]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Offline tests for lazy imports and the startup log line written by the first
+ping().
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import logging
+import os
+import subprocess
+import sys
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_import_defers_heavy_modules():
+    """Importing the server loads neither numpy, espn_api, nor the profilers."""
+    lazy = ("numpy", "espn_api", "cProfile", "pstats", "concurrent.futures.process")
+    code = f"import sys, rffl_mcp_server; print(','.join(m for m in {lazy!r} if m in sys.modules))"
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=HERE,
+        env={**os.environ, "LOG_LEVEL": "WARNING"},
+    )
+    assert proc.stdout.strip() == "", proc.stdout
+
+
+def test_first_ping_logs_startup_once():
+    """Only the first ping logs startup and import time."""
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    level = rffl_mcp_server.logger.level
+    saved = dict(rffl_mcp_server._STARTUP)
+    rffl_mcp_server._STARTUP["ping_served"] = False
+    rffl_mcp_server.logger.addHandler(handler)
+    rffl_mcp_server.logger.setLevel(logging.INFO)
+    try:
+        assert rffl_mcp_server.ping.fn() == "pong"
+        assert rffl_mcp_server.ping.fn() == "pong"
+    finally:
+        rffl_mcp_server.logger.removeHandler(handler)
+        rffl_mcp_server.logger.setLevel(level)
+        rffl_mcp_server._STARTUP.update(saved)
+    first = [r for r in records if r.getMessage() == "First ping served"]
+    assert len(first) == 1
+    assert first[0].startup_ms > 0 and first[0].startup_clock in ("process", "import")
+    assert first[0].import_ms is not None and first[0].import_ms > 0
+
+
+def test_espn_api_loaded_and_instrumented_on_first_use(cache_dir):
+    """The first tool that needs ESPN imports espn_api with the request client timed."""
+    with offline_espn({2024: {}}):
+        standings = rffl_mcp_server.get_standings.fn(league_id=FIXTURE_LEAGUE_ID, year=2024)
+    espn = rffl_mcp_server._espn()
+    assert standings
+    assert espn is rffl_mcp_server._espn()
+    assert getattr(espn.EspnFantasyRequests.league_get, "rffl_instrumented", False)
+    assert "rffl_espn_requests_total" in rffl_mcp_server._render_metrics()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
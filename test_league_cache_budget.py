@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the League cache memory budget (LEAGUE_CACHE_MAX_MB).
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+from contextlib import contextmanager
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+@contextmanager
+def _budget(mb):
+    saved = rffl_mcp_server.LEAGUE_CACHE_MAX_MB
+    rffl_mcp_server.LEAGUE_CACHE_MAX_MB = mb
+    try:
+        yield
+    finally:
+        rffl_mcp_server.LEAGUE_CACHE_MAX_MB = saved
+
+
+def _load(year):
+    return rffl_mcp_server._get_league(FIXTURE_LEAGUE_ID, year)
+
+
+def test_size_estimate_tracks_tracemalloc(cache_dir):
+    """The per-league estimate is within 50% of the memory tracemalloc sees freed on eviction."""
+    key = (FIXTURE_LEAGUE_ID, 2024)
+    with offline_espn({2023: {}, 2024: {}}), _budget(0):
+        _load(2023)
+        tracemalloc.start()
+        try:
+            _load(2024)
+            estimate = rffl_mcp_server._LEAGUE_CACHE_BYTES[key]
+            gc.collect()
+            before = tracemalloc.get_traced_memory()[0]
+            rffl_mcp_server._LEAGUE_CACHE.pop(key)
+            gc.collect()
+            freed = before - tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+            rffl_mcp_server._LEAGUE_CACHE_BYTES.pop(key, None)
+    assert 0.5 < estimate / freed < 1.5, (estimate, freed)
+
+
+def test_budget_evicts_least_recently_used(cache_dir):
+    """Over budget, the league used longest ago is evicted and stats report usage."""
+    with offline_espn({2022: {}, 2023: {}, 2024: {}}):
+        _load(2022)
+        size = rffl_mcp_server._LEAGUE_CACHE_BYTES[(FIXTURE_LEAGUE_ID, 2022)]
+        evictions = rffl_mcp_server._CACHE_STATS["evictions"]
+        with _budget(2.5 * size / (1024 * 1024)):
+            _load(2023)
+            _load(2022)  # cache hit; 2023 is now least recently used
+            _load(2024)
+            stats = rffl_mcp_server.get_cache_stats.fn()
+    assert list(rffl_mcp_server._LEAGUE_CACHE) == [(FIXTURE_LEAGUE_ID, 2022), (FIXTURE_LEAGUE_ID, 2024)]
+    memory = stats["league_memory"]
+    assert memory["evictions"] == evictions + 1
+    assert set(memory["leagues_mb"]) == {f"{FIXTURE_LEAGUE_ID}/2022", f"{FIXTURE_LEAGUE_ID}/2024"}
+    assert 0 < memory["used_mb"] <= memory["budget_mb"]
+
+
+def test_newest_league_kept_and_zero_budget_unbounded(cache_dir):
+    """A league larger than the budget is still cached alone; a budget of 0 never evicts."""
+    with offline_espn({2023: {}, 2024: {}}):
+        with _budget(0.001):
+            _load(2023)
+            _load(2024)
+            assert list(rffl_mcp_server._LEAGUE_CACHE) == [(FIXTURE_LEAGUE_ID, 2024)]
+        rffl_mcp_server.clear_cache.fn()
+        with _budget(0):
+            _load(2023)
+            _load(2024)
+            assert len(rffl_mcp_server._LEAGUE_CACHE) == 2
+    metrics = rffl_mcp_server._render_metrics()
+    assert f"rffl_league_cache_bytes {sum(rffl_mcp_server._LEAGUE_CACHE_BYTES.values())}" in metrics
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the records index behind get_league_records().
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+def _records(**kwargs):
+    return rffl_mcp_server.get_league_records.fn(league_id=FIXTURE_LEAGUE_ID, **kwargs)
+
+
+def _counted_games(espn, years):
+    for yr in years:
+        for m in espn.season(yr).schedule:
+            if "away" in m and m["playoffTierType"] in ("NONE", "WINNERS_BRACKET"):
+                yield yr, m
+
+
+def test_matches_full_scan(cache_dir):
+    """Top records equal a direct scan of every fixture matchup."""
+    years = (2022, 2023, 2024)
+    with offline_espn({yr: {} for yr in years}) as espn:
+        result = _records(start_year=2022, end_year=2024, limit=3)
+        games = list(_counted_games(espn, years))
+
+    scores = sorted(s for _, m in games for s in (m["home"]["totalPoints"], m["away"]["totalPoints"]))
+    margins = sorted(abs(m["home"]["totalPoints"] - m["away"]["totalPoints"]) for _, m in games)
+    assert [e["score"] for e in result["highest_score"]] == scores[::-1][:3]
+    assert [e["score"] for e in result["lowest_score"]] == scores[:3]
+    assert result["biggest_blowout"][0]["margin"] == round(margins[-1], 2)
+
+    # Longest win streak per team, counted across season boundaries
+    runs, best = {}, 0
+    for _, m in games:
+        for side, other in (("home", "away"), ("away", "home")):
+            tid = m[side]["teamId"]
+            won = m["winner"] == side.upper()
+            runs[tid] = runs.get(tid, 0) + 1 if won else 0
+            best = max(best, runs[tid])
+    assert result["longest_win_streak"][0]["length"] == best
+    assert result["skipped_years"] == []
+
+
+def test_incremental_matches_rebuild(cache_dir):
+    """Folding in weeks one at a time gives the same book as a single build."""
+    for week in (3, 6, 9, 16):
+        rffl_mcp_server._SCOREBOARD_CACHE.clear()
+        with offline_espn({2025: {"current_week": week}}):
+            incremental = _records(start_year=2025, end_year=2025)
+    assert incremental["weeks_applied"] == 7
+
+    rffl_mcp_server.clear_cache.fn(include_persistent=True)
+    with offline_espn({2025: {}}):
+        rebuilt = _records(start_year=2025, end_year=2025)
+    for key in ("duration_ms", "weeks_applied"):
+        incremental.pop(key), rebuilt.pop(key)
+    assert incremental == rebuilt
+
+
+def test_completed_seasons_served_from_persistent_cache(cache_dir):
+    """After a restart finished seasons need no ESPN request; missing years are skipped."""
+    with offline_espn({2023: {}, 2024: {}}):
+        first = _records(start_year=2022, end_year=2024)
+    rffl_mcp_server.clear_cache.fn()
+    with offline_espn({2023: {}, 2024: {}}) as espn:
+        second = _records(start_year=2023, end_year=2024)
+        assert espn.calls == [], espn.calls
+    assert [s["year"] for s in first["skipped_years"]] == [2022]
+    assert second["weeks_applied"] == 0
+    assert first["highest_score"] == second["highest_score"]
+
+
+def test_scoreboards_fetched_without_index_lock(cache_dir, monkeypatch):
+    """Other threads can use the index lock while each season's scoreboard is fetched."""
+    fetch = rffl_mcp_server._season_scoreboard
+    acquired = []
+
+    def probe(lid, yr):
+        def try_lock():
+            if rffl_mcp_server._INDEX_LOCK.acquire(timeout=1):
+                rffl_mcp_server._INDEX_LOCK.release()
+                acquired.append(yr)
+        worker = threading.Thread(target=try_lock)
+        worker.start()
+        worker.join()
+        return fetch(lid, yr)
+
+    monkeypatch.setattr(rffl_mcp_server, "_season_scoreboard", probe)
+    with offline_espn({2023: {}, 2024: {}}):
+        result = _records(start_year=2023, end_year=2024, limit=3)
+    assert result["highest_score"] and acquired == [2023, 2024]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
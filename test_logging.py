@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the JSON log formatter and the queue-based log handler.
+"""
+
+import io
+import json
+import logging
+import os
+import sys
+import threading
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+
+
+def _record(**extra):
+    record = logging.LogRecord("rffl-mcp-server", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_all_extra_fields_serialized():
+    """Every extra= field is emitted; standard LogRecord attributes are not."""
+    formatter = rffl_mcp_server.JSONFormatter()
+    line = json.loads(formatter.format(_record(
+        authenticated=True, matchup_count=6, include_lineups=False, cleared_entries=2,
+        phases_ms={"espn": 12.5}, duration_ms=40,
+    )))
+    assert line["message"] == "hello world"
+    assert line["authenticated"] is True and line["matchup_count"] == 6
+    assert line["include_lineups"] is False and line["cleared_entries"] == 2
+    assert line["phases_ms"] == {"espn": 12.5}
+    for standard in ("args", "msg", "levelno", "pathname", "thread", "processName", "created"):
+        assert standard not in line, standard
+
+
+def test_unserializable_values_and_exceptions():
+    """Odd values fall back to str() and tracebacks survive the queue."""
+    formatter = rffl_mcp_server.JSONFormatter()
+    line = json.loads(formatter.format(_record(when=object())))
+    assert line["when"].startswith("<object object")
+
+    try:
+        raise KeyError("missing")
+    except KeyError:
+        record = logging.LogRecord("x", logging.ERROR, __file__, 1, "failed", (), sys.exc_info())
+    prepared = rffl_mcp_server._LogQueueHandler(rffl_mcp_server._LOG_QUEUE).prepare(record)
+    assert prepared.exc_info is None
+    assert "KeyError: 'missing'" in json.loads(formatter.format(prepared))["exception"]
+
+
+def test_emission_happens_on_listener_thread():
+    """Logging from a tool thread only enqueues; the write happens on the listener thread."""
+    listener = rffl_mcp_server._LOG_LISTENER
+    stream_handler = listener.handlers[0]
+    buffer = io.StringIO()
+    writers = []
+    original_emit = stream_handler.emit
+
+    def emit(record):
+        writers.append(threading.current_thread())
+        original_emit(record)
+
+    previous = stream_handler.setStream(buffer)
+    stream_handler.emit = emit
+    try:
+        rffl_mcp_server.logger.warning("queued", extra={"tool": "probe", "cleared_entries": 3})
+        listener.stop()  # drains the queue
+        listener.start()
+    finally:
+        stream_handler.emit = original_emit
+        stream_handler.setStream(previous)
+
+    assert writers and all(t is not threading.current_thread() for t in writers)
+    line = json.loads(buffer.getvalue().strip().splitlines()[-1])
+    assert line["message"] == "queued" and line["tool"] == "probe" and line["cleared_entries"] == 3
+
+
+if __name__ == "__main__":
+    tests = [
+        test_all_extra_fields_serialized,
+        test_unserializable_values_and_exceptions,
+        test_emission_happens_on_listener_thread,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the Prometheus metrics behind the /metrics endpoint.
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import os
+import re
+import sys
+import time
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from starlette.testclient import TestClient
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+_SAMPLE = re.compile(r'^([a-z_]+)(\{[^}]*\})? (\S+)$')
+
+
+def _samples(text):
+    """Parse exposition text into {(name, labels): value}, checking every line's syntax."""
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("# HELP ") or line.startswith("# TYPE "):
+            continue
+        match = _SAMPLE.match(line)
+        assert match, f"bad sample line: {line!r}"
+        samples[(match.group(1), match.group(2) or "")] = float(match.group(3))
+    return samples
+
+
+def test_tool_calls_errors_and_latency(cache_dir):
+    """Every tool call is counted and timed; failures also count as errors."""
+    before = _samples(rffl_mcp_server._render_metrics())
+    with offline_espn({2024: {}}):
+        for _ in range(3):
+            rffl_mcp_server.get_standings.fn(league_id=FIXTURE_LEAGUE_ID, year=2024)
+        try:
+            rffl_mcp_server.get_free_agents.fn(sort="age", league_id=FIXTURE_LEAGUE_ID, year=2024)
+        except ValueError:
+            pass
+    after = _samples(rffl_mcp_server._render_metrics())
+
+    def delta(name, labels):
+        return after.get((name, labels), 0) - before.get((name, labels), 0)
+
+    assert delta("rffl_tool_calls_total", '{status="success",tool="get_standings"}') == 3
+    assert delta("rffl_tool_calls_total", '{status="error",tool="get_free_agents"}') == 1
+    assert delta("rffl_tool_errors_total", '{error="ValueError",tool="get_free_agents"}') == 1
+    assert delta("rffl_tool_duration_seconds_count", '{tool="get_standings"}') == 3
+    assert delta("rffl_tool_duration_seconds_bucket", '{tool="get_standings",le="+Inf"}') == 3
+    assert after[("rffl_tools_in_flight", "")] == 0
+    buckets = [v for (name, labels), v in after.items()
+               if name == "rffl_tool_duration_seconds_bucket" and 'tool="get_standings"' in labels]
+    assert buckets == sorted(buckets), "histogram buckets must be cumulative"
+
+
+def test_espn_requests_counted_by_view(cache_dir):
+    """Each ESPN HTTP request is counted and timed with its endpoint and view."""
+    before = _samples(rffl_mcp_server._render_metrics())
+    with offline_espn({2024: {}}) as espn:
+        rffl_mcp_server.get_head_to_head.fn(team_a=1, team_b=2, start_year=2024, end_year=2024)
+        calls = len(espn.calls)
+    after = _samples(rffl_mcp_server._render_metrics())
+    scoreboard = ("rffl_espn_requests_total", '{endpoint="league",status="success",view="mMatchupScore,mTeam"}')
+    assert after[scoreboard] - before.get(scoreboard, 0) == 1
+    total = sum(v - before.get(k, 0) for k, v in after.items() if k[0] == "rffl_espn_requests_total")
+    assert total == calls
+
+
+def test_metrics_route_over_http():
+    """/metrics is served next to the MCP route and is cheap to render."""
+    with TestClient(rffl_mcp_server.mcp.http_app()) as client:
+        response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = _samples(response.text)
+    assert ("rffl_cache_hit_ratio", '{cache="league"}') in samples
+
+    start = time.perf_counter()
+    for _ in range(100):
+        rffl_mcp_server._render_metrics()
+    assert (time.perf_counter() - start) / 100 < 0.01
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the slot solver behind get_optimal_lineup_analysis().
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import logging
+import os
+import random
+import sys
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+SLOTS = {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "RB/WR/TE": 1, "D/ST": 1, "K": 1}
+ELIGIBILITY = [
+    ["QB", "OP", "BE"],
+    ["RB", "RB/WR", "RB/WR/TE", "BE"],
+    ["WR", "RB/WR", "WR/TE", "RB/WR/TE", "BE"],
+    ["TE", "WR/TE", "RB/WR/TE", "BE"],
+    ["RB", "WR", "RB/WR", "RB/WR/TE", "BE"],
+    ["D/ST", "BE"],
+    ["K", "BE"],
+]
+
+
+def _brute_force(players, slot_counts):
+    """Try every assignment of players (or nobody) to every seat."""
+    seats = [slot for slot, count in slot_counts.items() for _ in range(count)]
+    best = 0.0
+
+    def fill(i, used, total):
+        nonlocal best
+        if i == len(seats):
+            best = max(best, total)
+            return
+        fill(i + 1, used, total)
+        for points, pid, eligible in players:
+            if pid not in used and seats[i] in eligible:
+                fill(i + 1, used | {pid}, total + points)
+
+    fill(0, frozenset(), 0.0)
+    return round(best, 2)
+
+
+def test_solver_matches_brute_force():
+    """The greedy matroid solver is exact, including dual-eligible players and FLEX."""
+    rng = random.Random(34)
+    slots = {"QB": 1, "RB": 1, "WR": 1, "RB/WR/TE": 1, "K": 1}
+    for _ in range(30):
+        players = [
+            (round(rng.uniform(-2, 30), 2), pid, rng.choice(ELIGIBILITY))
+            for pid in range(rng.randint(4, 8))
+        ]
+        optimal, lineup = rffl_mcp_server._optimal_lineup(players, slots)
+        assert optimal == _brute_force(players, slots), players
+        assert all(slot in dict((p, e) for _, p, e in players)[pid] for pid, slot in lineup.items())
+
+
+def test_season_analysis(cache_dir):
+    """Optimal beats or equals actual every week and one call covers a full season."""
+    with offline_espn({2024: {}}) as espn:
+        result = rffl_mcp_server.get_optimal_lineup_analysis.fn(
+            year=2024, league_id=FIXTURE_LEAGUE_ID
+        )
+        season = espn.season(2024)
+    assert result["lineup_slots"] == SLOTS
+    assert len(result["teams"]) == 10
+    for team in result["teams"]:
+        assert all(w["optimal"] >= w["actual"] for w in team["weeks"])
+        regular = {w["week"]: w["actual"] for w in team["weeks"] if w["week"] <= 13}
+        assert regular == {w: season.team_score(team["team_id"], w) for w in range(1, 14)}
+    # The fixture starts the first eligible players, so someone leaves points on the bench
+    assert result["teams"][0]["points_left_on_bench"] > 0
+    assert result["teams"][0]["efficiency_pct"] < 100
+
+
+def test_box_score_payloads_unchanged(cache_dir):
+    """Slot eligibility reaches the solver's store without widening box score lineup entries."""
+    with offline_espn({2024: {}}):
+        rffl_mcp_server.get_optimal_lineup_analysis.fn(year=2024, league_id=FIXTURE_LEAGUE_ID)
+        boxscores = rffl_mcp_server.get_enhanced_boxscores.fn(week=3, league_id=FIXTURE_LEAGUE_ID, year=2024)
+    entry = boxscores["matchups"][0]["home_lineup"][0]
+    assert set(entry) == {
+        "name", "slot", "position", "points", "projected", "pro_team", "pro_opponent", "pro_pos_rank",
+        "injury_status",
+    }
+    store = rffl_mcp_server._PLAYER_POINTS[(FIXTURE_LEAGUE_ID, 2024)]
+    assert store["eligible"] and all(store["eligible"].values())
+
+
+def test_finished_weeks_cached(cache_dir):
+    """After a restart the analysis needs no ESPN request; week ranges filter it."""
+    with offline_espn({2023: {}}):
+        full = rffl_mcp_server.get_optimal_lineup_analysis.fn(year=2023, league_id=FIXTURE_LEAGUE_ID)
+    rffl_mcp_server.clear_cache.fn()
+    with offline_espn({2023: {}}) as espn:
+        again = rffl_mcp_server.get_optimal_lineup_analysis.fn(year=2023, league_id=FIXTURE_LEAGUE_ID)
+        early = rffl_mcp_server.get_optimal_lineup_analysis.fn(
+            year=2023, start_week=1, end_week=4, league_id=FIXTURE_LEAGUE_ID
+        )
+        assert espn.calls == [], espn.calls
+    assert full == again
+    assert all([w["week"] for w in t["weeks"]] == [1, 2, 3, 4] for t in early["teams"])
+
+
+def test_stale_eligibility_and_ir(cache_dir, caplog):
+    """A starter missing their slot stays startable, and IR points are kept off the bench."""
+    with offline_espn({2024: {}}):
+        store = rffl_mcp_server._player_points_store(FIXTURE_LEAGUE_ID, 2024)
+    columns = store["columns"]
+    rows = [i for i, w in enumerate(columns["week"]) if w == 1 and columns["team_id"][i] == 1]
+    starter = next(i for i in rows if columns["slot"][i] == "QB")
+    benched = next(i for i in rows if columns["slot"][i] == "BE" and columns["points"][i] > 0)
+    store["eligible"][str(columns["player_id"][starter])] = ["BE"]
+    columns["slot"][benched] = "IR"
+
+    with caplog.at_level(logging.WARNING, logger=rffl_mcp_server.logger.name):
+        week = rffl_mcp_server._optimal_lineup_index(FIXTURE_LEAGUE_ID, 2024)["weeks"]["1"]["1"]
+    assert week["optimal"] >= week["actual"]
+    assert week["ir_points"] == columns["points"][benched]
+    assert str(columns["player_id"][benched]) not in week["optimal_lineup"]
+    assert any(r.getMessage() == "Started slot missing from eligible slots" for r in caplog.records)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
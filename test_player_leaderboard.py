@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the player-points store behind get_player_leaderboard().
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from espn_api.football import League
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+def _leaderboard(**kwargs):
+    return rffl_mcp_server.get_player_leaderboard.fn(league_id=FIXTURE_LEAGUE_ID, **kwargs)
+
+
+def _brute_force(league, position, weeks, top_k):
+    """Walk every box score and fully sort the totals."""
+    totals = {}
+    for week in weeks:
+        for matchup in league.box_scores(week=week):
+            for p in matchup.home_lineup + matchup.away_lineup:
+                if position is None or p.position == position:
+                    totals[p.playerId] = totals.get(p.playerId, 0.0) + p.points
+    ranked = sorted(totals.items(), key=lambda kv: (-kv[1], kv[0]))[:top_k]
+    return [(pid, round(pts, 2)) for pid, pts in ranked]
+
+
+def test_matches_box_score_walk(cache_dir):
+    """Leaders equal a full sort over every box score in the range."""
+    with offline_espn({2024: {}}):
+        result = _leaderboard(position="RB", start_week=1, end_week=8, top_k=10, year=2024)
+        expected = _brute_force(League(FIXTURE_LEAGUE_ID, 2024), "RB", range(1, 9), 10)
+        overall = _leaderboard(top_k=5, year=2024)
+    got = [(p["player_id"], p["total_points"]) for p in result["leaders"]]
+    assert got == expected, (got, expected)
+    assert all(p["position"] == "RB" and p["weeks"] == 8 for p in result["leaders"])
+    assert overall["end_week"] == 15 and len(overall["leaders"]) == 5
+
+
+def test_in_progress_season_ingests_new_weeks(cache_dir):
+    """Only finished weeks are stored; later weeks are fetched incrementally."""
+    with offline_espn({2025: {"current_week": 4}}):
+        early = _leaderboard(year=2025)
+    assert early["weeks_available"] == [1, 2, 3]
+
+    # The scoreboard TTL expires while the cached League still thinks it is week 4;
+    # the League is reloaded and only weeks 4 and 5 are fetched
+    rffl_mcp_server._SCOREBOARD_CACHE.clear()
+    with offline_espn({2025: {"current_week": 6}}) as espn:
+        later = _leaderboard(year=2025, start_week=1, end_week=3)
+        box_calls = [c for c in espn.calls if c.endswith("mMatchupScore,mScoreboard")]
+    assert later["weeks_available"] == [1, 2, 3, 4, 5]
+    assert len(box_calls) == 2, box_calls
+    assert later["leaders"] == early["leaders"]
+    assert rffl_mcp_server._LEAGUE_CACHE[(FIXTURE_LEAGUE_ID, 2025)].current_week == 6
+
+
+def test_completed_season_served_from_persistent_cache(cache_dir):
+    """After a restart a finished season is answered without any ESPN request."""
+    with offline_espn({2023: {}}):
+        first = _leaderboard(position="wr", year=2023, top_k=3)
+    rffl_mcp_server.clear_cache.fn()
+    with offline_espn({2023: {}}) as espn:
+        second = _leaderboard(position="WR", year=2023, top_k=3)
+        assert espn.calls == [], espn.calls
+    assert first == second
+
+
+def test_box_scores_fetched_without_index_lock(cache_dir, monkeypatch):
+    """Other threads can use the index lock while a season's box scores are fetched."""
+    fetch = rffl_mcp_server._box_score_rows
+    acquired = []
+
+    def probe(league, week):
+        def try_lock():
+            if rffl_mcp_server._INDEX_LOCK.acquire(timeout=1):
+                rffl_mcp_server._INDEX_LOCK.release()
+                acquired.append(week)
+        worker = threading.Thread(target=try_lock)
+        worker.start()
+        worker.join()
+        return fetch(league, week)
+
+    monkeypatch.setattr(rffl_mcp_server, "_box_score_rows", probe)
+    with offline_espn({2024: {}}):
+        result = rffl_mcp_server.get_optimal_lineup_analysis.fn(year=2024, league_id=FIXTURE_LEAGUE_ID)
+    assert result["teams"] and acquired == list(range(1, 16))
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the player search index behind search_players() and
+get_player_info(name=...).
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+def _search(query, **kwargs):
+    return rffl_mcp_server.search_players.fn(
+        query=query, league_id=FIXTURE_LEAGUE_ID, year=2024, **kwargs
+    )
+
+
+def test_name_normalization():
+    """Case, accents, punctuation and generational suffixes are ignored."""
+    normalize = rffl_mcp_server._normalize_name
+    assert normalize("Ja'Marr Chase") == normalize("jamarr chase")
+    assert normalize("Odell Beckham Jr.") == "odell beckham"
+    assert normalize("Amon-Ra St. Brown") == "amon ra st brown"
+    assert normalize("Jérôme Bettis III") == "jerome bettis"
+
+
+def test_exact_prefix_last_name_and_typo(cache_dir):
+    """Exact names rank first; prefixes, last names and typos still resolve."""
+    with offline_espn({2024: {}}) as espn:
+        season = espn.season(2024)
+        pid, player = next((k, v) for k, v in season.players.items() if v["defaultPositionId"] == 1)
+        name = player["fullName"]
+        first, last = name.split()[0], name.split()[1]
+
+        exact = _search(name.upper())
+        prefix = _search(f"{first[:3]} {last[:2]}".lower())
+        by_last = _search(last, limit=100)
+        typo = _search(name[:-4] + name[-3:])
+        qbs = _search(last, position="QB", limit=100)
+
+    assert exact[0]["player_id"] == pid and exact[0]["score"] == 1.0
+    assert pid in [c["player_id"] for c in prefix]
+    assert pid in [c["player_id"] for c in by_last]
+    assert typo[0]["player_id"] == pid, typo[:3]
+    assert qbs and all(c["position"] == "QB" for c in qbs)
+
+
+def test_roster_moves_refresh_incrementally(cache_dir):
+    """Only teams whose roster changed are re-indexed."""
+    with offline_espn({2024: {}}):
+        league = rffl_mcp_server._get_league(FIXTURE_LEAGUE_ID, 2024)
+        moved = league.teams[0].roster.pop()
+        league.teams[1].roster.append(moved)
+        result = _search(moved.name)
+    stats = rffl_mcp_server.get_cache_stats.fn()["player_search"]
+    assert result[0]["on_team_id"] == league.teams[1].team_id
+    assert stats["index_builds"] == 1
+    assert stats["roster_refreshes"] == 1
+
+
+def test_player_info_resolves_and_caches(cache_dir):
+    """Fuzzy names resolve through the index and details are cached per player."""
+    with offline_espn({2024: {}}) as espn:
+        pid, player = next(iter(espn.season(2024).players.items()))
+        query = player["fullName"].lower().replace(" ", "  ", 1)
+        first = rffl_mcp_server.get_player_info.fn(
+            name=query, league_id=FIXTURE_LEAGUE_ID, year=2024
+        )
+        calls = len(espn.calls)
+        second = rffl_mcp_server.get_player_info.fn(
+            player_id=pid, league_id=FIXTURE_LEAGUE_ID, year=2024
+        )
+        assert len(espn.calls) == calls, espn.calls[calls:]
+        missing = rffl_mcp_server.get_player_info.fn(
+            name="zzzz qqqq", league_id=FIXTURE_LEAGUE_ID, year=2024
+        )
+    assert first["playerId"] == pid
+    assert first["match"]["name"] == player["fullName"]
+    assert second["name"] == first["name"] and "match" not in second
+    assert missing is None
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the Monte Carlo simulator behind get_playoff_odds().
+"""
+
+import os
+import sys
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import offline_espn
+
+
+def _odds(seasons, year, **kwargs):
+    rffl_mcp_server.clear_cache.fn()
+    with offline_espn(seasons):
+        return rffl_mcp_server.get_playoff_odds.fn(year=year, **kwargs)
+
+
+def test_deterministic_under_seed_and_workers():
+    """Same seed gives identical odds, whether batches run serially or on a pool."""
+    seasons = {2025: {"current_week": 9}}
+    serial = _odds(seasons, 2025, simulations=50000, seed=7)
+    again = _odds(seasons, 2025, simulations=50000, seed=7)
+    pooled = _odds(seasons, 2025, simulations=50000, seed=7, workers=3)
+    assert serial["teams"] == again["teams"]
+    assert serial["teams"] == pooled["teams"]
+
+
+def test_probabilities_are_consistent():
+    """Seeds form a distribution, playoff odds sum to the number of playoff spots."""
+    result = _odds({2025: {"current_week": 9, "playoff_team_count": 6}}, 2025, simulations=20000, seed=1)
+    assert result["bye_count"] == 2
+    assert result["weeks_remaining"] == [9, 10, 11, 12, 13]
+    total_playoff = sum(t["playoff_pct"] for t in result["teams"])
+    assert abs(total_playoff - 600) < 0.5, total_playoff
+    for team in result["teams"]:
+        assert abs(sum(team["seed_pct"]) - 100) < 0.1
+        assert team["bye_pct"] <= team["playoff_pct"]
+
+
+def test_finished_regular_season_is_certain():
+    """With no games left every team is either in (100%) or out (0%)."""
+    result = _odds({2024: {}}, 2024, simulations=1000, seed=3)
+    assert result["games_remaining"] == 0
+    assert sorted(t["playoff_pct"] for t in result["teams"]) == [0.0] * 6 + [100.0] * 4
+
+
+def test_bye_count():
+    assert [rffl_mcp_server._playoff_bye_count(n) for n in (2, 3, 4, 6, 7, 8)] == [0, 1, 0, 2, 1, 0]
+
+
+if __name__ == "__main__":
+    tests = [
+        test_deterministic_under_seed_and_workers,
+        test_probabilities_are_consistent,
+        test_finished_regular_season_is_certain,
+        test_bye_count,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
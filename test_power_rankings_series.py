@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Offline tests for get_power_rankings_series().
+
+Checks the vectorized series against espn_api's League.power_rankings() for
+every week of complete and in-progress synthetic seasons.
+"""
+
+import os
+import sys
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from espn_api.football import League
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+def _as_pairs(rankings):
+    return [(float(score), team.team_id) for score, team in rankings]
+
+
+def test_matches_espn_api_every_week():
+    """Every week's vectorized ranking equals League.power_rankings(week=w)."""
+    seasons = {2016: {}, 2024: {}, 2025: {"current_week": 9}, 2023: {"team_count": 9}}
+    with offline_espn(seasons):
+        for yr in seasons:
+            league = League(FIXTURE_LEAGUE_ID, yr)
+            weeks = list(range(1, league.current_week + 1))
+            series = rffl_mcp_server._power_rankings_series(league, weeks)
+            for w in weeks:
+                assert _as_pairs(series[w]) == _as_pairs(league.power_rankings(week=w)), (yr, w)
+
+
+def test_tool_shape_and_week_clamping():
+    """The tool clamps end_week to the current week and returns one series per team."""
+    rffl_mcp_server.clear_cache.fn()
+    with offline_espn({2025: {"current_week": 6}}):
+        result = rffl_mcp_server.get_power_rankings_series.fn(start_week=2, end_week=17, year=2025)
+    rffl_mcp_server.clear_cache.fn()
+
+    assert result["weeks"] == [2, 3, 4, 5, 6]
+    assert len(result["series"]) == 10
+    for team in result["series"]:
+        assert len(team["scores"]) == len(result["weeks"])
+        assert len(team["ranks"]) == len(result["weeks"])
+    for week in result["rankings"]:
+        assert [r["rank"] for r in week["rankings"]] == list(range(1, 11))
+
+
+if __name__ == "__main__":
+    tests = [test_matches_espn_api_every_week, test_tool_shape_and_week_clamping]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
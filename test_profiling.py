@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Offline tests for sampled tool-call profiling and list_profiles().
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import os
+import pstats
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+@contextmanager
+def _profiling(rate, tools=("*",), max_files=50):
+    saved = (rffl_mcp_server.PROFILE_SAMPLE_RATE, rffl_mcp_server.PROFILE_TOOLS, rffl_mcp_server.PROFILE_MAX_FILES)
+    rffl_mcp_server.PROFILE_SAMPLE_RATE = rate
+    rffl_mcp_server.PROFILE_TOOLS = set(tools)
+    rffl_mcp_server.PROFILE_MAX_FILES = max_files
+    try:
+        yield
+    finally:
+        (rffl_mcp_server.PROFILE_SAMPLE_RATE, rffl_mcp_server.PROFILE_TOOLS,
+         rffl_mcp_server.PROFILE_MAX_FILES) = saved
+
+
+def test_selected_tool_profiled_with_args(cache_dir):
+    """Only the selected tool is profiled; the profile loads and names the call's arguments."""
+    with offline_espn({2024: {}}), _profiling(1.0, tools=("get_enhanced_boxscores",)):
+        rffl_mcp_server.get_standings.fn(league_id=FIXTURE_LEAGUE_ID, year=2024)
+        rffl_mcp_server.get_enhanced_boxscores.fn(week=3, league_id=FIXTURE_LEAGUE_ID, year=2024)
+        listing = rffl_mcp_server.list_profiles.fn()
+    assert listing["enabled"] and len(listing["profiles"]) == 1
+    profile = listing["profiles"][0]
+    assert profile["tool"] == "get_enhanced_boxscores"
+    assert profile["args"] == {"week": 3, "league_id": FIXTURE_LEAGUE_ID, "year": 2024}
+    assert "_get_enhanced_boxscores_week=3-league-id=" in os.path.basename(profile["profile"])
+    assert profile["top_functions"] and profile["duration_ms"] > 0
+    stats = pstats.Stats(profile["profile"])
+    assert any(func == "_format_boxscore_markdown" for _, _, func in stats.stats)
+
+
+def test_disabled_and_sampled(cache_dir):
+    """Nothing is written at rate 0; a fractional rate profiles only some calls."""
+    with _profiling(0.0):
+        for _ in range(5):
+            rffl_mcp_server.ping.fn()
+        assert rffl_mcp_server.list_profiles.fn()["profiles"] == []
+    rffl_mcp_server.random.seed(7)
+    with _profiling(0.5):
+        for _ in range(40):
+            rffl_mcp_server.ping.fn()
+        count = len(rffl_mcp_server.list_profiles.fn(tool="ping", limit=100)["profiles"])
+    assert 5 < count < 35, count
+
+
+def test_old_profiles_pruned(cache_dir):
+    """At most PROFILE_MAX_FILES profiles are kept, newest first in the listing."""
+    with _profiling(1.0, max_files=3):
+        for _ in range(6):
+            rffl_mcp_server.ping.fn()
+        listing = rffl_mcp_server.list_profiles.fn(tool="ping", limit=10)
+    files = os.listdir(listing["directory"])
+    created = [p["created"] for p in listing["profiles"]]
+    assert len(created) == 3 and created == sorted(created, reverse=True)
+    assert len(files) == 6  # .json + .pstats per kept profile
+
+
+def test_profiles_survive_persistent_cache_clear(cache_dir):
+    """Profile sidecars are neither counted nor deleted as persistent cache entries."""
+    with offline_espn({2024: {}}), _profiling(1.0, tools=("get_head_to_head",)):
+        rffl_mcp_server.get_head_to_head.fn(1, 2, start_year=2024, end_year=2024, league_id=FIXTURE_LEAGUE_ID)
+        persisted = rffl_mcp_server.get_cache_stats.fn()["persistent"]["entries"]
+        cleared = rffl_mcp_server.clear_cache.fn(include_persistent=True)
+        listing = rffl_mcp_server.list_profiles.fn()
+    assert persisted == 1
+    assert "and 1 persistent entry" in cleared["message"]
+    assert len(listing["profiles"]) == 1 and os.path.exists(listing["profiles"][0]["profile"])
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
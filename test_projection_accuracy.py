@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Offline tests for get_projection_accuracy().
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+def _accuracy(**kwargs):
+    return rffl_mcp_server.get_projection_accuracy.fn(league_id=FIXTURE_LEAGUE_ID, **kwargs)
+
+
+def _naive(stores, position):
+    """Plain-Python MAE and bias over the stored player-week rows."""
+    errors = []
+    for store in stores:
+        c = store["columns"]
+        for pos, points, projected in zip(c["position"], c["points"], c["projected"]):
+            if pos == position and projected > 0:
+                errors.append(points - projected)
+    return len(errors), sum(map(abs, errors)) / len(errors), sum(errors) / len(errors)
+
+
+def test_matches_row_by_row_computation(cache_dir):
+    """Vectorized group statistics merged across seasons equal a direct loop."""
+    with offline_espn({2023: {}, 2024: {}}):
+        result = _accuracy(start_year=2023, end_year=2024)
+        stores = [rffl_mcp_server._player_points_store(FIXTURE_LEAGUE_ID, yr) for yr in (2023, 2024)]
+    rb = next(g for g in result["groups"] if g["group"] == "RB")
+    n, mae, bias = _naive(stores, "RB")
+    assert rb["n"] == n
+    assert abs(rb["mae"] - mae) < 1e-3 and abs(rb["bias"] - bias) < 1e-3
+    assert sum(b["n"] for b in rb["calibration"]) == n
+    assert result["overall"]["n"] == sum(g["n"] for g in result["groups"])
+
+
+def test_group_by_week_and_team(cache_dir):
+    """Week groups are ordered by week; team groups carry team names; bad groups are rejected."""
+    with offline_espn({2024: {}}):
+        weekly = _accuracy(end_year=2024, group_by="week")
+        by_team = _accuracy(end_year=2024, group_by="team")
+        try:
+            _accuracy(end_year=2024, group_by="player")
+            raise AssertionError("expected ValueError")
+        except ValueError:
+            pass
+    assert [g["group"] for g in weekly["groups"]] == list(range(1, 16))
+    assert all(g["team"].startswith("Fixture Team") for g in by_team["groups"])
+    assert weekly["overall"] == by_team["overall"]
+
+
+def test_finished_seasons_aggregated_once(cache_dir):
+    """After a restart finished seasons come from the persistent cache; old seasons are skipped."""
+    with offline_espn({2018: {}, 2023: {}}):
+        first = _accuracy(start_year=2018, end_year=2023)
+    rffl_mcp_server.clear_cache.fn()
+    with offline_espn({2023: {}}) as espn:
+        second = _accuracy(start_year=2023, end_year=2023)
+        assert espn.calls == [], espn.calls
+    assert [s["year"] for s in first["skipped_years"]] == [2018, 2019, 2020, 2021, 2022]
+    assert first["overall"] == second["overall"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the SQLite league data warehouse behind query_league_data().
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from espn_api.football import League
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+@contextmanager
+def _seasons(first, last):
+    """Limit the history a query copies from memory to the fixture seasons."""
+    saved = rffl_mcp_server.HISTORY_START_YEAR, rffl_mcp_server.DEFAULT_YEAR
+    rffl_mcp_server.HISTORY_START_YEAR, rffl_mcp_server.DEFAULT_YEAR = first, last
+    try:
+        yield
+    finally:
+        rffl_mcp_server.HISTORY_START_YEAR, rffl_mcp_server.DEFAULT_YEAR = saved
+
+
+def _query(sql, **kwargs):
+    return rffl_mcp_server.query_league_data.fn(sql=sql, league_id=FIXTURE_LEAGUE_ID, **kwargs)
+
+
+def _refresh(first, last):
+    """Run refresh_league_data and wait for its background job."""
+    started = rffl_mcp_server.refresh_league_data.fn(start_year=first, end_year=last, league_id=FIXTURE_LEAGUE_ID)
+    rffl_mcp_server._WAREHOUSE_REFRESH["thread"].join(timeout=60)
+    with rffl_mcp_server._WAREHOUSE_REFRESH_LOCK:
+        return started, rffl_mcp_server._warehouse_refresh_status()
+
+
+def test_tables_match_espn_data(cache_dir):
+    """Team results and player points in the warehouse agree with espn_api and the store."""
+    with _seasons(2024, 2024):
+        with offline_espn({2024: {}}):
+            started, status = _refresh(2023, 2024)
+            wins = _query(
+                "SELECT team_id, COUNT(*) FROM team_weeks "
+                "WHERE year = 2024 AND result = 'W' AND NOT is_playoff GROUP BY team_id"
+            )
+            points = _query("SELECT COUNT(*), ROUND(SUM(points), 2) FROM player_weeks WHERE year = 2024")
+            league = League(FIXTURE_LEAGUE_ID, 2024)
+            store = rffl_mcp_server._player_points_store(FIXTURE_LEAGUE_ID, 2024)
+    assert started["started"] and started["years"] == [2023, 2024]
+    assert status["state"] == "done" and status["seasons_done"] == 2
+    assert [s["year"] for s in status["skipped_years"]] == [2023]
+    assert dict(map(tuple, wins["rows"])) == {t.team_id: t.wins for t in league.teams if t.wins}
+    count, total = points["rows"][0]
+    assert count == len(store["columns"]["points"])
+    assert abs(total - sum(store["columns"]["points"])) < 0.05
+    assert wins["seasons_loaded"] == [2024]
+
+
+def test_read_only_timeout_and_row_cap(cache_dir):
+    """Writes and ATTACH are refused, runaway queries stop, and rows are capped."""
+    with _seasons(2024, 2024):
+        with offline_espn({2024: {}}):
+            _refresh(2024, 2024)
+            capped = _query("SELECT * FROM player_weeks", limit=7)
+            rffl_mcp_server.WAREHOUSE_QUERY_TIMEOUT_MS = 200
+            rejected = []
+            for sql in (
+                "DELETE FROM teams",
+                "DROP TABLE matchups",
+                "ATTACH DATABASE 'other.db' AS other",
+                "SELECT 1; DELETE FROM teams",
+                "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT COUNT(*) FROM c",
+            ):
+                try:
+                    _query(sql)
+                except ValueError as e:
+                    rejected.append(str(e))
+            rffl_mcp_server.WAREHOUSE_QUERY_TIMEOUT_MS = 2000
+            teams = _query("SELECT COUNT(*) FROM teams")
+    assert capped["row_count"] == 7 and capped["truncated"]
+    assert len(capped["columns"]) == len(capped["rows"][0])
+    assert len(rejected) == 5, rejected
+    assert "time limit" in rejected[-1]
+    assert teams["rows"][0][0] > 0
+
+
+def test_queries_never_fetch(cache_dir):
+    """An empty warehouse is reported, and queries only copy weeks other tools already loaded."""
+    with _seasons(2024, 2025):
+        with offline_espn({2024: {}, 2025: {"current_week": 5}}) as espn:
+            with pytest.raises(RuntimeError, match="not populated"):
+                _query("SELECT 1")
+            assert espn.calls == [], espn.calls
+            rffl_mcp_server.get_player_leaderboard.fn(league_id=FIXTURE_LEAGUE_ID, year=2025)
+            calls = len(espn.calls)
+            weeks = _query("SELECT DISTINCT week FROM player_weeks WHERE year = 2025 ORDER BY week")
+            assert len(espn.calls) == calls, espn.calls[calls:]
+    assert weeks["rows"] == [[1], [2], [3], [4]]
+    assert weeks["seasons_loaded"] == [2025]
+
+
+def test_incremental_sync_and_restart(cache_dir):
+    """Only newly final weeks are copied, and finished seasons need no requests after a restart."""
+    with _seasons(2024, 2025):
+        with offline_espn({2024: {}, 2025: {"current_week": 5}}):
+            _refresh(2024, 2025)
+        rffl_mcp_server._SCOREBOARD_CACHE.clear()
+        with offline_espn({2024: {}, 2025: {"current_week": 8}}):
+            _refresh(2024, 2025)
+            weeks = _query(
+                "SELECT week, COUNT(*) FROM matchups WHERE year = 2025 GROUP BY week ORDER BY week"
+            )
+            dupes = _query(
+                "SELECT COUNT(*) FROM (SELECT 1 FROM player_weeks "
+                "GROUP BY league_id, year, week, player_id HAVING COUNT(*) > 1)"
+            )
+        assert [w for w, _ in weeks["rows"]] == list(range(1, 8))
+        assert len({n for _, n in weeks["rows"]}) == 1
+        assert dupes["rows"] == [[0]]
+
+        # Simulate a restart: in-memory state is dropped, the warehouse file is kept
+        rffl_mcp_server.clear_cache.fn()
+        with offline_espn({2024: {}}) as espn:
+            _refresh(2024, 2024)
+            _query("SELECT COUNT(*) FROM player_weeks")
+            assert espn.calls == [], espn.calls
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
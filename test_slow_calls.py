@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the slow-call detector behind get_slow_calls().
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+@contextmanager
+def _thresholds(default_ms, per_tool, capacity=100, max_age_s=3600):
+    """Swap in thresholds and an empty slow-call buffer."""
+    names = ("SLOW_CALL_THRESHOLD_MS", "SLOW_CALL_THRESHOLDS", "SLOW_CALL_BUFFER_SIZE", "SLOW_CALL_MAX_AGE_S",
+             "_SLOW_CALLS")
+    saved = [getattr(rffl_mcp_server, name) for name in names]
+    for name, value in zip(names, (default_ms, dict(per_tool), capacity, max_age_s, [])):
+        setattr(rffl_mcp_server, name, value)
+    try:
+        yield
+    finally:
+        for name, value in zip(names, saved):
+            setattr(rffl_mcp_server, name, value)
+
+
+def nap(seconds):
+    time.sleep(seconds)
+
+
+def test_per_tool_threshold_captures_context(cache_dir):
+    """Only tools over their own threshold are kept, with args, phases, and cache state."""
+    with offline_espn({2024: {}}), _thresholds(10 ** 9, {"get_enhanced_boxscores": 1}):
+        rffl_mcp_server.get_standings.fn(league_id=FIXTURE_LEAGUE_ID, year=2024)
+        rffl_mcp_server.get_enhanced_boxscores.fn(week=3, league_id=FIXTURE_LEAGUE_ID, year=2024)
+        result = rffl_mcp_server.get_slow_calls.fn()
+    assert result["thresholds_ms"] == {"get_enhanced_boxscores": 1}
+    assert [c["tool"] for c in result["calls"]] == ["get_enhanced_boxscores"]
+    call = result["calls"][0]
+    assert call["args"] == {"week": 3, "league_id": FIXTURE_LEAGUE_ID, "year": 2024}
+    assert call["threshold_ms"] == 1 and call["duration_ms"] >= 1
+    assert call["status"] == "success" and len(call["trace_id"]) == 32
+    assert {"espn", "format"} <= set(call["phases_ms"])
+    assert call["cache"]["league_hits"] == 1 and call["cache"]["espn_requests"] > 0
+
+
+def test_buffer_keeps_slowest_and_expires_old_calls():
+    """A burst just over the threshold never evicts an outlier; calls past the age limit are dropped."""
+    timed = rffl_mcp_server._instrumented(nap)
+    with _thresholds(5, {}, capacity=3):
+        for seconds in (0.05, 0.006, 0.03, 0.0, 0.008, 0.012, 0.016):
+            timed(seconds=seconds)
+        result = rffl_mcp_server.get_slow_calls.fn(tool="nap")
+    naps = [c["args"]["seconds"] for c in result["calls"]]
+    assert naps == [0.05, 0.03, 0.016], naps
+    assert result["capacity"] == 3 and result["buffered"] == 3
+
+    with _thresholds(5, {}, max_age_s=0.05):
+        timed(seconds=0.03)
+        time.sleep(0.06)
+        timed(seconds=0.006)
+        result = rffl_mcp_server.get_slow_calls.fn(tool="nap")
+    assert [c["args"]["seconds"] for c in result["calls"]] == [0.006]
+
+
+def test_slow_calls_logged_at_warning_and_counted():
+    """Slow calls are flagged in their WARNING completion line and counted in /metrics."""
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    rffl_mcp_server.logger.addHandler(handler)
+    try:
+        with _thresholds(1, {}):
+            rffl_mcp_server._instrumented(nap)(seconds=0.005)
+    finally:
+        rffl_mcp_server.logger.removeHandler(handler)
+    done = [r for r in records if r.getMessage() == "nap completed"]
+    assert len(done) == 1 and done[0].levelno == logging.WARNING and done[0].slow is True
+    assert 'rffl_tool_slow_calls_total{tool="nap"}' in rffl_mcp_server._render_metrics()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
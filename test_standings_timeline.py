@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Offline tests for get_standings_timeline() and the standings timeline arrays.
+"""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from espn_api.football import League
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+def _loop_standings(league, through_week):
+    """Reference cumulative records computed with plain loops over espn_api teams."""
+    records = {}
+    for t in league.teams:
+        outcomes = t.outcomes[:through_week]
+        records[t.team_id] = (
+            outcomes.count("W"),
+            outcomes.count("L"),
+            outcomes.count("T"),
+            round(sum(t.scores[:through_week]), 2),
+        )
+    return records
+
+
+def test_matches_loop_reference_every_week(cache_dir):
+    """Each week's cumulative record and points-for equal a plain-loop replay."""
+    with offline_espn({2024: {}}):
+        timeline = rffl_mcp_server.get_standings_timeline.fn(year=2024)
+        league = League(FIXTURE_LEAGUE_ID, 2024)
+    assert timeline["weeks"] == list(range(1, league.settings.reg_season_count + 1))
+    for col, week in enumerate(timeline["weeks"]):
+        expected = _loop_standings(league, week)
+        ranks = sorted(team["rank"][col] for team in timeline["teams"])
+        assert ranks == list(range(1, len(timeline["teams"]) + 1))
+        for team in timeline["teams"]:
+            w, l, t, pf = expected[team["team_id"]]
+            got = (team["wins"][col], team["losses"][col], team["ties"][col])
+            assert got == (w, l, t), (week, team["team_id"], got)
+            assert abs(team["points_for"][col] - pf) < 0.01
+
+
+def test_week_lookup_orders_by_record_without_requests(cache_dir):
+    """Single-week standings come from the cached arrays and are ordered by record."""
+    with offline_espn({2024: {}}) as espn:
+        full = rffl_mcp_server.get_standings_timeline.fn(year=2024)
+        calls = len(espn.calls)
+        week5 = rffl_mcp_server.get_standings_timeline.fn(year=2024, week=5)
+        assert len(espn.calls) == calls, espn.calls[calls:]
+    rows = week5["standings"]
+    assert [r["rank"] for r in rows] == list(range(1, len(rows) + 1))
+    keys = [((r["wins"] + 0.5 * r["ties"]) / 5, r["points_for"]) for r in rows]
+    assert keys == sorted(keys, reverse=True)
+    by_team = {t["team_id"]: t for t in full["teams"]}
+    assert all(by_team[r["team_id"]]["rank"][4] == r["rank"] for r in rows)
+    try:
+        rffl_mcp_server.get_standings_timeline.fn(year=2024, week=30)
+        assert False, "unfinished week accepted"
+    except ValueError:
+        pass
+
+
+def test_in_progress_season_extends(cache_dir):
+    """New final weeks extend the timeline without changing earlier columns."""
+    with offline_espn({2025: {"current_week": 5}}):
+        early = rffl_mcp_server.get_standings_timeline.fn(year=2025)
+    rffl_mcp_server._SCOREBOARD_CACHE.clear()
+    with offline_espn({2025: {"current_week": 8}}):
+        later = rffl_mcp_server.get_standings_timeline.fn(year=2025)
+    assert early["weeks"] == [1, 2, 3, 4]
+    assert later["weeks"] == list(range(1, 8))
+    before = {t["team_id"]: t for t in early["teams"]}
+    for team in later["teams"]:
+        assert team["wins"][:4] == before[team["team_id"]]["wins"]
+        assert team["points_for"][:4] == before[team["team_id"]]["points_for"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
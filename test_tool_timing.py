@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the per-tool timing layer (phases, completion logs, metrics).
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+@contextmanager
+def _captured_logs():
+    """Collect the server's log records at INFO level."""
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger = rffl_mcp_server.logger
+    level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        yield records
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(level)
+
+
+def test_every_tool_is_instrumented():
+    """All registered tools go through the shared instrumentation wrapper."""
+    tools = asyncio.run(rffl_mcp_server.mcp.get_tools())
+    assert len(tools) > 20
+    for name, tool in tools.items():
+        assert getattr(tool.fn, "__wrapped__", None) is not None, name
+        assert tool.fn.__name__ == name
+
+
+def test_boxscore_phases_add_up(cache_dir):
+    """A cold box score call reports cache, ESPN, transform, and format time."""
+    with offline_espn({2024: {}}), _captured_logs() as records:
+        rffl_mcp_server.get_enhanced_boxscores.fn(week=3, league_id=FIXTURE_LEAGUE_ID, year=2024)
+    done = [r for r in records if r.getMessage() == "get_enhanced_boxscores completed"]
+    assert len(done) == 1
+    record = done[0]
+    assert set(record.phases_ms) == {"cache", "espn", "transform", "format"}, record.phases_ms
+    assert abs(sum(record.phases_ms.values()) - record.duration_ms) <= 1 + 0.05 * record.duration_ms
+    assert record.status == "success" and record.week == 3 and record.matchup_count > 0
+    assert record.league_id == FIXTURE_LEAGUE_ID and record.year == 2024
+
+    metrics = rffl_mcp_server._render_metrics()
+    for phase in ("cache", "espn", "transform", "format"):
+        assert f'rffl_tool_phase_seconds_count{{phase="{phase}",tool="get_enhanced_boxscores"}}' in metrics
+
+
+def test_nested_phases_are_exclusive_and_errors_logged():
+    """Nested phase time is not double counted; a failing call is logged with its error."""
+    def probe():
+        with rffl_mcp_server._phase("cache"):
+            time.sleep(0.02)
+            with rffl_mcp_server._phase("espn"):
+                time.sleep(0.03)
+        raise ValueError("boom")
+
+    with _captured_logs() as records:
+        try:
+            rffl_mcp_server._instrumented(probe)()
+            assert False, "error swallowed"
+        except ValueError:
+            pass
+    record = records[-1]
+    assert record.levelno == logging.WARNING
+    assert record.status == "error" and record.error == "ValueError"
+    assert 15 <= record.phases_ms["cache"] < 28, record.phases_ms
+    assert 25 <= record.phases_ms["espn"] < 45, record.phases_ms
+    # Outside a tool call, phases are a no-op
+    with rffl_mcp_server._phase("cache"):
+        pass
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Offline tests for tool-call tracing and the span exporters.
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import json
+import logging
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+@contextmanager
+def _exporter(exporter):
+    """Register an exporter for the duration of a block, flushing on exit."""
+    rffl_mcp_server.add_span_exporter(exporter)
+    try:
+        yield exporter
+    finally:
+        rffl_mcp_server._flush_spans()
+        rffl_mcp_server._SPAN_EXPORTERS.remove(exporter)
+
+
+class _Collector:
+    def __init__(self):
+        self.batches = []
+
+    def export(self, spans):
+        self.batches.append(spans)
+
+
+def test_boxscore_trace_written_as_json_lines(cache_dir):
+    """A cold box score call yields one trace with nested cache, load, ESPN, and format spans."""
+    path = os.path.join(cache_dir, "traces", "spans.jsonl")
+    with offline_espn({2024: {}}), _exporter(rffl_mcp_server.JSONLinesSpanExporter(path)):
+        rffl_mcp_server.get_enhanced_boxscores.fn(week=3, league_id=FIXTURE_LEAGUE_ID, year=2024)
+    with open(path, encoding="utf-8") as f:
+        spans = [json.loads(line) for line in f]
+
+    by_id = {s["span_id"]: s for s in spans}
+    names = {s["name"] for s in spans}
+    assert len({s["trace_id"] for s in spans}) == 1
+    assert {"get_enhanced_boxscores", "cache.league", "league.load", "espn.request",
+            "league.box_scores", "format.markdown"} <= names, names
+    root = next(s for s in spans if s["parent_id"] is None)
+    assert root["name"] == "get_enhanced_boxscores"
+    assert root["attributes"] == {"week": 3, "league_id": FIXTURE_LEAGUE_ID, "year": 2024}
+    assert all(s["parent_id"] in by_id for s in spans if s is not root)
+
+    requests = [s for s in spans if s["name"] == "espn.request"]
+    parents = {by_id[s["parent_id"]]["name"] for s in requests}
+    assert parents == {"league.load", "league.box_scores"}, parents
+    assert all("view" in s["attributes"] and "endpoint" in s["attributes"] for s in requests)
+    load = next(s for s in spans if s["name"] == "league.load")
+    assert sum(s["duration_ms"] for s in requests if s["parent_id"] == load["span_id"]) <= load["duration_ms"]
+    assert next(s for s in spans if s["name"] == "cache.league")["attributes"]["hit"] is False
+
+
+def test_one_batch_per_call_and_failed_calls_marked(cache_dir):
+    """Each tool call exports its own trace; a raising tool marks its root span as an error."""
+    with offline_espn({2024: {}}), _exporter(_Collector()) as collector:
+        rffl_mcp_server.get_standings.fn(league_id=FIXTURE_LEAGUE_ID, year=2024)
+        rffl_mcp_server.get_standings.fn(league_id=FIXTURE_LEAGUE_ID, year=2024)
+        try:
+            rffl_mcp_server.get_free_agents.fn(sort="age", league_id=FIXTURE_LEAGUE_ID, year=2024)
+        except ValueError:
+            pass
+    assert len(collector.batches) == 3
+    assert len({batch[0]["trace_id"] for batch in collector.batches}) == 3
+    warm = collector.batches[1]
+    assert [s["name"] for s in warm if s["name"] == "espn.request"] == []
+    failed_root = next(s for s in collector.batches[2] if s["parent_id"] is None)
+    assert failed_root["status"] == "error" and failed_root["attributes"]["error"] == "ValueError"
+
+
+def test_failing_exporter_does_not_break_tools(cache_dir):
+    """Exporter errors are logged on the export thread, never raised into the tool call."""
+    class Broken:
+        def export(self, spans):
+            raise OSError("disk full")
+
+    with _exporter(Broken()):
+        assert rffl_mcp_server.ping.fn() == "pong"
+    # Outside a tool call, spans are a no-op that still yields attributes
+    with rffl_mcp_server._span("orphan", a=1) as attributes:
+        assert attributes == {"a": 1}
+
+
+def test_transform_time_recorded_as_spans(cache_dir):
+    """Time outside every phase is traced as transform spans adding up to the transform phase."""
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    level = rffl_mcp_server.logger.level
+    rffl_mcp_server.logger.addHandler(handler)
+    rffl_mcp_server.logger.setLevel(logging.INFO)
+    try:
+        with offline_espn({2024: {}}), _exporter(_Collector()) as collector:
+            rffl_mcp_server.get_enhanced_boxscores.fn(week=3, league_id=FIXTURE_LEAGUE_ID, year=2024)
+    finally:
+        rffl_mcp_server.logger.removeHandler(handler)
+        rffl_mcp_server.logger.setLevel(level)
+    spans = collector.batches[0]
+    by_id = {s["span_id"]: s for s in spans}
+    transforms = [s for s in spans if s["name"] == "transform"]
+    assert len(transforms) > 1
+    assert all(s["parent_id"] in by_id for s in transforms)
+    completed = next(r for r in records if r.getMessage() == "get_enhanced_boxscores completed")
+    traced = sum(s["duration_ms"] for s in transforms)
+    assert 0 < traced <= completed.phases_ms["transform"] + 1.0
+
+
+def test_worker_thread_requests_join_the_call_trace(cache_dir):
+    """Drafts fetched on worker threads are traced under the call and charged to its espn phase."""
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    level = rffl_mcp_server.logger.level
+    rffl_mcp_server.logger.addHandler(handler)
+    rffl_mcp_server.logger.setLevel(logging.INFO)
+    try:
+        with offline_espn({2023: {}, 2024: {}}, latency_ms=20), _exporter(_Collector()) as collector:
+            rffl_mcp_server.get_draft_history.fn(start_year=2023, end_year=2024, league_id=FIXTURE_LEAGUE_ID)
+    finally:
+        rffl_mcp_server.logger.removeHandler(handler)
+        rffl_mcp_server.logger.setLevel(level)
+    spans = collector.batches[0]
+    by_id = {s["span_id"]: s for s in spans}
+    fetch = next(s for s in spans if s["name"] == "draft.fetch")
+    requests = [s for s in spans if s["name"] == "espn.request"]
+    assert len(requests) == 4
+    assert all(by_id[s["parent_id"]] is fetch for s in requests), [by_id[s["parent_id"]]["name"] for s in requests]
+    completed = next(r for r in records if r.getMessage() == "get_draft_history completed")
+    assert completed.phases_ms["espn"] >= 20
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the activity log behind get_transactions().
+
+Runs against synthetic ESPN fixtures (espn_fixtures.py), so no network access
+or ESPN credentials are needed.
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from espn_api.football import League
+
+import rffl_mcp_server
+from espn_fixtures import FIXTURE_LEAGUE_ID, offline_espn
+
+
+def _transactions(**kwargs):
+    return rffl_mcp_server.get_transactions.fn(league_id=FIXTURE_LEAGUE_ID, **kwargs)
+
+
+def _communication_calls(espn):
+    return [c for c in espn.calls if "kona_league_communication" in c]
+
+
+def test_matches_recent_activity(cache_dir):
+    """The log holds the same actions espn_api's recent_activity() reports."""
+    with offline_espn({2024: {}}):
+        result = _transactions(year=2024, limit=1000)
+        activity = League(FIXTURE_LEAGUE_ID, 2024).recent_activity(size=1000)
+    expected = [
+        (team.team_id, action.replace("TRADE_SENT", "TRADED"), player.playerId)
+        for a in activity for team, action, player, _ in a.actions if action != "TRADE_RECEIVED"
+    ]
+    got = [(t["team_id"], t["action"], t["player_id"]) for t in result["transactions"]]
+    assert sorted(got) == sorted(expected)
+    assert result["transactions"][0]["date"] >= result["transactions"][-1]["date"]
+    assert all(t["player"] for t in result["transactions"])
+
+
+def test_incremental_sync_fetches_only_new_pages(cache_dir):
+    """A later sync stops at the cursor instead of re-reading the whole feed."""
+    rffl_mcp_server.ACTIVITY_PAGE_SIZE = 5
+    added_before = rffl_mcp_server._ACTIVITY_STATS["entries_added"]
+    try:
+        with offline_espn({2025: {"current_week": 10}}) as espn:
+            first = _transactions(year=2025)
+            first_pages = len(_communication_calls(espn))
+        rffl_mcp_server._SCOREBOARD_CACHE.clear()
+        rffl_mcp_server._ACTIVITY_LOGS[(FIXTURE_LEAGUE_ID, 2025)]["synced_at"] = 0.0
+        with offline_espn({2025: {"current_week": 11}}) as espn:
+            second = _transactions(year=2025)
+            second_pages = len(_communication_calls(espn))
+    finally:
+        rffl_mcp_server.ACTIVITY_PAGE_SIZE = 50
+    assert first_pages == 5 and second_pages == 1, (first_pages, second_pages)
+    assert second["log_entries"] == first["log_entries"] + 3
+    stats = rffl_mcp_server.get_cache_stats.fn()["activity"]
+    assert stats["entries_added"] - added_before == second["log_entries"]
+
+
+def test_filters_and_frozen_seasons(cache_dir):
+    """Team, type and since filters apply locally; finished seasons are never re-synced."""
+    with offline_espn({2024: {}}):
+        trades = _transactions(year=2024, type="trade")
+        team = _transactions(year=2024, team_id="T04", type="add")
+        recent = _transactions(year=2024, since="2024-11-01")
+    rffl_mcp_server.clear_cache.fn()
+    with offline_espn({2024: {}}) as espn:
+        again = _transactions(year=2024, type="trade")
+        assert _communication_calls(espn) == [], espn.calls
+    assert trades["total_matching"] == 6 and trades == again
+    assert all(t["to_team"] for t in trades["transactions"])
+    assert team["transactions"] and all(
+        t["team_id"] == 4 and t["action"] in ("FA ADDED", "WAIVER ADDED") for t in team["transactions"]
+    )
+    assert all(t["date_utc"] >= "2024-11-01" for t in recent["transactions"])
+    assert 0 < recent["total_matching"] < trades["log_entries"]
+
+
+def test_pages_fetched_without_index_lock(cache_dir, monkeypatch):
+    """Other threads can use the index lock while activity pages are read."""
+    flatten = rffl_mcp_server._activity_rows
+    acquired = []
+
+    def probe(topic):
+        def try_lock():
+            if rffl_mcp_server._INDEX_LOCK.acquire(timeout=1):
+                rffl_mcp_server._INDEX_LOCK.release()
+                acquired.append(topic.get("id"))
+        worker = threading.Thread(target=try_lock)
+        worker.start()
+        worker.join()
+        return flatten(topic)
+
+    monkeypatch.setattr(rffl_mcp_server, "_activity_rows", probe)
+    with offline_espn({2024: {}}):
+        result = _transactions(year=2024, limit=1000)
+    log = rffl_mcp_server._ACTIVITY_LOGS[(FIXTURE_LEAGUE_ID, 2024)]
+    assert result["transactions"] and sorted(acquired) == sorted({row[0] for row in log["entries"]})
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))